@@ -0,0 +1 @@
+# Benchmarks for the ranking and matching hot paths (run from backend/)
@@ -0,0 +1,113 @@
+"""
+Benchmark: scalar platform scorers vs the NumPy batch scoring engine.
+
+Usage (from backend/):
+    python -m benchmarks.bench_batch_scoring [--candidates 10000] [--seed 42]
+
+Checks that every batch score equals the scalar score (for the
+synthetic job and for edge-case requirement lists), then reports
+timings for scoring only (columns ready), from feature records (as read
+from a feature store) and end-to-end (raw profile JSON in).
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.synthetic import make_job, make_profiles
+from services.matching.batch_scoring import (
+    build_feature_columns,
+    extract_platform_features,
+    score_batch,
+)
+from services.matching.ranking_engine import (
+    calculate_github_score,
+    calculate_leetcode_score,
+    calculate_linkedin_score,
+    calculate_overall_score,
+)
+
+
+def score_scalar(profiles, job):
+    required = job["required_skills"]
+    results = {"leetcode": [], "github": [], "linkedin": [], "overall": []}
+    for profile in profiles:
+        lc = calculate_leetcode_score(profile.get("leetcode_data", {}))
+        gh = calculate_github_score(profile.get("github_data", {}), required)
+        li = calculate_linkedin_score(profile.get("linkedin_data", {}), {"required_skills": required})
+        results["leetcode"].append(lc)
+        results["github"].append(gh)
+        results["linkedin"].append(li)
+        results["overall"].append(calculate_overall_score(lc, gh, li, job["role_type"]))
+    return results
+
+
+# Requirement lists the scorers must agree on besides the synthetic job's
+EDGE_CASE_REQUIREMENTS = ([], [""], ["", "  "], ["Python", ""])
+
+
+def _mismatches(scalar, batch):
+    return {
+        key: int(sum(1 for a, b in zip(scalar[key], batch[key].tolist()) if a != b))
+        for key in scalar
+    }
+
+
+def edge_case_mismatches(profiles, job):
+    """Summed scalar/batch mismatches over EDGE_CASE_REQUIREMENTS."""
+    totals = {}
+    records = [extract_platform_features(p) for p in profiles]
+    for required in EDGE_CASE_REQUIREMENTS:
+        edge_job = {**job, "required_skills": required}
+        batch = score_batch(build_feature_columns(records, required), job["role_type"], required)
+        for key, count in _mismatches(score_scalar(profiles, edge_job), batch).items():
+            totals[key] = totals.get(key, 0) + count
+    return totals
+
+
+def _timed(fn, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    profiles = make_profiles(args.candidates, args.seed)
+    job = make_job(random.Random(args.seed))
+    required = job["required_skills"]
+
+    scalar_time, scalar = _timed(lambda: score_scalar(profiles, job), args.repeat)
+
+    extract_time, records = _timed(lambda: [extract_platform_features(p) for p in profiles], args.repeat)
+    columns_time, columns = _timed(lambda: build_feature_columns(records, required), args.repeat)
+    batch_time, batch = _timed(lambda: score_batch(columns, job["role_type"], required), args.repeat)
+
+    mismatches = _mismatches(scalar, batch)
+    edge_mismatches = edge_case_mismatches(profiles[:1000], job)
+
+    print(f"candidates:               {args.candidates}")
+    print(f"role_type:                {job['role_type']}  required_skills: {required}")
+    print(f"mismatches vs scalar:     {mismatches}")
+    print(f"edge-case mismatches:     {edge_mismatches}")
+    print(f"scalar scorers:           {scalar_time * 1000:9.1f} ms")
+    print(f"batch (columns ready):    {batch_time * 1000:9.1f} ms   speedup x{scalar_time / batch_time:.1f}")
+    print(f"batch (records ready):    {(columns_time + batch_time) * 1000:9.1f} ms   speedup x{scalar_time / (columns_time + batch_time):.1f}")
+    print(f"batch (raw profiles):     {(extract_time + columns_time + batch_time) * 1000:9.1f} ms   "
+          f"speedup x{scalar_time / (extract_time + columns_time + batch_time):.1f}")
+
+    if any(mismatches.values()) or any(edge_mismatches.values()):
+        raise SystemExit("batch scores differ from scalar scores")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Benchmark: raw platform JSON vs profile digests in AI prompts.
+
+Usage (from backend/):
+    python -m benchmarks.bench_profile_digest [--profiles 500] [--seed 42]
+        [--base-ms 400] [--ms-per-token 0.25] [--live 0]
+
+For each prompt that embeds a student profile (profile analysis,
+eligibility check, candidate scoring), builds the prompt the way it was
+built before digests and the way it is built now, for synthetic profiles
+in the layout the scrapers store. Reports mean prompt size (characters
+and estimated tokens), the time to build a digest and an estimated model
+latency of base + tokens x per-token cost.
+
+--live N additionally sends N eligibility prompts of each kind to Gemini
+(needs GEMINI_API_KEY) and reports the median measured latency.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+from benchmarks.synthetic import make_job, make_scraped_profile
+from services.intelligence.profile_digest import (
+    build_profile_digest,
+    digest_text,
+    estimate_tokens,
+    job_digest,
+    profile_digest_text,
+)
+from services.integrations.extraction_worker import ANALYSIS_DIGEST_TOKENS
+
+ELIGIBILITY_TEMPLATE = """
+        Analyze if this student is eligible to apply for this job.
+
+        Job:
+        Title: {title}
+        Required Skills: {required}
+        Preferred Skills: {preferred}
+        Experience: {experience}
+
+        Student Profile:
+        {profile}
+
+        Return STRICT JSON with:
+        - fit_percentage (integer 0-100, be realistic)
+        - decision (APPLY if >=80%, IMPROVE if 50-79%, NOT_READY if <50%)
+        - strengths (array of objects with: category, detail, impact)
+        - skill_gaps (array of objects with: skill, importance, current_level, required_level)
+        - recommendation (string, personalized advice)
+        - action_items (array of objects with: priority, action, reason, estimated_time)
+
+        Pure JSON only.
+        """
+
+
+def analysis_prompts(profile):
+    platform_data = {"leetcode": profile["leetcode_data"], "github": profile["github_data"]}
+    legacy = json.dumps(platform_data, indent=2)
+    digest = profile_digest_text({
+        "leetcode_data": platform_data["leetcode"],
+        "github_data": platform_data["github"],
+    }, token_budget=ANALYSIS_DIGEST_TOKENS)
+    return legacy, digest
+
+
+def eligibility_prompts(profile, job):
+    fields = {
+        "title": job["title"],
+        "required": json.dumps(job["required_skills"]),
+        "preferred": json.dumps(job["preferred_skills"]),
+        "experience": job["experience_required"],
+    }
+    legacy_profile = (
+        f"Skills: {json.dumps(profile.get('extracted_skills', []))}\n"
+        f"        AI Analysis: {json.dumps(profile.get('ai_analysis', {}))}\n"
+        f"        LeetCode: {json.dumps(profile.get('leetcode_data', {}))}\n"
+        f"        GitHub: {json.dumps(profile.get('github_data', {}))}"
+    )
+    legacy = ELIGIBILITY_TEMPLATE.format(profile=legacy_profile, **fields)
+    digest = ELIGIBILITY_TEMPLATE.format(profile=profile_digest_text(profile, job), **fields)
+    return legacy, digest
+
+
+def scoring_prompts(profile, job):
+    legacy_profile = {
+        "id": profile["user_id"],
+        "leetcode": profile.get("leetcode_data", {}),
+        "github": profile.get("github_data", {}),
+        "linkedin": profile.get("linkedin_data", {}),
+        "ai_analysis": profile.get("ai_analysis", {}),
+        "skills": profile.get("extracted_skills", []),
+    }
+    legacy_job = {key: job.get(key) for key in ("id", "title", "description", "required_skills",
+                                                 "preferred_skills", "experience_required", "role_type")}
+    legacy = json.dumps(legacy_job) + json.dumps(legacy_profile)
+    digest = (digest_text({"id": job["id"], **job_digest(job)})
+              + digest_text({"id": profile["user_id"], **build_profile_digest(profile, job)}))
+    return legacy, digest
+
+
+async def measure_live(prompts, count):
+    from services.intelligence.ai_client import ai_client
+
+    latencies = []
+    for prompt in prompts[:count]:
+        start = time.perf_counter()
+        await ai_client.generate_text(prompt)
+        latencies.append(time.perf_counter() - start)
+    return statistics.median(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--base-ms", type=float, default=400, help="Fixed model latency per call")
+    parser.add_argument("--ms-per-token", type=float, default=0.25, help="Model latency per input token")
+    parser.add_argument("--live", type=int, default=0, help="Eligibility prompts of each kind to send to Gemini")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    profiles = [make_scraped_profile(rng, f"student-{i}") for i in range(args.profiles)]
+    job = make_job(rng)
+
+    start = time.perf_counter()
+    for profile in profiles:
+        build_profile_digest(profile, job)
+    digest_ms = (time.perf_counter() - start) * 1000 / len(profiles)
+
+    print(f"profiles:                 {args.profiles}")
+    print(f"digest build:             {digest_ms:9.3f} ms / profile")
+    print(f"latency model:            {args.base_ms:.0f} ms + {args.ms_per_token} ms / input token")
+    print()
+    print(f"{'prompt':<14}{'legacy chars':>14}{'digest chars':>14}{'legacy tok':>12}{'digest tok':>12}"
+          f"{'reduction':>11}{'legacy ms':>11}{'digest ms':>11}")
+
+    eligibility = []
+    for name, build in (
+        ("analysis", analysis_prompts),
+        ("eligibility", lambda p: eligibility_prompts(p, job)),
+        ("scoring", lambda p: scoring_prompts(p, job)),
+    ):
+        pairs = [build(profile) for profile in profiles]
+        if name == "eligibility":
+            eligibility = pairs
+
+        legacy_chars = statistics.mean(len(legacy) for legacy, _ in pairs)
+        digest_chars = statistics.mean(len(digest) for _, digest in pairs)
+        legacy_tokens = statistics.mean(estimate_tokens(legacy) for legacy, _ in pairs)
+        digest_tokens = statistics.mean(estimate_tokens(digest) for _, digest in pairs)
+        print(
+            f"{name:<14}{legacy_chars:>14.0f}{digest_chars:>14.0f}{legacy_tokens:>12.0f}{digest_tokens:>12.0f}"
+            f"{(1 - digest_tokens / legacy_tokens) * 100:>10.0f}%"
+            f"{args.base_ms + legacy_tokens * args.ms_per_token:>11.0f}"
+            f"{args.base_ms + digest_tokens * args.ms_per_token:>11.0f}"
+        )
+
+    if args.live:
+        legacy_ms = asyncio.run(measure_live([legacy for legacy, _ in eligibility], args.live)) * 1000
+        digest_ms = asyncio.run(measure_live([digest for _, digest in eligibility], args.live)) * 1000
+        print()
+        print(f"live eligibility median:  legacy {legacy_ms:.0f} ms   digest {digest_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Benchmark: rank_candidates end-to-end on synthetic applicant pools.
+
+Usage (from backend/):
+    python -m benchmarks.bench_ranking [--sizes 100,1000,10000,50000]
+        [--gemini-latency 0.05] [--db-latency 0] [--concurrency 8]
+        [--shortlist 200] [--min-score N] [--no-gemini] [--json]
+
+Each pool is ranked against an in-process Supabase stand-in and a fake
+Gemini scorer. Two passes are reported per size:
+- cold: first ranking, every applicant scored
+- warm: re-rank with nothing changed (stored scores reused)
+
+Reported per pass: wall-clock, DB round-trips, Gemini calls and peak
+Python heap (tracemalloc; adds overhead, disable with --no-memory).
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import time
+import tracemalloc
+
+from benchmarks.fake_gemini import FakeGemini
+from benchmarks.fake_supabase import FakeSupabase
+from benchmarks.synthetic import make_job, make_profiles
+from config.settings import settings
+from services.matching.ranking_engine import rank_candidates
+from services.matching.ranking_loader import RankingDataLoader
+
+
+def make_pool(size: int, seed: int) -> FakeSupabase:
+    """A database holding one job and `size` applicants with profiles."""
+    job = make_job(random.Random(seed))
+    profiles = make_profiles(size, seed)
+    return FakeSupabase({
+        "jobs": [job],
+        "applications": [
+            {"id": f"app-{i}", "job_id": job["id"], "student_id": profile["user_id"]}
+            for i, profile in enumerate(profiles)
+        ],
+        "student_profiles": profiles,
+        "profiles": [
+            {"user_id": profile["user_id"], "full_name": f"Student {i}", "institution": "Bench University"}
+            for i, profile in enumerate(profiles)
+        ],
+    })
+
+
+def run_pass(db: FakeSupabase, args, measure_memory: bool) -> dict:
+    job_id = db.tables["jobs"][0]["id"]
+    loader = RankingDataLoader(db)
+    db.round_trips = 0
+
+    with FakeGemini(latency=args.gemini_latency, failure_rate=args.failure_rate) as gemini:
+        if measure_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        ranked = asyncio.run(rank_candidates(
+            job_id,
+            use_gemini=not args.no_gemini,
+            gemini_api_key="benchmark",
+            loader=loader,
+            ai_concurrency=args.concurrency,
+            shortlist_size=args.shortlist,
+            shortlist_min_score=args.min_score
+        ))
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if measure_memory else None
+        if measure_memory:
+            tracemalloc.stop()
+
+    return {
+        "ranked": len(ranked),
+        "wall_s": round(elapsed, 3),
+        "db_round_trips": db.round_trips,
+        "ai_calls": gemini.calls,
+        "ai_peak_concurrency": gemini.peak_in_flight,
+        "peak_mb": round(peak / 1024 / 1024, 1) if peak is not None else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100,1000,10000,50000")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--gemini-latency", type=float, default=0.05, help="seconds per fake Gemini call")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="fraction of Gemini calls that fail")
+    parser.add_argument("--db-latency", type=float, default=0.0, help="seconds per DB round-trip")
+    parser.add_argument("--concurrency", type=int, default=settings.RANKING_AI_CONCURRENCY)
+    parser.add_argument("--shortlist", type=int, default=200, help="top-K sent to Gemini (-1 for everyone)")
+    parser.add_argument("--min-score", type=int, default=None)
+    parser.add_argument("--no-gemini", action="store_true")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc peak measurement")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per pass")
+    args = parser.parse_args()
+
+    if args.shortlist is not None and args.shortlist < 0:
+        args.shortlist = None
+
+    # Per-candidate ranking logs would dominate the output
+    logging.getLogger("sudhee-ai-intelligence").setLevel(logging.WARNING)
+
+    if not args.json:
+        print(f"gemini latency {args.gemini_latency}s  concurrency {args.concurrency}  "
+              f"shortlist {args.shortlist}  db latency {args.db_latency}s")
+        print(f"{'size':>7} {'pass':>5} {'wall s':>9} {'round-trips':>12} {'ai calls':>9} {'ai peak':>8} {'peak MB':>8}")
+
+    for size in (int(s) for s in args.sizes.split(",")):
+        db = make_pool(size, args.seed)
+        db.latency = args.db_latency
+
+        for phase in ("cold", "warm"):
+            result = {"size": size, "pass": phase, **run_pass(db, args, not args.no_memory)}
+            if args.json:
+                print(json.dumps(result))
+            else:
+                peak = f"{result['peak_mb']:8.1f}" if result["peak_mb"] is not None else f"{'-':>8}"
+                print(f"{size:>7} {phase:>5} {result['wall_s']:>9.3f} {result['db_round_trips']:>12} "
+                      f"{result['ai_calls']:>9} {result['ai_peak_concurrency']:>8} {peak}")
+
+
+if __name__ == "__main__":
+    main()
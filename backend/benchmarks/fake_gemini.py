@@ -0,0 +1,59 @@
+"""
+Fake Gemini scorer for benchmarks.
+
+Stands in for score_candidate_with_gemini with a fixed latency, a
+deterministic score per candidate and counters for calls and peak
+concurrency. Use as a context manager; the real scorer is restored on
+exit.
+"""
+
+import asyncio
+import hashlib
+
+import services.intelligence.ai_scoring as ai_scoring
+from models.schemas import CandidateScore
+
+
+class FakeGemini:
+    def __init__(self, latency: float = 0.05, failure_rate: float = 0.0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.calls = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._original = None
+
+    @staticmethod
+    def _bucket(user_id: str) -> int:
+        return int(hashlib.md5(user_id.encode()).hexdigest()[:8], 16) % 100
+
+    async def score(self, profile_data, job_data, api_key, legacy_score=0, user_id="unknown",
+                    fingerprint=None, strict=False) -> CandidateScore:
+        self.calls += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+
+        bucket = self._bucket(user_id)
+        if bucket < self.failure_rate * 100:
+            raise Exception("Simulated Gemini failure")
+
+        return CandidateScore(
+            skill_match_score=bucket,
+            project_score=100 - bucket,
+            overall_reasoning_score=bucket,
+            eligible=bucket >= 50,
+            explanation="Synthetic benchmark analysis"
+        )
+
+    def __enter__(self):
+        self._original = ai_scoring.score_candidate_with_gemini
+        ai_scoring.score_candidate_with_gemini = self.score
+        return self
+
+    def __exit__(self, *exc):
+        ai_scoring.score_candidate_with_gemini = self._original
+        return False
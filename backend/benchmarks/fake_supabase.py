@@ -0,0 +1,293 @@
+"""
+In-process Supabase stand-in for benchmarks.
+
+Implements the subset of the supabase-py query builder the ranking path
+uses (select / eq / in_ / lt / is_ / or_ / order / limit / insert / update / upsert,
+plus many-to-one embedded selects and one-to-many `table(count)`
+aggregates) over plain Python lists, and counts
+every execute() as one round-trip. Rows are returned through a JSON
+round-trip, like decoding a PostgREST response, and an optional
+per-request latency simulates the network.
+"""
+
+import json
+import operator
+import time
+from typing import Callable, Dict, List, Optional
+
+# Primary key per table, used for upserts and indexed in_() lookups
+PRIMARY_KEYS = {
+    "student_profiles": "user_id",
+    "profiles": "user_id",
+}
+
+
+def _parse_columns(spec: str):
+    """Split "a, b, table(c, d)" into (["a", "b"], [("table", ["c", "d"])])."""
+    columns, embeds, depth, token = [], [], 0, ""
+    for char in spec + ",":
+        if char == "," and depth == 0:
+            token = token.strip()
+            if "(" in token:
+                name, inner = token.split("(", 1)
+                embeds.append((name.strip(), [c.strip() for c in inner.rstrip(")").split(",")]))
+            elif token:
+                columns.append(token)
+            token = ""
+            continue
+        depth += (char == "(") - (char == ")")
+        token += char
+    return columns or ["*"], embeds
+
+
+def _split_top_level(spec: str) -> List[str]:
+    parts, depth, current = [], 0, ""
+    for ch in spec:
+        depth += ch == "("
+        depth -= ch == ")"
+        if ch == "," and depth == 0:
+            parts.append(current)
+            current = ""
+        else:
+            current += ch
+    return parts + [current] if current else parts
+
+
+def _parse_or(spec: str) -> Callable[[Dict], bool]:
+    """
+    Row predicate for a PostgREST `or` filter: comma-separated
+    `column.op.value` conditions (eq / lt / gt / is.null) and nested
+    and(...) groups. Quoted values are strings, others numbers.
+    """
+    def condition(part: str) -> Callable[[Dict], bool]:
+        if part.startswith("and("):
+            checks = [condition(p) for p in _split_top_level(part[4:-1])]
+            return lambda row: all(check(row) for check in checks)
+        column, op, value = part.split(".", 2)
+        if op == "is":
+            return lambda row: row.get(column) is None
+        value = value[1:-1] if value.startswith('"') else float(value)
+        compare = {"eq": operator.eq, "lt": operator.lt, "gt": operator.gt}[op]
+        return lambda row: row.get(column) is not None and compare(row.get(column), value)
+
+    checks = [condition(p) for p in _split_top_level(spec)]
+    return lambda row: any(check(row) for check in checks)
+
+
+def _key_value(row: Dict, key: str):
+    if "," not in key:
+        return row.get(key)
+    return tuple(row.get(column.strip()) for column in key.split(","))
+
+
+class FakeResponse:
+    def __init__(self, data: List[Dict], count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+
+class FakeQuery:
+    def __init__(self, db: "FakeSupabase", table: str):
+        self.db = db
+        self.table = table
+        self.op = "select"
+        self.columns = "*"
+        self.count = None
+        self.filters = []
+        self.index_lookup = None
+        self.ordering = []
+        self.row_limit = None
+        self.payload = None
+        self.on_conflict = None
+
+    # ── Query builder ─────────────────────────────────────────
+    def select(self, columns: str = "*", count: Optional[str] = None):
+        self.columns = columns
+        self.count = count
+        return self
+
+    def eq(self, column: str, value):
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def neq(self, column: str, value):
+        self.filters.append(lambda row: row.get(column) != value)
+        return self
+
+    def in_(self, column: str, values):
+        values = set(values)
+        if column == self.db.primary_key(self.table) and self.index_lookup is None:
+            self.index_lookup = values
+        else:
+            self.filters.append(lambda row: row.get(column) in values)
+        return self
+
+    def lt(self, column: str, value):
+        self.filters.append(lambda row: row.get(column) is not None and row.get(column) < value)
+        return self
+
+    def gt(self, column: str, value):
+        self.filters.append(lambda row: row.get(column) is not None and row.get(column) > value)
+        return self
+
+    def gte(self, column: str, value):
+        self.filters.append(lambda row: row.get(column) is not None and row.get(column) >= value)
+        return self
+
+    def or_(self, filters: str):
+        self.filters.append(_parse_or(filters))
+        return self
+
+    def is_(self, column: str, value):
+        # Only IS NULL is used
+        self.filters.append(lambda row: row.get(column) is None)
+        return self
+
+    def order(self, column: str, desc: bool = False, nullsfirst: Optional[bool] = None):
+        # PostgreSQL default: NULLs sort as larger than any value
+        nulls_last = not nullsfirst if nullsfirst is not None else not desc
+        self.ordering.append((column, desc, nulls_last))
+        return self
+
+    def limit(self, count: int):
+        self.row_limit = count
+        return self
+
+    def insert(self, payload):
+        self.op, self.payload = "insert", payload
+        return self
+
+    def update(self, payload: Dict):
+        self.op, self.payload = "update", payload
+        return self
+
+    def upsert(self, payload, on_conflict: Optional[str] = None):
+        self.op, self.payload, self.on_conflict = "upsert", payload, on_conflict
+        return self
+
+    def delete(self):
+        self.op = "delete"
+        return self
+
+    # ── Execution ─────────────────────────────────────────────
+    def _matching(self) -> List[Dict]:
+        if self.index_lookup is not None:
+            index = self.db.index(self.table)
+            rows = [index[key] for key in self.index_lookup if key in index]
+        else:
+            rows = self.db.rows(self.table)
+        return [row for row in rows if all(f(row) for f in self.filters)]
+
+    def _project(self, rows: List[Dict]) -> List[Dict]:
+        columns, embeds = _parse_columns(self.columns)
+        projected = []
+        for row in rows:
+            out = dict(row) if columns == ["*"] else {c: row.get(c) for c in columns}
+            for table, embed_columns in embeds:
+                if embed_columns == ["count"]:
+                    # One-to-many aggregate: rows of `table` pointing back at this row
+                    foreign_key = f"{self.table[:-1]}_id"
+                    out[table] = [{"count": sum(1 for other in self.db.rows(table) if other.get(foreign_key) == row.get("id"))}]
+                    continue
+                # Many-to-one embed through the <table minus "s">_id foreign key
+                target = self.db.index(table).get(row.get(f"{table[:-1]}_id"))
+                out[table] = (
+                    None if target is None
+                    else dict(target) if embed_columns == ["*"]
+                    else {c: target.get(c) for c in embed_columns}
+                )
+            projected.append(out)
+        return projected
+
+    def execute(self) -> FakeResponse:
+        self.db.round_trips += 1
+        if self.db.latency:
+            time.sleep(self.db.latency)
+
+        if self.op == "select":
+            rows = self._matching()
+            for column, desc, nulls_last in reversed(self.ordering):
+                present = sorted((row for row in rows if row.get(column) is not None),
+                                 key=lambda row: row[column], reverse=desc)
+                missing = [row for row in rows if row.get(column) is None]
+                rows = present + missing if nulls_last else missing + present
+            count = len(rows) if self.count else None
+            if self.row_limit is not None:
+                rows = rows[:self.row_limit]
+            return FakeResponse(self.db.wire(self._project(rows)), count)
+
+        if self.op == "update":
+            rows = self._matching()
+            for row in rows:
+                row.update(self.db.wire(self.payload))
+            return FakeResponse(self.db.wire(rows))
+
+        if self.op == "delete":
+            doomed = set(map(id, self._matching()))
+            kept = [row for row in self.db.rows(self.table) if id(row) not in doomed]
+            deleted = [row for row in self.db.rows(self.table) if id(row) in doomed]
+            self.db.tables[self.table] = kept
+            return FakeResponse(self.db.wire(deleted))
+
+        payload = self.payload if isinstance(self.payload, list) else [self.payload]
+        written = [self.db.write(self.table, row, upsert=self.op == "upsert", key=self.on_conflict) for row in payload]
+        return FakeResponse(self.db.wire(written))
+
+
+class FakeSupabase:
+    """
+    Minimal supabase.Client replacement.
+
+    Args:
+        tables: Initial rows per table
+        latency: Seconds added to every round-trip
+    """
+
+    def __init__(self, tables: Optional[Dict[str, List[Dict]]] = None, latency: float = 0.0):
+        self.tables = {name: list(rows) for name, rows in (tables or {}).items()}
+        self.latency = latency
+        self.round_trips = 0
+        self._indexes = {}
+        self._next_id = 0
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def primary_key(self, table: str) -> str:
+        return PRIMARY_KEYS.get(table, "id")
+
+    def rows(self, table: str) -> List[Dict]:
+        return self.tables.setdefault(table, [])
+
+    def index(self, table: str, key: Optional[str] = None) -> Dict:
+        """Rows by key value; `key` may be composite ("a,b" keys by tuple)."""
+        key = key or self.primary_key(table)
+        rows = self.rows(table)
+        cached = self._indexes.get((table, key))
+        if cached is None or cached[0] is not rows or cached[1] != len(rows):
+            cached = [rows, len(rows), {_key_value(row, key): row for row in rows}]
+            self._indexes[(table, key)] = cached
+        return cached[2]
+
+    def write(self, table: str, row: Dict, upsert: bool, key: Optional[str]) -> Dict:
+        row = self.wire(row)
+        key = key or self.primary_key(table)
+        existing = self.index(table, key).get(_key_value(row, key)) if upsert else None
+        if existing is not None:
+            existing.update(row)
+            return existing
+        if key == "id":
+            self._next_id += 1
+            row.setdefault("id", f"{table}-{self._next_id}")
+        self.rows(table).append(row)
+        # Keep cached indexes current instead of rebuilding them on the next write
+        for (name, index_key), cached in self._indexes.items():
+            if name == table and cached[0] is self.rows(table) and cached[1] == len(cached[0]) - 1:
+                cached[1] += 1
+                cached[2].setdefault(_key_value(row, index_key), row)
+        return row
+
+    @staticmethod
+    def wire(data):
+        """Copy through JSON, as a PostgREST response would be decoded."""
+        return json.loads(json.dumps(data, default=str))
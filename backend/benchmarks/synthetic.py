@@ -0,0 +1,155 @@
+"""
+Synthetic data for benchmarks - applicant profiles shaped like the rows
+the extraction worker writes to student_profiles.
+"""
+
+import random
+from typing import Dict, List
+
+SKILLS = [
+    "Python", "JavaScript", "TypeScript", "Java", "Go", "Rust", "C++", "SQL",
+    "React", "Node.js", "Django", "FastAPI", "Flask", "Docker", "Kubernetes",
+    "AWS", "GCP", "PostgreSQL", "MongoDB", "Redis", "TensorFlow", "PyTorch",
+    "Machine Learning", "GraphQL", "Git", "Linux", "Terraform", "Kafka",
+]
+
+LANGUAGES = ["Python", "JavaScript", "TypeScript", "Java", "Go", "Rust", "C++", "HTML", "CSS", "Shell"]
+TOPICS = ["react", "fastapi", "docker", "machine-learning", "api", "cli", "web", "kubernetes", "aws", "sql"]
+ROLE_TYPES = ["SDE", "Backend Engineer", "Frontend Developer", "Full-Stack Developer", "AI Engineer", "Data Scientist", "DevOps Engineer"]
+
+
+def make_profile(rng: random.Random, user_id: str) -> Dict:
+    """One student_profiles row with realistic-looking platform JSON."""
+    total = rng.randint(0, 600)
+    medium = rng.randint(0, total)
+    hard = rng.randint(0, total - medium)
+
+    repos = [
+        {
+            "name": f"repo-{i}",
+            "languages": [{"name": lang} for lang in rng.sample(LANGUAGES, rng.randint(0, 3))],
+            "topics": rng.sample(TOPICS, rng.randint(0, 3)),
+            "stars": rng.randint(0, 50),
+        }
+        for i in range(rng.randint(0, 25))
+    ]
+
+    profile = {
+        "user_id": user_id,
+        "leetcode_data": {
+            "problems_solved": {"total": total, "easy": total - medium - hard, "medium": medium, "hard": hard},
+            "contest_rating": rng.choice([0, rng.randint(1200, 2600)]),
+        } if rng.random() > 0.1 else {},
+        "github_data": {
+            "public_repos": len(repos),
+            "statistics": {
+                "total_stars": sum(r["stars"] for r in repos),
+                "recent_activity": {"commits_last_30_days": rng.randint(0, 120)},
+                "active_repos": rng.randint(0, len(repos)),
+                "top_languages": rng.sample(LANGUAGES, rng.randint(0, 6)),
+            },
+            "repositories": repos,
+        } if rng.random() > 0.1 else {},
+        "linkedin_data": {
+            "skills": rng.sample(SKILLS, rng.randint(0, 10)),
+            "experience": [{"title": "Intern"}] * rng.randint(0, 4),
+            "certifications": [{"name": "Cert"}] * rng.randint(0, 5),
+            "headline": rng.choice(["", "Aspiring engineer"]),
+            "education": rng.choice([[], [{"school": "University"}]]),
+        } if rng.random() > 0.2 else {},
+        "ai_analysis": {"skill_level": rng.choice(["Beginner", "Intermediate", "Advanced"])},
+        "extracted_skills": rng.sample(SKILLS, rng.randint(0, 12)),
+        "leetcode_url": f"https://leetcode.com/u/{user_id}",
+        "github_url": f"https://github.com/{user_id}",
+        "linkedin_url": None,
+    }
+    return profile
+
+
+def make_job(rng: random.Random, job_id: str = "job-bench") -> Dict:
+    """One jobs row with random requirements."""
+    return {
+        "id": job_id,
+        "recruiter_id": "recruiter-bench",
+        "title": "Software Engineer",
+        "description": "Synthetic benchmark job",
+        "company_name": "Bench Corp",
+        "required_skills": rng.sample(SKILLS, rng.randint(3, 8)),
+        "preferred_skills": rng.sample(SKILLS, rng.randint(0, 4)),
+        "experience_required": "0-2 years",
+        "role_type": rng.choice(ROLE_TYPES),
+        "status": "active",
+    }
+
+
+def make_profiles(count: int, seed: int = 42) -> List[Dict]:
+    rng = random.Random(seed)
+    return [make_profile(rng, f"student-{i}") for i in range(count)]
+
+
+REPO_WORDS = ["api", "dashboard", "bot", "tracker", "compiler", "scraper", "portfolio", "chat", "game", "pipeline"]
+
+
+def make_scraped_profile(rng: random.Random, user_id: str) -> Dict:
+    """
+    One student_profiles row in the layout the platform scrapers store
+    (profile_data / activity_metrics), with 20 described repositories
+    and a full ai_analysis - the payload AI prompts used to embed.
+    """
+    total = rng.randint(0, 600)
+    medium = rng.randint(0, total)
+    hard = rng.randint(0, total - medium)
+    repos = [
+        {
+            "name": f"{rng.choice(REPO_WORDS)}-{rng.choice(REPO_WORDS)}-{i}",
+            "description": " ".join(rng.choice(REPO_WORDS + SKILLS) for _ in range(rng.randint(6, 20))),
+            "language": rng.choice(LANGUAGES),
+            "stars": rng.randint(0, 50),
+            "forks": rng.randint(0, 10),
+            "updated_at": f"2026-{rng.randint(1, 9):02d}-{rng.randint(1, 28):02d}T00:00:00Z",
+        }
+        for i in range(20)
+    ]
+    skills = rng.sample(SKILLS, rng.randint(4, 12))
+
+    return {
+        "user_id": user_id,
+        "leetcode_data": {
+            "platform": "leetcode",
+            "username": user_id,
+            "profile_data": {"ranking": rng.randint(1000, 500000), "contest_rating": rng.choice([None, rng.randint(1200, 2600)]),
+                             "total_solved": total, "profile_url": f"https://leetcode.com/u/{user_id}", "badges": []},
+            "activity_metrics": {"easy_solved": total - medium - hard, "medium_solved": medium, "hard_solved": hard,
+                                 "recent_activity": "Solves problems most weeks", "skills": rng.sample(SKILLS, 3),
+                                 "gemini_analysis": "Consistent problem solver with a focus on medium problems."},
+            "last_updated": "2026-10-01T00:00:00",
+            "scraper_version": "1.0",
+        },
+        "github_data": {
+            "platform": "github",
+            "username": user_id,
+            "profile_data": {"name": "Student", "bio": "Building things", "company": None, "location": "Earth",
+                             "repos_count": len(repos), "followers": rng.randint(0, 200), "account_age_days": rng.randint(30, 2000)},
+            "activity_metrics": {"total_stars": sum(r["stars"] for r in repos), "total_forks": sum(r["forks"] for r in repos),
+                                 "languages_used": sorted({r["language"] for r in repos}), "recent_activity_30d": rng.randint(0, 10),
+                                 "has_tests": rng.random() > 0.5, "has_ci_cd": rng.random() > 0.7, "top_repositories": repos},
+            "last_updated": "2026-10-01T00:00:00",
+            "scraper_version": "1.0",
+        },
+        "linkedin_data": {},
+        "ai_analysis": {
+            "overall_assessment": "A motivated student developer with a growing portfolio of web and data projects "
+                                  "and steady problem-solving practice.",
+            "technical_skills": skills,
+            "project_highlights": [f"Built {r['name']}" for r in repos[:4]],
+            "strengths": ["Consistent commit history", "Broad language exposure", "Solid algorithm practice"],
+            "areas_for_improvement": ["System design", "Testing discipline"],
+            "suitable_roles": ["Backend Engineer", "Full-Stack Developer"],
+            "skill_level": rng.choice(["Beginner", "Intermediate", "Advanced"]),
+            "coding_proficiency": rng.choice(["Beginner", "Intermediate", "Advanced"]),
+            "recommendation": "Focus on one deep project that uses the target stack end to end, add tests and CI, "
+                              "and keep practicing medium problems weekly.",
+            "confidence_score": rng.randint(50, 95),
+        },
+        "extracted_skills": skills,
+    }
@@ -16,6 +16,40 @@ class Settings(BaseSettings):
     
     # AI Settings
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
+    AI_CLIENT_MAX_WORKERS: int = int(os.getenv("AI_CLIENT_MAX_WORKERS", 16))  # Threads for blocking Gemini SDK calls
+    
+    # Ranking Settings
+    RANKING_AI_CONCURRENCY: int = int(os.getenv("RANKING_AI_CONCURRENCY", 8))
+    RANKING_AI_TIMEOUT_SECONDS: float = float(os.getenv("RANKING_AI_TIMEOUT_SECONDS", 30))
+    RANKING_CHECKPOINT_EVERY: int = int(os.getenv("RANKING_CHECKPOINT_EVERY", 25))
+    RANKING_RUN_LEASE_SECONDS: int = int(os.getenv("RANKING_RUN_LEASE_SECONDS", 90))
+    RANKING_RUN_HEARTBEAT_SECONDS: float = float(os.getenv("RANKING_RUN_HEARTBEAT_SECONDS", 20))  # Well under the lease
+    RANKING_RUN_SWEEP_SECONDS: float = float(os.getenv("RANKING_RUN_SWEEP_SECONDS", 60))  # How often to look for orphaned runs
+    
+    # Roadmap Settings
+    ROADMAP_TEMPLATE_TTL_DAYS: int = int(os.getenv("ROADMAP_TEMPLATE_TTL_DAYS", 30))
+    
+    # Profile Extraction Settings
+    EXTRACTION_QUEUE_PATH: str = os.getenv("EXTRACTION_QUEUE_PATH", "extraction_queue.db")  # SQLite job store
+    EXTRACTION_WORKERS: int = int(os.getenv("EXTRACTION_WORKERS", 2))  # Worker processes started with the API
+    EXTRACTION_WORKER_CONCURRENCY: int = int(os.getenv("EXTRACTION_WORKER_CONCURRENCY", 4))  # Jobs per worker
+    EXTRACTION_POLL_SECONDS: float = float(os.getenv("EXTRACTION_POLL_SECONDS", 1))
+    EXTRACTION_LEASE_SECONDS: int = int(os.getenv("EXTRACTION_LEASE_SECONDS", 300))
+    EXTRACTION_MAX_ATTEMPTS: int = int(os.getenv("EXTRACTION_MAX_ATTEMPTS", 3))
+    
+    # Profile Refresh Settings
+    PROFILE_REFRESH_MAX_AGE_HOURS: float = float(os.getenv("PROFILE_REFRESH_MAX_AGE_HOURS", 24))
+    PROFILE_REFRESH_INTERVAL_SECONDS: int = int(os.getenv("PROFILE_REFRESH_INTERVAL_SECONDS", 3600))
+    PROFILE_REFRESH_PAGE_SIZE: int = int(os.getenv("PROFILE_REFRESH_PAGE_SIZE", 100))
+    PROFILE_REFRESH_WRITE_BATCH: int = int(os.getenv("PROFILE_REFRESH_WRITE_BATCH", 50))
+    PROFILE_REFRESH_GITHUB_CONCURRENCY: int = int(os.getenv("PROFILE_REFRESH_GITHUB_CONCURRENCY", 4))
+    PROFILE_REFRESH_GITHUB_PER_MINUTE: float = float(os.getenv("PROFILE_REFRESH_GITHUB_PER_MINUTE", 60))  # 5000/hour with a token
+    PROFILE_REFRESH_LEETCODE_CONCURRENCY: int = int(os.getenv("PROFILE_REFRESH_LEETCODE_CONCURRENCY", 2))
+    PROFILE_REFRESH_LEETCODE_PER_MINUTE: float = float(os.getenv("PROFILE_REFRESH_LEETCODE_PER_MINUTE", 20))  # Each scrape is a Gemini call
+    
+    # Job Matching Settings
+    JOB_INDEX_SYNC_SECONDS: int = int(os.getenv("JOB_INDEX_SYNC_SECONDS", 30))
+    JOB_INDEX_REBUILD_SECONDS: int = int(os.getenv("JOB_INDEX_REBUILD_SECONDS", 3600))
     
     # CORS Settings - Parse from environment variable (comma-separated)
     @property
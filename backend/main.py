@@ -1,4 +1,5 @@
 import os
+import asyncio
 import time
 import logging
 import json_logging
@@ -65,6 +66,28 @@ app.include_router(intelligence.router)
 app.include_router(students.router)
 app.include_router(recruiter.router)
 
+@app.on_event("startup")
+async def resume_background_work():
+    """Resume ranking runs interrupted by a restart or deploy (and keep sweeping for orphaned ones); start job match sync and extraction workers."""
+    from services.matching.ranking_runs import resume_ranking_runs, run_ranking_run_sweep
+    from services.matching.job_matches import run_job_match_sync
+    from services.integrations.extraction_worker import start_extraction_workers
+    try:
+        resume_ranking_runs()
+    except Exception as e:
+        logger.error(f"Failed to resume ranking runs: {str(e)}")
+    asyncio.create_task(run_ranking_run_sweep())
+    asyncio.create_task(run_job_match_sync())
+    start_extraction_workers()
+
+@app.on_event("shutdown")
+async def stop_background_work():
+    """Stop extraction workers (they requeue in-flight jobs); release the shared Gemini thread pool."""
+    from services.integrations.extraction_worker import stop_extraction_workers
+    from services.intelligence.ai_client import ai_client
+    stop_extraction_workers()
+    ai_client.shutdown()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
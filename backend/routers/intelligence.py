@@ -12,6 +12,7 @@ from services.intelligence.velocity_engine import analyze_multi_skill_velocity
 from services.intelligence.dna_engine import analyze_coding_dna
 from services.intelligence.trajectory_engine import predict_talent_trajectory
 from services.intelligence.feature_flags import feature_flags
+from services.intelligence.profile_digest import build_profile_digest, job_digest
 from models.schemas import (
     ScoreRequest, RejectionRequest, CandidateScore, RejectionFeedback,
     DNAAnalysisRequest, DNAAnalysisResponse, TrajectoryRequest, TrajectoryResponse,
@@ -35,8 +36,8 @@ async def score_candidate(request: Request, payload: ScoreRequest):
         return _get_fallback_score(0, "AI Service Unavailable")
 
     ai_result = await score_candidate_with_gemini(
-        profile_data=payload.profile_data,
-        job_data=payload.job_data,
+        profile_data={"id": payload.candidate_id, **build_profile_digest(payload.profile_data, payload.job_data)},
+        job_data={"id": payload.job_id, **job_digest(payload.job_data)},
         api_key=api_key,
         legacy_score=payload.profile_data.get("legacy_score", 0)
     )
@@ -88,9 +89,10 @@ async def score_candidate(request: Request, payload: ScoreRequest):
 @limiter.limit("10/minute")
 async def generate_rejection(request: Request, payload: RejectionRequest):
     """Generate AI-powered rejection feedback."""
+    job_data = payload.reason_json.get("job_data", {})
     result = await generate_ai_rejection(
-        student_profile=payload.reason_json.get("profile_data", {}),
-        job_data=payload.reason_json.get("job_data", {}),
+        student_profile=build_profile_digest(payload.reason_json.get("profile_data", {}), job_data),
+        job_data=job_digest(job_data),
         api_key=settings.GEMINI_API_KEY
     )
     
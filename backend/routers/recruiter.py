@@ -1,11 +1,14 @@
+import json
 import logging
 from typing import List, Optional
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Request, Depends
+from fastapi import APIRouter, HTTPException, Request, Depends, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from pydantic import BaseModel, Field
 from utils.supabase import supabase
+from utils.pagination import DEFAULT_PAGE_SIZE, clamp_limit, decode_cursor, encode_cursor
 from services.intelligence.ai_orchestrator import AIOrchestrator
 from config.settings import settings
 
@@ -13,6 +16,9 @@ router = APIRouter(prefix="/recruiter", tags=["recruiter"])
 limiter = Limiter(key_func=get_remote_address)
 logger = logging.getLogger("sudhee-ai-intelligence")
 
+# Applicant listing sorts: column -> descending (ties broken by id in the same direction)
+APPLICANT_SORTS = {"created_at": True, "match_score": True, "rank": False}
+
 # Pydantic Models
 class JobCreate(BaseModel):
     title: str = Field(..., min_length=1)
@@ -41,6 +47,12 @@ class JobResponse(BaseModel):
     created_at: str
     applications_count: int = 0
 
+class RankingWeightsRequest(BaseModel):
+    leetcode: Optional[float] = Field(default=None, ge=0)
+    github: Optional[float] = Field(default=None, ge=0)
+    linkedin: Optional[float] = Field(default=None, ge=0)
+    algorithmic_weight: float = Field(default=0.6, ge=0, le=1)
+
 class ExtractSkillsRequest(BaseModel):
     description: str
 
@@ -50,7 +62,7 @@ class ExtractSkillsResponse(BaseModel):
 
 @router.post("/jobs", response_model=JobResponse)
 @limiter.limit("10/minute")
-async def create_job(request: Request, job: JobCreate, recruiter_id: str = None):
+async def create_job(request: Request, background_tasks: BackgroundTasks, job: JobCreate, recruiter_id: str = None):
     """
     Create a new job posting.
     
@@ -88,6 +100,13 @@ async def create_job(request: Request, job: JobCreate, recruiter_id: str = None)
         
         created_job = response.data[0]
         
+        # Make the posting visible to student matching without waiting for the next sync
+        from services.matching.job_index import job_index
+        from services.matching.job_matches import materialize_job_matches
+        entry = job_index.add_job(created_job)
+        if entry:
+            background_tasks.add_task(materialize_job_matches, entry)
+        
         logger.info(f"Job created: {created_job['id']} by recruiter {recruiter_id}")
         
         return JobResponse(
@@ -119,17 +138,21 @@ async def get_recruiter_jobs(request: Request, recruiter_id: str):
         raise HTTPException(status_code=500, detail="Database not connected")
     
     try:
-        # Fetch jobs
-        jobs_response = supabase.table("jobs").select("*").eq("recruiter_id", recruiter_id).order("created_at", desc=True).execute()
+        # Fetch jobs with their application counts (aggregated in the same query)
+        jobs_response = (
+            supabase.table("jobs")
+            .select("*, applications(count)")
+            .eq("recruiter_id", recruiter_id)
+            .order("created_at", desc=True)
+            .execute()
+        )
         
         if not jobs_response.data:
             return []
         
         jobs = []
         for job in jobs_response.data:
-            # Count applications for this job
-            app_count_response = supabase.table("applications").select("id", count="exact").eq("job_id", job["id"]).execute()
-            app_count = app_count_response.count if app_count_response.count is not None else 0
+            app_count = job["applications"][0]["count"] if job.get("applications") else 0
             
             jobs.append(JobResponse(
                 id=job["id"],
@@ -171,48 +194,114 @@ async def get_job_details(request: Request, job_id: str, recruiter_id: str):
         logger.error(f"Error fetching job details: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def _applicant_keyset(column: str, desc: bool, value, app_id: str) -> str:
+    """
+    PostgREST `or` filter for applications sorting after (value, app_id)
+    in (column, id) order with NULLs last.
+    """
+    past = "lt" if desc else "gt"
+    if value is None:
+        return f'and({column}.is.null,id.{past}."{app_id}")'
+    if isinstance(value, str):
+        value = f'"{value}"'
+    return f'{column}.{past}.{value},and({column}.eq.{value},id.{past}."{app_id}"),{column}.is.null'
+
 @router.get("/jobs/{job_id}/applications")
 @limiter.limit("30/minute")
-async def get_job_applications(request: Request, job_id: str, recruiter_id: str):
+async def get_job_applications(
+    request: Request,
+    job_id: str,
+    recruiter_id: str,
+    sort: str = "created_at",
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None
+):
     """
-    Get all applications for a specific job.
+    Get applications for a specific job, `limit` at a time.
     
-    Returns basic applicant information before AI ranking.
+    `sort` is `created_at` (newest first, default), `match_score`
+    (highest first) or `rank` (best first); unscored / unranked
+    applicants come last. Pass `next_cursor` back as `cursor` for the
+    next page. `total_count` always covers every application.
     """
     if not supabase:
         raise HTTPException(status_code=500, detail="Database not connected")
     
     try:
-        # Verify job ownership
-        job_response = supabase.table("jobs").select("id, title").eq("id", job_id).eq("recruiter_id", recruiter_id).execute()
+        if sort not in APPLICANT_SORTS:
+            raise HTTPException(status_code=400, detail=f"sort must be one of: {', '.join(APPLICANT_SORTS)}")
+        desc = APPLICANT_SORTS[sort]
+        limit = clamp_limit(limit)
+        try:
+            after = decode_cursor(cursor, 3)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        # Verify job ownership; the application count comes back with it
+        job_response = (
+            supabase.table("jobs")
+            .select("id, title, applications(count)")
+            .eq("id", job_id)
+            .eq("recruiter_id", recruiter_id)
+            .execute()
+        )
         
         if not job_response.data:
             raise HTTPException(status_code=404, detail="Job not found or access denied")
         
         job = job_response.data[0]
+        counts = job.pop("applications", None)
+        total_count = counts[0]["count"] if counts else 0
         
-        # Fetch applications with student profile info
-        applications_response = supabase.table("applications").select(
+        # One page of applications (+1 to detect more), keyset on (sort column, id)
+        query = supabase.table("applications").select(
             "id, student_id, status, created_at, match_score, rank"
-        ).eq("job_id", job_id).order("created_at", desc=True).execute()
-        
-        if not applications_response.data:
+        ).eq("job_id", job_id)
+        if after:
+            cursor_sort, value, app_id = after
+            valid_value = (
+                isinstance(value, str) and '"' not in value if sort == "created_at"
+                else value is None or (isinstance(value, (int, float)) and not isinstance(value, bool))
+            )
+            if cursor_sort != sort or not valid_value or not isinstance(app_id, str) or '"' in app_id:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            query = query.or_(_applicant_keyset(sort, desc, value, app_id))
+        page = (
+            query.order(sort, desc=desc, nullsfirst=False)
+            .order("id", desc=desc)
+            .limit(limit + 1)
+            .execute()
+        ).data or []
+        
+        next_cursor = None
+        if len(page) > limit:
+            page = page[:limit]
+            next_cursor = encode_cursor([sort, page[-1][sort], page[-1]["id"]])
+        
+        if not page:
             return {
                 "job": job,
                 "applications": [],
-                "total_count": 0
+                "total_count": total_count,
+                "next_cursor": None
             }
         
-        # Enrich with student data
+        # Student names and profile links for the whole page (two batched queries)
+        student_ids = list({app["student_id"] for app in page})
+        students_response = supabase.table("profiles").select(
+            "user_id, full_name, institution, email"
+        ).in_("user_id", student_ids).execute()
+        links_response = supabase.table("student_profiles").select(
+            "user_id, leetcode_url, github_url, linkedin_url"
+        ).in_("user_id", student_ids).execute()
+        
+        students = {row["user_id"]: row for row in students_response.data or []}
+        links = {row["user_id"]: row for row in links_response.data or []}
+        
         applications = []
-        for app in applications_response.data:
-            # Fetch student profile
-            student_response = supabase.table("profiles").select("full_name, institution, email").eq("user_id", app["student_id"]).execute()
-            
-            student_profile_response = supabase.table("student_profiles").select("leetcode_url, github_url, linkedin_url").eq("user_id", app["student_id"]).execute()
-            
-            student_info = student_response.data[0] if student_response.data else {}
-            profile_links = student_profile_response.data[0] if student_profile_response.data else {}
+        for app in page:
+            student_info = students.get(app["student_id"], {})
+            profile_links = links.get(app["student_id"], {})
             
             applications.append({
                 "application_id": app["id"],
@@ -234,7 +323,8 @@ async def get_job_applications(request: Request, job_id: str, recruiter_id: str)
         return {
             "job": job,
             "applications": applications,
-            "total_count": len(applications)
+            "total_count": total_count,
+            "next_cursor": next_cursor
         }
     
     except HTTPException:
@@ -245,7 +335,14 @@ async def get_job_applications(request: Request, job_id: str, recruiter_id: str)
 
 @router.post("/jobs/{job_id}/rank")
 @limiter.limit("5/minute")
-async def rank_job_candidates(request: Request, job_id: str, recruiter_id: str):
+async def rank_job_candidates(
+    request: Request,
+    job_id: str,
+    recruiter_id: str,
+    shortlist_size: Optional[int] = None,
+    min_score: Optional[int] = None,
+    force: bool = False
+):
     """
     **CORE FEATURE: AI-Powered Candidate Ranking**
     
@@ -254,6 +351,13 @@ async def rank_job_candidates(request: Request, job_id: str, recruiter_id: str):
     - Gemini AI analysis
     - Score blending (60% algorithmic + 40% AI)
     
+    Two-stage mode: pass `shortlist_size` (top-K) and/or `min_score`
+    (minimum algorithmic score) to send only that shortlist to Gemini.
+    Everyone else keeps an algorithmic-only score.
+    
+    Re-ranking only rescores applicants whose profile or the job changed
+    since their last analysis; pass `force=true` to rescore everyone.
+    
     Returns ranked candidate list sorted by final score.
     """
     if not supabase:
@@ -275,7 +379,10 @@ async def rank_job_candidates(request: Request, job_id: str, recruiter_id: str):
         ranked_list = await rank_candidates(
             job_id=job_id,
             use_gemini=True,
-            gemini_api_key=settings.GEMINI_API_KEY
+            gemini_api_key=settings.GEMINI_API_KEY,
+            shortlist_size=shortlist_size,
+            shortlist_min_score=min_score,
+            force_rescore=force
         )
         
         logger.info(f"Ranking completed for job {job_id}: {len(ranked_list)} candidates ranked")
@@ -285,6 +392,7 @@ async def rank_job_candidates(request: Request, job_id: str, recruiter_id: str):
             "job_id": job_id,
             "job_title": job_response.data[0]["title"],
             "total_candidates": len(ranked_list),
+            "ai_scored_candidates": sum(1 for c in ranked_list if c["scoring_mode"] == "blended"),
             "ranked_candidates": ranked_list
         }
     
@@ -294,6 +402,208 @@ async def rank_job_candidates(request: Request, job_id: str, recruiter_id: str):
         logger.error(f"Ranking failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Ranking failed: {str(e)}")
 
+@router.post("/jobs/{job_id}/rank/stream")
+@limiter.limit("5/minute")
+async def stream_rank_job_candidates(
+    request: Request,
+    job_id: str,
+    recruiter_id: str,
+    shortlist_size: Optional[int] = None,
+    min_score: Optional[int] = None,
+    force: bool = False
+):
+    """
+    Streaming variant of candidate ranking (NDJSON, one event per line).
+    
+    Events:
+    - provisional: algorithmic order, sent before any Gemini call
+    - candidate: one refined entry per Gemini result as it arrives
+    - final: settled order after blending and persistence
+    - error: ranking aborted; carries `detail`
+    """
+    if not supabase:
+        raise HTTPException(status_code=500, detail="Database not connected")
+    
+    # Verify job ownership
+    job_response = supabase.table("jobs").select("id, title").eq("id", job_id).eq("recruiter_id", recruiter_id).execute()
+    
+    if not job_response.data:
+        raise HTTPException(status_code=404, detail="Job not found or access denied")
+    
+    job_title = job_response.data[0]["title"]
+    
+    from services.matching.ranking_engine import iter_rank_events
+    
+    async def event_stream():
+        logger.info(f"Starting streamed AI ranking for job {job_id}")
+        try:
+            async for event in iter_rank_events(
+                job_id=job_id,
+                use_gemini=True,
+                gemini_api_key=settings.GEMINI_API_KEY,
+                shortlist_size=shortlist_size,
+                shortlist_min_score=min_score,
+                force_rescore=force
+            ):
+                if event["event"] in ("provisional", "final"):
+                    event["job_title"] = job_title
+                yield json.dumps(event) + "\n"
+        except Exception as e:
+            logger.error(f"Streamed ranking failed: {str(e)}")
+            yield json.dumps({"event": "error", "detail": f"Ranking failed: {str(e)}"}) + "\n"
+    
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+@router.post("/jobs/{job_id}/rank/preview")
+@limiter.limit("120/minute")
+async def preview_ranking_weights(request: Request, job_id: str, recruiter_id: str, weights: RankingWeightsRequest):
+    """
+    What-if re-ranking under different weights.
+    
+    Re-sorts the job's already-ranked applicants from their stored
+    platform and Gemini scores; nothing is rescored or persisted. Platform
+    weights not given default to the job type's weights and are
+    normalized to sum to 1. `algorithmic_weight` sets the
+    algorithmic/Gemini blend (default 0.6, i.e. 60/40).
+    """
+    if not supabase:
+        raise HTTPException(status_code=500, detail="Database not connected")
+    
+    try:
+        # Verify job ownership
+        job_response = supabase.table("jobs").select("id, title, role_type").eq("id", job_id).eq("recruiter_id", recruiter_id).execute()
+        
+        if not job_response.data:
+            raise HTTPException(status_code=404, detail="Job not found or access denied")
+        
+        job = job_response.data[0]
+        
+        from services.matching.ranking_engine import JOB_TYPE_WEIGHTS, reweight_rankings
+        from services.matching.ranking_loader import RankingDataLoader
+        
+        defaults = JOB_TYPE_WEIGHTS.get(job.get("role_type") or "SDE", JOB_TYPE_WEIGHTS["SDE"])
+        platform_weights = {
+            platform: getattr(weights, platform) if getattr(weights, platform) is not None else default
+            for platform, default in defaults.items()
+        }
+        total_weight = sum(platform_weights.values())
+        if total_weight <= 0:
+            raise HTTPException(status_code=400, detail="At least one platform weight must be positive")
+        platform_weights = {platform: value / total_weight for platform, value in platform_weights.items()}
+        
+        loader = RankingDataLoader()
+        applications = loader.load_applications(job_id)
+        ranked = reweight_rankings(applications, platform_weights, weights.algorithmic_weight)
+        users = loader.load_users([c["student_id"] for c in ranked])
+        
+        for candidate in ranked:
+            user_info = users.get(candidate["student_id"], {})
+            candidate["student_name"] = user_info.get("full_name", "Unknown")
+            candidate["institution"] = user_info.get("institution", "N/A")
+        
+        return {
+            "job_id": job_id,
+            "job_title": job["title"],
+            "weights": {**platform_weights, "algorithmic_weight": weights.algorithmic_weight},
+            "total_candidates": len(ranked),
+            "unranked_candidates": len(applications) - len(ranked),
+            "ranked_candidates": ranked
+        }
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Ranking preview failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/jobs/{job_id}/rank/runs")
+@limiter.limit("5/minute")
+async def submit_ranking_run(
+    request: Request,
+    job_id: str,
+    recruiter_id: str,
+    shortlist_size: Optional[int] = None,
+    min_score: Optional[int] = None,
+    force: bool = False
+):
+    """
+    Submit candidate ranking as a background run.
+    
+    Returns a run id immediately; poll the run endpoint for progress.
+    Runs checkpoint Gemini results as they go and resume after restarts.
+    """
+    if not supabase:
+        raise HTTPException(status_code=500, detail="Database not connected")
+    
+    try:
+        # Verify job ownership
+        job_response = supabase.table("jobs").select("id").eq("id", job_id).eq("recruiter_id", recruiter_id).execute()
+        
+        if not job_response.data:
+            raise HTTPException(status_code=404, detail="Job not found or access denied")
+        
+        from services.matching.ranking_runs import create_ranking_run, schedule_ranking_run
+        
+        run = create_ranking_run(job_id, recruiter_id, {
+            "shortlist_size": shortlist_size,
+            "min_score": min_score,
+            "force": force
+        })
+        schedule_ranking_run(run)
+        
+        logger.info(f"Ranking run {run['id']} submitted for job {job_id}")
+        
+        return {
+            "run_id": run["id"],
+            "job_id": job_id,
+            "status": "queued"
+        }
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Ranking run submission failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/jobs/{job_id}/rank/runs/{run_id}")
+@limiter.limit("60/minute")
+async def get_ranking_run_progress(request: Request, job_id: str, run_id: str, recruiter_id: str):
+    """Progress of a background ranking run (scored / total / failed)."""
+    if not supabase:
+        raise HTTPException(status_code=500, detail="Database not connected")
+    
+    try:
+        from services.matching.ranking_runs import get_ranking_run
+        
+        run = get_ranking_run(run_id)
+        
+        if not run or run["job_id"] != job_id or run["recruiter_id"] != recruiter_id:
+            raise HTTPException(status_code=404, detail="Ranking run not found or access denied")
+        
+        total = run.get("total") or 0
+        done = (run.get("scored") or 0) + (run.get("failed") or 0)
+        
+        return {
+            "run_id": run["id"],
+            "job_id": run["job_id"],
+            "status": run["status"],
+            "total": total,
+            "scored": run.get("scored") or 0,
+            "failed": run.get("failed") or 0,
+            "progress": 100 if run["status"] == "completed" else int(done / total * 100) if total else 0,
+            "candidates": run.get("candidates"),
+            "result": run.get("result"),
+            "error": run.get("error"),
+            "created_at": run.get("created_at"),
+            "completed_at": run.get("completed_at")
+        }
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching ranking run: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/candidate/{student_id}/analysis")
 @limiter.limit("30/minute")
 async def get_candidate_analysis(request: Request, student_id: str, job_id: str, recruiter_id: str):
@@ -404,20 +714,15 @@ async def extract_skills_from_description(request: Request, payload: ExtractSkil
         """
         
         # Use Gemini to extract skills
-        from google.generativeai import GenerativeModel
-        import google.generativeai as genai
-        
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-        model = GenerativeModel('gemini-pro')
+        from services.intelligence.ai_client import ai_client
         
-        response = model.generate_content(prompt)
+        text = await ai_client.generate_text(prompt)
         
         # Parse response
         import json
         import re
         
         # Remove markdown code blocks if present
-        text = response.text.strip()
         text = re.sub(r'^```json\s*', '', text)
         text = re.sub(r'\s*```$', '', text)
         
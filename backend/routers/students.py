@@ -1,21 +1,31 @@
+import json
 import logging
 import asyncio
 from typing import List, Optional
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Request, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from pydantic import BaseModel, Field
 from utils.supabase import supabase
-from services.integrations.platform_orchestrator import PlatformOrchestrator
+from services.integrations.extraction_queue import enqueue_extraction, get_latest_extraction
+from services.intelligence.ai_client import ai_client
 from services.intelligence.ai_scoring import score_candidate_with_gemini
+from services.intelligence.profile_digest import profile_digest_text
+from services.intelligence.eligibility import (
+    DECISION_MESSAGES, get_cached_eligibility, local_eligibility, store_eligibility
+)
+from services.matching.feature_store import get_features
+from services.matching.fingerprint import eligibility_fingerprint
+from services.matching.job_matches import materialize_student_matches
+from services.matching.skill_taxonomy import match_skills
+from utils.pagination import DEFAULT_PAGE_SIZE, clamp_limit, decode_cursor, encode_cursor
 from config.settings import settings
-import google.generativeai as genai
 
 router = APIRouter(prefix="/student", tags=["student"])
 limiter = Limiter(key_func=get_remote_address)
 logger = logging.getLogger("sudhee-ai-intelligence")
-platform_orchestrator = PlatformOrchestrator()
 
 # Pydantic Models
 class ProfileSetupRequest(BaseModel):
@@ -46,6 +56,10 @@ class JobMatchResponse(BaseModel):
     missing_skills: List[str]
     created_at: str
 
+class JobMatchPage(BaseModel):
+    jobs: List[JobMatchResponse]
+    next_cursor: Optional[str] = None
+
 class EligibilityRequest(BaseModel):
     student_id: str
 
@@ -57,6 +71,7 @@ class EligibilityResponse(BaseModel):
     skill_gaps: List[dict]
     ai_recommendation: str
     action_items: List[dict]
+    source: str = "ai"  # "rules" when decided without Gemini
 
 class SkillGapResponse(BaseModel):
     current_fit: int
@@ -65,121 +80,14 @@ class SkillGapResponse(BaseModel):
     roadmap: dict
     expected_outcome: dict
 
-async def extract_profile_background(student_id: str, urls: dict, manual_data: dict = None):
-    """
-    Background task to extract student profile from platforms.
-    """
-    try:
-        # Update status to in_progress
-        logger.info(f"Starting profile extraction for student {student_id}")
-        
-        # Extract usernames from URLs
-        import re
-        usernames = {}
-        
-        if urls.get("github_url"):
-            match = re.search(r"github\.com/([a-zA-Z0-9_-]+)", urls["github_url"])
-            if match:
-                usernames["github"] = match.group(1)
-        
-        if urls.get("leetcode_url"):
-            match = re.search(r"leetcode\.com/(?:u/)?([a-zA-Z0-9_-]+)", urls["leetcode_url"])
-            if match:
-                usernames["leetcode"] = match.group(1)
-        
-        # Scrape platforms
-        platform_data = await platform_orchestrator.scrape_all_platforms(
-            student_id=student_id,
-            usernames=usernames,
-            force_refresh=True
-        )
-        
-        # Add manual LinkedIn data if provided
-        if manual_data:
-            platform_data["linkedin"] = {
-                "profile_url": urls.get("linkedin_url", ""),
-                "skills": manual_data.get("skills", []),
-                "experience": manual_data.get("experience", []),
-                "certifications": manual_data.get("certifications", []),
-                "data_source": "manual_entry",
-                "extracted_at": datetime.utcnow().isoformat()
-            }
-        
-        # Run Gemini AI analysis on complete profile
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-        model = genai.GenerativeModel('gemini-pro')
-        
-        import json
-        prompt = f"""
-        Analyze this student's technical profile and provide a comprehensive assessment.
-        
-        Profile Data:
-        {json.dumps(platform_data, indent=2)}
-        
-        Return STRICT JSON with these fields:
-        - overall_assessment (string, 2-3 sentences)
-        - technical_skills (array of strings)
-        - project_highlights (array of strings)
-        - strengths (array of strings, specific and evidence-based)
-        - areas_for_improvement (array of strings)
-        - suitable_roles (array of strings)
-        - skill_level (one of: Beginner, Intermediate, Advanced, Expert)
-        - coding_proficiency (one of: Beginner, Intermediate, Advanced, Expert)
-        - recommendation (string, detailed paragraph)
-        - confidence_score (integer 0-100)
-        
-        No markdown. Pure JSON only.
-        """
-        
-        response = model.generate_content(prompt)
-        ai_text = response.text.strip()
-        
-        # Remove markdown if present
-        ai_text = re.sub(r'^```json\s*', '', ai_text)
-        ai_text = re.sub(r'\s*```$', '', ai_text)
-        
-        ai_analysis = json.loads(ai_text)
-        
-        # Calculate profile strength (0-100)
-        profile_strength = 0
-        if platform_data.get("github"):
-            profile_strength += 35
-        if platform_data.get("leetcode"):
-            profile_strength += 35
-        if platform_data.get("linkedin"):
-            profile_strength += 30
-        
-        # Update student_profiles table
-        profile_update = {
-            "user_id": student_id,
-            "leetcode_url": urls.get("leetcode_url"),
-            "github_url": urls.get("github_url"),
-            "linkedin_url": urls.get("linkedin_url"),
-            "leetcode_data": platform_data.get("leetcode", {}),
-            "github_data": platform_data.get("github", {}),
-            "linkedin_data": platform_data.get("linkedin", {}),
-            "ai_analysis": ai_analysis,
-            "extracted_skills": ai_analysis.get("technical_skills", []),
-            "profile_strength": profile_strength,
-            "last_analyzed_at": datetime.utcnow().isoformat(),
-            "updated_at": datetime.utcnow().isoformat()
-        }
-        
-        supabase.table("student_profiles").upsert(profile_update, on_conflict="user_id").execute()
-        
-        # Update profiles table
-        supabase.table("profiles").update({"profile_complete": True}).eq("user_id", student_id).execute()
-        
-        logger.info(f"Profile extraction completed for student {student_id}")
-        
-    except Exception as e:
-        logger.error(f"Profile extraction failed for {student_id}: {str(e)}")
-
 @router.post("/profile/setup")
 @limiter.limit("5/minute")
-async def setup_profile(request: Request, background_tasks: BackgroundTasks, payload: ProfileSetupRequest):
+async def setup_profile(request: Request, payload: ProfileSetupRequest):
     """
     Initiate student profile extraction from external platforms.
+    
+    The extraction is queued for the extraction workers; poll
+    /student/profile/status for progress.
     """
     if not supabase:
         raise HTTPException(status_code=500, detail="Database not connected")
@@ -194,17 +102,18 @@ async def setup_profile(request: Request, background_tasks: BackgroundTasks, pay
             "linkedin_url": payload.linkedin_url
         }
         
-        # Trigger background extraction
-        background_tasks.add_task(
-            extract_profile_background,
+        # Queue extraction for the worker processes
+        job = await asyncio.to_thread(
+            enqueue_extraction,
             payload.student_id,
             urls,
             payload.linkedin_manual_data
         )
         
         return {
-            "status": "in_progress",
-            "message": "Profile extraction started",
+            "status": job["status"],
+            "job_id": job["id"],
+            "message": "Profile extraction queued",
             "estimated_time": "1-2 minutes"
         }
     
@@ -212,6 +121,31 @@ async def setup_profile(request: Request, background_tasks: BackgroundTasks, pay
         logger.error(f"Profile setup failed: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/profile/status", response_model=ProfileStatusResponse)
+@limiter.limit("60/minute")
+async def get_profile_status(request: Request, student_id: str):
+    """Progress of the student's latest profile extraction."""
+    try:
+        job = await asyncio.to_thread(get_latest_extraction, student_id)
+        
+        if not job:
+            raise HTTPException(status_code=404, detail="No profile extraction found")
+        
+        return ProfileStatusResponse(
+            status=job["status"],
+            progress=job["progress"],
+            current_step=job["current_step"],
+            platforms=job["platforms"],
+            errors=job["errors"],
+            completed_at=job["completed_at"]
+        )
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to fetch profile status: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/profile")
 @limiter.limit("30/minute")
 async def get_student_profile(request: Request, student_id: str):
@@ -257,22 +191,36 @@ async def get_student_profile(request: Request, student_id: str):
         logger.error(f"Error fetching profile: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/jobs", response_model=List[JobMatchResponse])
+@router.get("/jobs", response_model=JobMatchPage)
 @limiter.limit("30/minute")
 async def get_student_jobs(
     request: Request,
     student_id: str,
     job_type: Optional[str] = None,
     location: Optional[str] = None,
-    search: Optional[str] = None
+    search: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None
 ):
     """
     Browse jobs with personalized match percentages.
+    
+    Reads the student's materialized job_matches rows (see
+    services/matching/job_matches), which only cover jobs sharing at
+    least one skill with the student. Results are ordered by match
+    percentage, then newest first, and returned `limit` at a time; pass
+    `next_cursor` back as `cursor` for the next page.
     """
     if not supabase:
         raise HTTPException(status_code=500, detail="Database not connected")
     
     try:
+        limit = clamp_limit(limit)
+        try:
+            after = decode_cursor(cursor, 3)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
         # Fetch student profile
         profile_response = supabase.table("student_profiles").select("*").eq("user_id", student_id).execute()
         
@@ -280,36 +228,56 @@ async def get_student_jobs(
             raise HTTPException(status_code=400, detail="Profile not set up")
         
         student_profile = profile_response.data[0]
-        student_skills = set(student_profile.get("extracted_skills", []))
         
-        # Fetch active jobs
-        query = supabase.table("jobs").select("*").eq("status", "active")
+        # Profiles extracted before matches were materialized are matched once, here
+        if not student_profile.get("job_matches_at"):
+            await asyncio.to_thread(materialize_student_matches, student_id, get_features(student_profile)["skills"])
         
+        query = (
+            supabase.table("job_matches")
+            .select(
+                "match_percentage, matched_skills, missing_skills, job_created_at, job_id, "
+                "jobs!inner(id, title, company_name, location, job_type, required_skills, created_at, status)"
+            )
+            .eq("student_id", student_id)
+            .eq("jobs.status", "active")
+        )
         if job_type:
-            query = query.eq("job_type", job_type)
+            query = query.eq("jobs.job_type", job_type)
         if location:
-            query = query.eq("location", location)
-        
-        jobs_response = query.execute()
+            query = query.eq("jobs.location", location)
+        
+        if after:
+            percentage, created_at, job_id = after
+            if (not isinstance(percentage, int) or not isinstance(created_at, str) or not isinstance(job_id, str)
+                    or '"' in created_at or '"' in job_id):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            # Keyset: rows sorting after (percentage, created_at, job_id) in descending order
+            query = query.or_(
+                f'match_percentage.lt.{percentage},'
+                f'and(match_percentage.eq.{percentage},job_created_at.lt."{created_at}"),'
+                f'and(match_percentage.eq.{percentage},job_created_at.eq."{created_at}",job_id.lt."{job_id}")'
+            )
         
-        if not jobs_response.data:
-            return []
+        # One page (+1 to detect more)
+        rows = (
+            query.order("match_percentage", desc=True)
+            .order("job_created_at", desc=True)
+            .order("job_id", desc=True)
+            .limit(limit + 1)
+            .execute()
+        ).data or []
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor([last["match_percentage"], last["job_created_at"], last["job_id"]])
         
-        # Calculate match percentage for each job
         matched_jobs = []
-        for job in jobs_response.data:
-            required_skills = set(job.get("required_skills", []))
-            preferred_skills = set(job.get("preferred_skills", []))
-            
-            # Calculate match
-            matched_required = student_skills.intersection(required_skills)
-            matched_preferred = student_skills.intersection(preferred_skills)
-            
-            # Match percentage formula
-            required_match = (len(matched_required) / len(required_skills) * 70) if required_skills else 0
-            preferred_match = (len(matched_preferred) / len(preferred_skills) * 30) if preferred_skills else 30
-            
-            match_percentage = int(required_match + preferred_match)
+        for match in rows:
+            job = match["jobs"]
+            match_percentage = match["match_percentage"]
             
             # Determine match label
             if match_percentage >= 80:
@@ -321,26 +289,21 @@ async def get_student_jobs(
             else:
                 match_label = "Low Match"
             
-            missing_skills = list(required_skills - student_skills)
-            
             matched_jobs.append(JobMatchResponse(
                 id=job["id"],
                 title=job["title"],
                 company_name=job["company_name"],
                 location=job["location"],
                 job_type=job["job_type"],
-                required_skills=list(required_skills),
+                required_skills=job.get("required_skills") or [],
                 match_percentage=match_percentage,
                 match_label=match_label,
-                matched_skills=list(matched_required),
-                missing_skills=missing_skills,
+                matched_skills=match["matched_skills"],
+                missing_skills=match["missing_skills"],
                 created_at=job["created_at"]
             ))
         
-        # Sort by match percentage
-        matched_jobs.sort(key=lambda x: x.match_percentage, reverse=True)
-        
-        return matched_jobs
+        return JobMatchPage(jobs=matched_jobs, next_cursor=next_cursor)
     
     except HTTPException:
         raise
@@ -394,13 +357,15 @@ async def apply_to_job(request: Request, job_id: str, student_id: str):
 async def check_eligibility(request: Request, job_id: str, payload: EligibilityRequest):
     """
     AI-powered eligibility check: "Can I apply?"
+    
+    Clear-cut cases (every required skill, or almost none) are decided
+    locally in milliseconds; only borderline profiles go to Gemini.
+    Results are cached per student and job; a repeat check is served
+    from the cache until the profile or the job's requirements change.
     """
     if not supabase:
         raise HTTPException(status_code=500, detail="Database not connected")
     
-    if not settings.GEMINI_API_KEY:
-        raise HTTPException(status_code=503, detail="AI service not configured")
-    
     try:
         # Fetch job
         job_response = supabase.table("jobs").select("*").eq("id", job_id).execute()
@@ -415,10 +380,25 @@ async def check_eligibility(request: Request, job_id: str, payload: EligibilityR
         
         profile = profile_response.data[0]
         
-        # Use Gemini to analyze fit
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-        model = genai.GenerativeModel('gemini-pro')
+        # Deterministic fast path for unambiguous outcomes
+        local_result = local_eligibility(profile, job)
+        if local_result:
+            return EligibilityResponse(**local_result)
         
+        fingerprint = eligibility_fingerprint(profile, job)
+        try:
+            cached = get_cached_eligibility(payload.student_id, job_id, fingerprint)
+        except Exception as e:
+            # A cache lookup failure is a miss, not a failed check
+            logger.warning(f"Failed to read cached eligibility for {payload.student_id}/{job_id}: {str(e)}")
+            cached = None
+        if cached:
+            return EligibilityResponse(**cached)
+        
+        if not settings.GEMINI_API_KEY:
+            raise HTTPException(status_code=503, detail="AI service not configured")
+        
+        # Use Gemini to analyze fit
         import json
         prompt = f"""
         Analyze if this student is eligible to apply for this job.
@@ -430,10 +410,7 @@ async def check_eligibility(request: Request, job_id: str, payload: EligibilityR
         Experience: {job.get('experience_required', 'Not specified')}
         
         Student Profile:
-        Skills: {json.dumps(profile.get('extracted_skills', []))}
-        AI Analysis: {json.dumps(profile.get('ai_analysis', {}))}
-        LeetCode: {json.dumps(profile.get('leetcode_data', {}))}
-        GitHub: {json.dumps(profile.get('github_data', {}))}
+        {profile_digest_text(profile, job)}
         
         Return STRICT JSON with:
         - fit_percentage (integer 0-100, be realistic)
@@ -446,8 +423,7 @@ async def check_eligibility(request: Request, job_id: str, payload: EligibilityR
         Pure JSON only.
         """
         
-        response = model.generate_content(prompt)
-        ai_text = response.text.strip()
+        ai_text = await ai_client.generate_text(prompt)
         
         import re
         ai_text = re.sub(r'^```json\s*', '', ai_text)
@@ -455,24 +431,24 @@ async def check_eligibility(request: Request, job_id: str, payload: EligibilityR
         
         result = json.loads(ai_text)
         
-        # Determine decision message
         decision = result.get("decision", "IMPROVE")
-        if decision == "APPLY":
-            message = "You're a great fit! Apply now."
-        elif decision == "IMPROVE":
-            message = "Close to ready. Improve key skills and apply."
-        else:
-            message = "Build foundational skills first before applying."
-        
-        return EligibilityResponse(
+        
+        eligibility = EligibilityResponse(
             fit_percentage=result.get("fit_percentage", 50),
             decision=decision,
-            decision_message=message,
+            decision_message=DECISION_MESSAGES.get(decision, DECISION_MESSAGES["NOT_READY"]),
             strengths=result.get("strengths", []),
             skill_gaps=result.get("skill_gaps", []),
             ai_recommendation=result.get("recommendation", ""),
             action_items=result.get("action_items", [])
         )
+        
+        try:
+            store_eligibility(payload.student_id, job_id, fingerprint, eligibility.dict())
+        except Exception as e:
+            logger.warning(f"Failed to cache eligibility for {payload.student_id}/{job_id}: {str(e)}")
+        
+        return eligibility
     
     except HTTPException:
         raise
@@ -480,26 +456,74 @@ async def check_eligibility(request: Request, job_id: str, payload: EligibilityR
         logger.error(f"Eligibility check failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
+APPLICATION_STATUSES = ("pending", "under_review", "shortlisted", "rejected")
+
+def _count_applications(student_id: str, status: Optional[str] = None) -> int:
+    """Exact application count via a head-only query (no rows transferred)."""
+    query = supabase.table("applications").select("id", count="exact").eq("student_id", student_id)
+    if status:
+        query = query.eq("status", status)
+    return query.limit(0).execute().count or 0
+
+def _application_stats(student_id: str) -> dict:
+    """Total and per-status application counts for a student."""
+    stats = {"total": _count_applications(student_id)}
+    for status in APPLICATION_STATUSES:
+        stats[status] = _count_applications(student_id, status)
+    return stats
+
 @router.get("/applications")
 @limiter.limit("30/minute")
-async def get_student_applications(request: Request, student_id: str):
-    """Get all applications submitted by student."""
+async def get_student_applications(
+    request: Request,
+    student_id: str,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None
+):
+    """
+    Get applications submitted by student, newest first.
+    
+    Returns `limit` applications per page; pass `next_cursor` back as
+    `cursor` for the next page. Stats cover every application and are
+    returned with the first page only.
+    """
     if not supabase:
         raise HTTPException(status_code=500, detail="Database not connected")
     
     try:
-        # Fetch applications
-        apps_response = supabase.table("applications").select("*").eq("student_id", student_id).order("created_at", desc=True).execute()
+        limit = clamp_limit(limit)
+        try:
+            after = decode_cursor(cursor, 2)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        # Fetch one page of applications (+1 to detect more), keyset on (created_at, id)
+        # The job is embedded through the applications.job_id foreign key (no per-row lookups)
+        query = supabase.table("applications").select(
+            "id, job_id, status, match_score, rank, created_at, jobs(title, company_name, location, job_type)"
+        ).eq("student_id", student_id)
+        if after:
+            created_at, app_id = after
+            if not all(isinstance(v, str) and '"' not in v for v in after):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            query = query.or_(
+                f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.lt."{app_id}")'
+            )
+        apps_response = query.order("created_at", desc=True).order("id", desc=True).limit(limit + 1).execute()
         
-        if not apps_response.data:
-            return {"applications": [], "total": 0}
+        page = apps_response.data or []
+        next_cursor = None
+        if len(page) > limit:
+            page = page[:limit]
+            next_cursor = encode_cursor([page[-1]["created_at"], page[-1]["id"]])
+        
+        if cursor is None and not page:
+            return {"applications": [], "total": 0, "next_cursor": None}
         
         # Enrich with job data
         applications = []
-        for app in apps_response.data:
-            job_response = supabase.table("jobs").select("title, company_name, location, job_type").eq("id", app["job_id"]).execute()
-            
-            job_info = job_response.data[0] if job_response.data else {}
+        for app in page:
+            job_info = app.get("jobs") or {}
             
             applications.append({
                 "application_id": app["id"],
@@ -516,24 +540,103 @@ async def get_student_applications(request: Request, student_id: str):
                 "rank": app.get("rank")
             })
         
-        # Calculate stats
-        stats = {
-            "total": len(applications),
-            "pending": sum(1 for a in apps_response.data if a["status"] == "pending"),
-            "under_review": sum(1 for a in apps_response.data if a["status"] == "under_review"),
-            "shortlisted": sum(1 for a in apps_response.data if a["status"] == "shortlisted"),
-            "rejected": sum(1 for a in apps_response.data if a["status"] == "rejected")
-        }
-        
-        return {
+        response = {
             "applications": applications,
-            "stats": stats
+            "next_cursor": next_cursor
         }
+        # Stats cover every application; they only change between visits, so send them with the first page
+        if cursor is None:
+            response["stats"] = _application_stats(student_id)
+        
+        return response
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching applications: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def _load_skill_gap_inputs(job_id: str, student_id: str):
+    """
+    Job, roadmap inputs and missing skills for a skill-gap request.
+    Raises HTTPException for a missing job or profile.
+    """
+    # Fetch job
+    job_response = supabase.table("jobs").select("*").eq("id", job_id).execute()
+    if not job_response.data:
+        raise HTTPException(status_code=404, detail="Job not found")
+    job = job_response.data[0]
+    
+    # Fetch student profile
+    profile_response = supabase.table("student_profiles").select("*").eq("user_id", student_id).execute()
+    if not profile_response.data:
+        raise HTTPException(status_code=400, detail="Profile not set up")
+    
+    profile = profile_response.data[0]
+    
+    # Calculate missing skills (canonical skills, so aliases like "JS"/"JavaScript" match)
+    _, missing_skills = match_skills(job.get("required_skills", []), get_features(profile)["skills"])
+    
+    student_profile = {
+        "user_id": student_id,
+        "extracted_skills": profile.get("extracted_skills", []),
+        "ai_analysis": profile.get("ai_analysis", {}),
+        "leetcode_data": profile.get("leetcode_data", {}),
+        "github_data": profile.get("github_data", {})
+    }
+    job_requirements = {
+        "title": job.get("title"),
+        "description": job.get("description"),
+        "required_skills": job.get("required_skills", []),
+        "preferred_skills": job.get("preferred_skills", []),
+        "experience_required": job.get("experience_required"),
+        "role_type": job.get("role_type", "SDE")
+    }
+    return student_profile, job_requirements, missing_skills
+
+def _no_skill_gap_response() -> SkillGapResponse:
+    return SkillGapResponse(
+        current_fit=100,
+        target_fit=100,
+        skill_gaps=[],
+        roadmap={"message": "You already have all required skills!"},
+        expected_outcome={"ready_to_apply": True}
+    )
+
+def _skill_gap_response(roadmap: dict) -> SkillGapResponse:
+    """Wrap a generated roadmap with its summary and per-skill gaps."""
+    from services.intelligence.roadmap_engine import format_roadmap_summary
+    
+    # Extract summary
+    summary = format_roadmap_summary(roadmap)
+    
+    logger.info(f"Roadmap generated: {summary['duration_weeks']} weeks, {summary['skills_to_learn']} skills")
+    
+    # Prepare skill gaps array for response
+    skill_gaps_detailed = []
+    for skill_dive in roadmap.get("skill_deep_dives", []):
+        skill_gaps_detailed.append({
+            "skill": skill_dive["skill"],
+            "importance": skill_dive["importance"],
+            "current_level": skill_dive["current_level"],
+            "target_level": skill_dive["target_level"],
+            "estimated_hours": sum(step.get("estimated_hours", 0) for step in skill_dive.get("learning_path", []))
+        })
+    
+    return SkillGapResponse(
+        current_fit=roadmap["current_fit_analysis"]["current_match_percentage"],
+        target_fit=roadmap["target_outcome"]["target_match_percentage"],
+        skill_gaps=skill_gaps_detailed,
+        roadmap=roadmap,
+        expected_outcome={
+            "duration_weeks": summary["duration_weeks"],
+            "improvement_percentage": summary["improvement"],
+            "expected_role_readiness": roadmap["target_outcome"]["expected_role_readiness"],
+            "projects_count": summary["projects_count"],
+            "hours_per_week": summary["hours_per_week"]
+        }
+    )
+
 @router.post("/jobs/{job_id}/skill-gap", response_model=SkillGapResponse)
 @limiter.limit("3/minute")
 async def generate_skill_gap_roadmap(request: Request, job_id: str, payload: EligibilityRequest):
@@ -555,88 +658,25 @@ async def generate_skill_gap_roadmap(request: Request, job_id: str, payload: Eli
         raise HTTPException(status_code=503, detail="AI service not configured")
     
     try:
-        # Fetch job
-        job_response = supabase.table("jobs").select("*").eq("id", job_id).execute()
-        if not job_response.data:
-            raise HTTPException(status_code=404, detail="Job not found")
-        job = job_response.data[0]
-        
-        # Fetch student profile
-        profile_response = supabase.table("student_profiles").select("*").eq("user_id", payload.student_id).execute()
-        if not profile_response.data:
-            raise HTTPException(status_code=400, detail="Profile not set up")
-        
-        profile = profile_response.data[0]
-        
-        # Calculate missing skills
-        student_skills = set(profile.get("extracted_skills", []))
-        required_skills = set(job.get("required_skills", []))
-        missing_skills = list(required_skills - student_skills)
+        student_profile, job_requirements, missing_skills = _load_skill_gap_inputs(job_id, payload.student_id)
         
         if not missing_skills:
-            return SkillGapResponse(
-                current_fit=100,
-                target_fit=100,
-                skill_gaps=[],
-                roadmap={"message": "You already have all required skills!"},
-                expected_outcome={"ready_to_apply": True}
-            )
+            return _no_skill_gap_response()
         
         # Import roadmap engine
-        from services.intelligence.roadmap_engine import generate_learning_roadmap, format_roadmap_summary
+        from services.intelligence.roadmap_engine import generate_learning_roadmap
         
         # Generate roadmap
         logger.info(f"Generating roadmap for student {payload.student_id}, job {job_id}")
         
         roadmap = await generate_learning_roadmap(
-            student_profile={
-                "user_id": payload.student_id,
-                "extracted_skills": profile.get("extracted_skills", []),
-                "ai_analysis": profile.get("ai_analysis", {}),
-                "leetcode_data": profile.get("leetcode_data", {}),
-                "github_data": profile.get("github_data", {})
-            },
-            job_requirements={
-                "title": job.get("title"),
-                "description": job.get("description"),
-                "required_skills": job.get("required_skills", []),
-                "preferred_skills": job.get("preferred_skills", []),
-                "experience_required": job.get("experience_required"),
-                "role_type": job.get("role_type", "SDE")
-            },
+            student_profile=student_profile,
+            job_requirements=job_requirements,
             missing_skills=missing_skills,
             gemini_api_key=settings.GEMINI_API_KEY
         )
         
-        # Extract summary
-        summary = format_roadmap_summary(roadmap)
-        
-        logger.info(f"Roadmap generated: {summary['duration_weeks']} weeks, {summary['skills_to_learn']} skills")
-        
-        # Prepare skill gaps array for response
-        skill_gaps_detailed = []
-        for skill_dive in roadmap.get("skill_deep_dives", []):
-            skill_gaps_detailed.append({
-                "skill": skill_dive["skill"],
-                "importance": skill_dive["importance"],
-                "current_level": skill_dive["current_level"],
-                "target_level": skill_dive["target_level"],
-                "estimated_hours": sum(step.get("estimated_hours", 0) for step in skill_dive.get("learning_path", []))
-            })
-        
-        return SkillGapResponse(
-            current_fit=roadmap["current_fit_analysis"]["current_match_percentage"],
-            target_fit=roadmap["target_outcome"]["target_match_percentage"],
-            skill_gaps=skill_gaps_detailed,
-            roadmap=roadmap,
-            expected_outcome={
-                "duration_weeks": summary["duration_weeks"],
-                "improvement_percentage": summary["improvement"],
-                "expected_role_readiness": roadmap["target_outcome"]["expected_role_readiness"],
-                "projects_count": summary["projects_count"],
-                "hours_per_week": summary["hours_per_week"]
-            }
-        )
+        return _skill_gap_response(roadmap)
     
     except HTTPException:
         raise
@@ -644,3 +684,47 @@ async def generate_skill_gap_roadmap(request: Request, job_id: str, payload: Eli
         logger.error(f"Roadmap generation failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Roadmap generation failed: {str(e)}")
 
+@router.post("/jobs/{job_id}/skill-gap/stream")
+@limiter.limit("3/minute")
+async def stream_skill_gap_roadmap(request: Request, job_id: str, payload: EligibilityRequest):
+    """
+    Streaming variant of the skill-gap roadmap (NDJSON, one event per line).
+    
+    Events:
+    - start: current / target fit and skills to learn, sent before any AI work
+    - section: a roadmap section as soon as it is generated; `learning_phases`
+      and `skill_deep_dives` entries arrive one at a time with an `index`
+    - final: the same payload as POST /jobs/{job_id}/skill-gap
+    - error: generation aborted; carries `detail`
+    """
+    if not supabase:
+        raise HTTPException(status_code=500, detail="Database not connected")
+    
+    if not settings.GEMINI_API_KEY:
+        raise HTTPException(status_code=503, detail="AI service not configured")
+    
+    student_profile, job_requirements, missing_skills = _load_skill_gap_inputs(job_id, payload.student_id)
+    
+    from services.intelligence.roadmap_engine import iter_roadmap_events
+    
+    async def event_stream():
+        if not missing_skills:
+            yield json.dumps({"event": "final", **_no_skill_gap_response().dict()}) + "\n"
+            return
+        
+        logger.info(f"Streaming roadmap for student {payload.student_id}, job {job_id}")
+        try:
+            async for event in iter_roadmap_events(
+                student_profile=student_profile,
+                job_requirements=job_requirements,
+                missing_skills=missing_skills,
+                gemini_api_key=settings.GEMINI_API_KEY
+            ):
+                if event["event"] == "final":
+                    event = {"event": "final", **_skill_gap_response(event["roadmap"]).dict()}
+                yield json.dumps(event) + "\n"
+        except Exception as e:
+            logger.error(f"Streamed roadmap generation failed: {str(e)}")
+            yield json.dumps({"event": "error", "detail": f"Roadmap generation failed: {str(e)}"}) + "\n"
+    
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
@@ -1,5 +1,7 @@
+import asyncio
 import time
 from fastapi import APIRouter
+from services.integrations.extraction_queue import extraction_counts
 from services.intelligence.feature_flags import feature_flags
 from config.settings import settings
 
@@ -42,7 +44,8 @@ async def get_system_status():
             "ai_fallback_rate": 0.0,
             "total_ai_calls_today": 0,
             "total_tokens_used_today": 0,
-            "cache_hit_rate": 0.0
+            "cache_hit_rate": 0.0,
+            "extraction_queue": await asyncio.to_thread(extraction_counts)
         },
         "feature_flags": {
             "ai_scoring": feature_flags.ENABLE_AI_SCORING,
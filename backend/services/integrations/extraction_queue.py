@@ -0,0 +1,215 @@
+"""
+Extraction Queue - Durable profile-extraction jobs in a local SQLite store.
+
+POST /student/profile/setup enqueues a job here instead of running the
+extraction on the API worker. Extraction worker processes (see
+extraction_worker) claim queued jobs, record per-platform progress and
+errors on the job row as they go, and mark it completed or failed.
+GET /student/profile/status reads the student's latest job.
+
+A claimed job carries a heartbeat; a worker that dies mid-extraction
+leaves it running, and once the lease expires another worker re-claims
+it (up to EXTRACTION_MAX_ATTEMPTS). Claims run inside BEGIN IMMEDIATE,
+so two workers can never take the same job.
+"""
+
+import json
+import sqlite3
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from config.settings import settings
+
+# Columns stored as JSON text
+JSON_FIELDS = ("urls", "manual_data", "platforms", "errors")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS extraction_jobs (
+    id TEXT PRIMARY KEY,
+    student_id TEXT NOT NULL,
+    urls TEXT NOT NULL,
+    manual_data TEXT,
+    status TEXT NOT NULL,             -- queued | in_progress | completed | failed
+    progress INTEGER NOT NULL DEFAULT 0,
+    current_step TEXT NOT NULL,
+    platforms TEXT NOT NULL,          -- platform -> {status, error?}
+    errors TEXT NOT NULL,             -- [{step, platform?, error}]
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker_id TEXT,
+    heartbeat_at TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    completed_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_extraction_jobs_student ON extraction_jobs (student_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_extraction_jobs_status ON extraction_jobs (status, created_at);
+"""
+
+_initialized_paths = set()
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat()
+
+
+def _lease_cutoff() -> str:
+    return (datetime.utcnow() - timedelta(seconds=settings.EXTRACTION_LEASE_SECONDS)).isoformat()
+
+
+@contextmanager
+def _connect(path: Optional[str] = None):
+    """
+    Autocommit connection (transactions are explicit) in WAL mode, so
+    status reads from the API never wait on a worker's writes.
+    """
+    path = path or settings.EXTRACTION_QUEUE_PATH
+    conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    try:
+        if path not in _initialized_paths:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            _initialized_paths.add(path)
+        yield conn
+    finally:
+        conn.close()
+
+
+def _to_dict(row: sqlite3.Row) -> Dict:
+    job = dict(row)
+    for field in JSON_FIELDS:
+        job[field] = json.loads(job[field]) if job[field] is not None else None
+    return job
+
+
+def initial_platforms(urls: Dict, manual_data: Optional[Dict] = None) -> Dict[str, Dict]:
+    """Per-platform state for a new job: pending where there is something to extract."""
+    return {
+        "github": {"status": "pending" if urls.get("github_url") else "skipped"},
+        "leetcode": {"status": "pending" if urls.get("leetcode_url") else "skipped"},
+        "linkedin": {"status": "pending" if manual_data else "skipped"},
+    }
+
+
+def enqueue_extraction(student_id: str, urls: Dict, manual_data: Optional[Dict] = None, path: Optional[str] = None) -> Dict:
+    """Insert a queued extraction job and return it."""
+    now = _now()
+    job = {
+        "id": str(uuid.uuid4()),
+        "student_id": student_id,
+        "urls": urls,
+        "manual_data": manual_data,
+        "status": "queued",
+        "progress": 0,
+        "current_step": "Waiting for an extraction worker",
+        "platforms": initial_platforms(urls, manual_data),
+        "errors": [],
+        "attempts": 0,
+        "worker_id": None,
+        "heartbeat_at": None,
+        "created_at": now,
+        "updated_at": now,
+        "completed_at": None,
+    }
+    row = {key: json.dumps(value) if key in JSON_FIELDS else value for key, value in job.items()}
+
+    with _connect(path) as conn:
+        conn.execute(
+            f"INSERT INTO extraction_jobs ({', '.join(row)}) VALUES ({', '.join('?' for _ in row)})",
+            list(row.values())
+        )
+    return job
+
+
+def get_extraction_job(job_id: str, path: Optional[str] = None) -> Optional[Dict]:
+    with _connect(path) as conn:
+        row = conn.execute("SELECT * FROM extraction_jobs WHERE id = ?", (job_id,)).fetchone()
+    return _to_dict(row) if row else None
+
+
+def get_latest_extraction(student_id: str, path: Optional[str] = None) -> Optional[Dict]:
+    """The student's most recent extraction job, or None."""
+    with _connect(path) as conn:
+        row = conn.execute(
+            "SELECT * FROM extraction_jobs WHERE student_id = ? ORDER BY created_at DESC LIMIT 1",
+            (student_id,)
+        ).fetchone()
+    return _to_dict(row) if row else None
+
+
+def claim_next_extraction(worker_id: str, path: Optional[str] = None) -> Optional[Dict]:
+    """
+    Take the oldest queued job, or a running job whose lease expired.
+    Jobs that have already used up their attempts are failed instead.
+    """
+    now = _now()
+    with _connect(path) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                """
+                UPDATE extraction_jobs
+                SET status = 'failed', current_step = 'Extraction failed', updated_at = ?, completed_at = ?,
+                    errors = json_insert(errors, '$[#]', json_object('step', current_step, 'error', 'Extraction worker stopped responding'))
+                WHERE status = 'in_progress' AND heartbeat_at < ? AND attempts >= ?
+                """,
+                (now, now, _lease_cutoff(), settings.EXTRACTION_MAX_ATTEMPTS)
+            )
+            row = conn.execute(
+                """
+                SELECT * FROM extraction_jobs
+                WHERE status = 'queued' OR (status = 'in_progress' AND heartbeat_at < ?)
+                ORDER BY created_at
+                LIMIT 1
+                """,
+                (_lease_cutoff(),)
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+
+            conn.execute(
+                """
+                UPDATE extraction_jobs
+                SET status = 'in_progress', worker_id = ?, attempts = attempts + 1, heartbeat_at = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                (worker_id, now, now, row["id"])
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    job = _to_dict(row)
+    job.update(status="in_progress", worker_id=worker_id, attempts=job["attempts"] + 1, heartbeat_at=now)
+    return job
+
+
+def update_extraction(job_id: str, worker_id: str, fields: Dict, path: Optional[str] = None) -> bool:
+    """
+    Write progress fields; every write also renews the job's lease.
+    Returns False if the job is no longer held by worker_id (its lease
+    expired and another worker re-claimed it).
+    """
+    fields = dict(fields)
+    fields["updated_at"] = _now()
+    fields["heartbeat_at"] = fields["updated_at"]
+    values = [json.dumps(value) if key in JSON_FIELDS else value for key, value in fields.items()]
+
+    with _connect(path) as conn:
+        cursor = conn.execute(
+            f"UPDATE extraction_jobs SET {', '.join(f'{key} = ?' for key in fields)} WHERE id = ? AND worker_id = ?",
+            values + [job_id, worker_id]
+        )
+    return cursor.rowcount > 0
+
+
+def extraction_counts(path: Optional[str] = None) -> Dict[str, int]:
+    """Number of queued and in-progress jobs (queue depth)."""
+    with _connect(path) as conn:
+        rows = conn.execute(
+            "SELECT status, COUNT(*) FROM extraction_jobs WHERE status IN ('queued', 'in_progress') GROUP BY status"
+        ).fetchall()
+    return {"queued": 0, "in_progress": 0, **{status: count for status, count in rows}}
@@ -0,0 +1,340 @@
+"""
+Extraction Worker - Runs queued profile extractions outside the API.
+
+Each worker is a separate process with its own event loop: it claims
+jobs from the extraction queue, runs up to EXTRACTION_WORKER_CONCURRENCY
+of them at a time (scraping and Gemini are I/O bound), and writes
+per-platform progress and errors to the job row at every step. A burst
+of sign-ups therefore queues here instead of competing with API
+requests for the uvicorn worker's loop.
+
+The API starts EXTRACTION_WORKERS of these on startup; they can also be
+run standalone:
+
+    python -m services.integrations.extraction_worker
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import re
+import signal
+import uuid
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from utils.supabase import supabase
+from config.settings import settings
+from services.intelligence.ai_client import ai_client
+from services.intelligence.profile_digest import profile_digest_text
+from services.matching.feature_store import build_features
+from services.matching.job_matches import materialize_student_matches
+from .extraction_queue import claim_next_extraction, initial_platforms, update_extraction
+from .platform_orchestrator import USERNAME_PATTERNS, PlatformOrchestrator, parse_username
+
+logger = logging.getLogger("sudhee-ai-intelligence")
+
+# Progress (0-100) at the start of each step; scraping fills the gap up to analysis
+SCRAPE_PROGRESS = 10
+ANALYSIS_PROGRESS = 60
+SAVE_PROGRESS = 85
+MATCH_PROGRESS = 95
+
+# Larger than the default digest: the analysis describes projects, so keep repo detail
+ANALYSIS_DIGEST_TOKENS = 800
+
+# Worker processes started by this (API) process
+_processes: List[multiprocessing.Process] = []
+
+
+class LeaseLost(Exception):
+    """The job was re-claimed by another worker after this one's lease expired."""
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat()
+
+
+async def extract_profile(
+    student_id: str,
+    urls: Dict,
+    manual_data: Dict,
+    platforms: Dict[str, Dict],
+    errors: List[Dict],
+    report: Callable[[Dict], None],
+    orchestrator: PlatformOrchestrator
+):
+    """
+    Scrape the student's platforms, run the Gemini profile analysis and
+    save the result to student_profiles. `platforms` and `errors` are
+    updated in place and passed to `report` with every progress write.
+    """
+    def fail_platform(platform: str, error: str):
+        platforms[platform] = {"status": "failed", "error": error}
+        errors.append({"step": "Scraping platforms", "platform": platform, "error": error})
+
+    report({"current_step": "Scraping platforms", "progress": SCRAPE_PROGRESS})
+
+    # Extract usernames from URLs
+    usernames = {}
+    for platform, (url_key, _) in USERNAME_PATTERNS.items():
+        if not urls.get(url_key):
+            continue
+        username = parse_username(platform, urls[url_key])
+        if username:
+            usernames[platform] = username
+        else:
+            fail_platform(platform, f"Could not read a username from {urls[url_key]}")
+
+    # Scrape platforms in parallel, recording each as it finishes
+    platform_data = {}
+
+    async def scrape(platform: str) -> tuple:
+        result = await orchestrator.scrape_all_platforms(
+            student_id=student_id,
+            usernames={platform: usernames[platform]},
+            force_refresh=True
+        )
+        return platform, result.get(platform)
+
+    for done, finished in enumerate(asyncio.as_completed([scrape(p) for p in usernames]), start=1):
+        platform, data = await finished
+        if not data or data.get("status") == "failed":
+            fail_platform(platform, (data or {}).get("error") or "No data returned")
+        else:
+            platform_data[platform] = data
+            platforms[platform] = {"status": "completed"}
+        report({
+            "progress": SCRAPE_PROGRESS + (ANALYSIS_PROGRESS - SCRAPE_PROGRESS) * done // len(usernames),
+            "platforms": platforms,
+            "errors": errors
+        })
+
+    # Add manual LinkedIn data if provided
+    if manual_data:
+        platform_data["linkedin"] = {
+            "profile_url": urls.get("linkedin_url", ""),
+            "skills": manual_data.get("skills", []),
+            "experience": manual_data.get("experience", []),
+            "certifications": manual_data.get("certifications", []),
+            "data_source": "manual_entry",
+            "extracted_at": _now()
+        }
+        platforms["linkedin"] = {"status": "completed"}
+
+    if not platform_data:
+        raise Exception("No platform data could be extracted")
+
+    # Run Gemini AI analysis on complete profile
+    report({"current_step": "Analyzing profile with AI", "progress": ANALYSIS_PROGRESS, "platforms": platforms})
+    prompt = f"""
+    Analyze this student's technical profile and provide a comprehensive assessment.
+
+    Profile Data:
+    {profile_digest_text({
+        "leetcode_data": platform_data.get("leetcode"),
+        "github_data": platform_data.get("github"),
+        "linkedin_data": platform_data.get("linkedin")
+    }, token_budget=ANALYSIS_DIGEST_TOKENS)}
+
+    Return STRICT JSON with these fields:
+    - overall_assessment (string, 2-3 sentences)
+    - technical_skills (array of strings)
+    - project_highlights (array of strings)
+    - strengths (array of strings, specific and evidence-based)
+    - areas_for_improvement (array of strings)
+    - suitable_roles (array of strings)
+    - skill_level (one of: Beginner, Intermediate, Advanced, Expert)
+    - coding_proficiency (one of: Beginner, Intermediate, Advanced, Expert)
+    - recommendation (string, detailed paragraph)
+    - confidence_score (integer 0-100)
+
+    No markdown. Pure JSON only.
+    """
+
+    ai_text = await ai_client.generate_text(prompt)
+
+    # Remove markdown if present
+    ai_text = re.sub(r'^```json\s*', '', ai_text)
+    ai_text = re.sub(r'\s*```$', '', ai_text)
+
+    ai_analysis = json.loads(ai_text)
+
+    # Calculate profile strength (0-100)
+    profile_strength = 0
+    if platform_data.get("github"):
+        profile_strength += 35
+    if platform_data.get("leetcode"):
+        profile_strength += 35
+    if platform_data.get("linkedin"):
+        profile_strength += 30
+
+    # Update student_profiles table
+    report({"current_step": "Saving profile", "progress": SAVE_PROGRESS})
+    profile_update = {
+        "user_id": student_id,
+        "leetcode_url": urls.get("leetcode_url"),
+        "github_url": urls.get("github_url"),
+        "linkedin_url": urls.get("linkedin_url"),
+        "leetcode_data": platform_data.get("leetcode", {}),
+        "github_data": platform_data.get("github", {}),
+        "linkedin_data": platform_data.get("linkedin", {}),
+        "ai_analysis": ai_analysis,
+        "extracted_skills": ai_analysis.get("technical_skills", []),
+        "profile_strength": profile_strength,
+        "last_analyzed_at": _now(),
+        "platforms_refreshed_at": _now(),
+        "updated_at": _now()
+    }
+
+    # Precompute the feature record ranking and job matching read
+    profile_update["platform_features"] = build_features(profile_update)
+
+    supabase.table("student_profiles").upsert(profile_update, on_conflict="user_id").execute()
+
+    # Update profiles table
+    supabase.table("profiles").update({"profile_complete": True}).eq("user_id", student_id).execute()
+
+    # Re-match the student against every active job for /student/jobs
+    report({"current_step": "Matching jobs", "progress": MATCH_PROGRESS})
+    try:
+        await asyncio.to_thread(materialize_student_matches, student_id, profile_update["platform_features"]["skills"])
+    except Exception as e:
+        logger.warning(f"Job match materialization failed for {student_id}: {str(e)}")
+        errors.append({"step": "Matching jobs", "error": str(e)})
+
+
+async def process_extraction(job: Dict, worker_id: str, orchestrator: PlatformOrchestrator):
+    """Run one claimed job to completion and record the outcome on it."""
+    job_id = job["id"]
+    student_id = job["student_id"]
+    state = {"current_step": "Starting extraction"}
+    # A re-claimed job starts over
+    platforms = initial_platforms(job["urls"], job["manual_data"])
+    errors: List[Dict] = []
+
+    def report(fields: Dict):
+        state.update(fields)
+        if not update_extraction(job_id, worker_id, fields):
+            raise LeaseLost(job_id)
+
+    logger.info(f"Starting profile extraction for student {student_id}", extra={
+        "props": {"job_id": job_id, "worker_id": worker_id, "attempt": job["attempts"]}
+    })
+
+    try:
+        report({"platforms": platforms, "errors": errors, "completed_at": None})
+        await extract_profile(student_id, job["urls"], job["manual_data"], platforms, errors, report, orchestrator)
+        report({
+            "status": "completed",
+            "progress": 100,
+            "current_step": "Profile ready",
+            "platforms": platforms,
+            "errors": errors,
+            "completed_at": _now()
+        })
+        logger.info(f"Profile extraction completed for student {student_id}")
+
+    except LeaseLost:
+        logger.warning(f"Extraction job {job_id} was re-claimed by another worker; dropping it")
+    except asyncio.CancelledError:
+        # Shutdown: hand the job back to the queue for the next worker
+        logger.warning(f"Extraction job {job_id} interrupted; requeueing")
+        update_extraction(job_id, worker_id, {
+            "status": "queued",
+            "worker_id": None,
+            "attempts": job["attempts"] - 1,
+            "current_step": "Waiting for an extraction worker"
+        })
+        raise
+    except Exception as e:
+        logger.error(f"Profile extraction failed for {student_id}: {str(e)}")
+        errors.append({"step": state["current_step"], "error": str(e)})
+        update_extraction(job_id, worker_id, {
+            "status": "failed",
+            "current_step": "Extraction failed",
+            "platforms": platforms,
+            "errors": errors,
+            "completed_at": _now()
+        })
+
+
+async def run_worker(worker_id: str, stop: asyncio.Event):
+    """Claim and run jobs until `stop` is set, then cancel (requeue) in-flight jobs."""
+    orchestrator = PlatformOrchestrator()
+    slots = asyncio.Semaphore(settings.EXTRACTION_WORKER_CONCURRENCY)
+    tasks = set()
+
+    def finished(task: asyncio.Task):
+        tasks.discard(task)
+        slots.release()
+
+    while not stop.is_set():
+        await slots.acquire()
+        try:
+            job = await asyncio.to_thread(claim_next_extraction, worker_id)
+        except Exception as e:
+            logger.error(f"Failed to claim extraction job: {str(e)}")
+            job = None
+
+        if job is None:
+            slots.release()
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=settings.EXTRACTION_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            continue
+
+        task = asyncio.create_task(process_extraction(job, worker_id, orchestrator))
+        tasks.add(task)
+        task.add_done_callback(finished)
+
+    for task in list(tasks):
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def worker_main():
+    """Process entry point: run a worker until SIGTERM / SIGINT."""
+    if not logger.handlers:
+        logger.addHandler(logging.StreamHandler())
+    logger.setLevel(logging.INFO)
+
+    async def main():
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, stop.set)
+
+        worker_id = f"extractor-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        logger.info(f"Extraction worker {worker_id} started")
+        await run_worker(worker_id, stop)
+
+    asyncio.run(main())
+
+
+def start_extraction_workers(count: Optional[int] = None) -> int:
+    """Spawn extraction worker processes (EXTRACTION_WORKERS by default)."""
+    count = settings.EXTRACTION_WORKERS if count is None else count
+    context = multiprocessing.get_context("spawn")
+    for _ in range(count):
+        process = context.Process(target=worker_main, name="extraction-worker", daemon=True)
+        process.start()
+        _processes.append(process)
+    return count
+
+
+def stop_extraction_workers(timeout: float = 10):
+    """Ask workers to requeue their in-flight jobs and exit."""
+    for process in _processes:
+        process.terminate()
+    for process in _processes:
+        process.join(timeout)
+        if process.is_alive():
+            process.kill()
+    _processes.clear()
+
+
+if __name__ == "__main__":
+    worker_main()
@@ -3,9 +3,9 @@ import asyncio
 import json
 from typing import Dict, Optional
 from datetime import datetime
-import google.generativeai as genai
 import os
 from .platform_interface import PlatformScraper
+from services.intelligence.ai_client import ai_client
 
 logger = logging.getLogger("sudhee-ai-intelligence")
 
@@ -24,8 +24,7 @@ class LeetCodeScraper(PlatformScraper):
             logger.error("GEMINI_API_KEY not found in environment")
             raise ValueError("GEMINI_API_KEY is required for LeetCode analysis")
         
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
+        self.api_key = api_key
     
     async def fetch(self, username: str) -> Optional[Dict]:
         """Analyze LeetCode profile using Gemini AI."""
@@ -98,10 +97,7 @@ If you cannot find the data in the HTML, use 0 for numeric fields and empty arra
 """
             
             # Call Gemini API
-            response = await asyncio.to_thread(
-                self.model.generate_content,
-                prompt
-            )
+            response = await ai_client.generate_content(prompt, "gemini-2.0-flash-exp", self.api_key)
             
             if not response or not response.text:
                 logger.error(f"Empty response from Gemini for LeetCode profile: {username}")
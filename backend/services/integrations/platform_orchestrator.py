@@ -1,5 +1,6 @@
 import logging
 import asyncio
+import re
 from typing import Dict, List, Optional
 from datetime import datetime
 import hashlib
@@ -12,6 +13,19 @@ from .platform_interface import ScraperConfig
 
 logger = logging.getLogger("sudhee-ai-intelligence")
 
+# Profile URL field and username pattern per platform scraped from a URL
+USERNAME_PATTERNS = {
+    "github": ("github_url", r"github\.com/([a-zA-Z0-9_-]+)"),
+    "leetcode": ("leetcode_url", r"leetcode\.com/(?:u/)?([a-zA-Z0-9_-]+)"),
+}
+
+
+def parse_username(platform: str, url: Optional[str]) -> Optional[str]:
+    """Username from a profile URL, or None if it does not match."""
+    match = re.search(USERNAME_PATTERNS[platform][1], url or "")
+    return match.group(1) if match else None
+
+
 class PlatformOrchestrator:
     """
     Orchestrates multi-platform scraping with caching and rate limiting.
@@ -0,0 +1,291 @@
+"""
+Profile Refresh - Bulk re-scrape of platform data for every student.
+
+student_profiles platform data used to change only when a student re-ran
+profile setup, so ranking read GitHub and LeetCode numbers that could be
+months old. A refresh pass walks students in staleness order (never
+refreshed first, then oldest platforms_refreshed_at) and re-scrapes
+their GitHub / LeetCode accounts through PlatformOrchestrator:
+
+- each platform has its own concurrency limit and requests-per-minute
+  budget, so one slow or rate-limited platform never starves the other
+- results are written back in batched upserts along with a rebuilt
+  feature record (platform_features), so ranking sees the new numbers
+- a failed platform keeps its previous data; the error is recorded in
+  platform_refresh_errors and the profile moves to the back of the line
+- throughput (profiles/min) and per-platform failure rates are logged
+  after every page and returned at the end
+
+The Gemini profile analysis is not re-run; only platform data and the
+features derived from it change.
+
+Run one pass, or keep refreshing every PROFILE_REFRESH_INTERVAL_SECONDS:
+
+    python -m services.integrations.profile_refresh [--limit N] [--max-age-hours H] [--loop]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from utils.supabase import supabase
+from config.settings import settings
+from services.matching.feature_store import build_features
+from .platform_orchestrator import USERNAME_PATTERNS, PlatformOrchestrator, parse_username
+
+logger = logging.getLogger("sudhee-ai-intelligence")
+
+PROFILE_COLUMNS = "user_id, github_url, leetcode_url, github_data, leetcode_data, linkedin_data, extracted_skills"
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat()
+
+
+class RateBudget:
+    """
+    Spaces requests at least 60 / per_minute seconds apart. Slots are
+    handed out in call order, so waiting callers are served FIFO.
+    """
+
+    def __init__(self, per_minute: float):
+        self.interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self.next_slot = 0.0
+
+    async def acquire(self):
+        now = time.monotonic()
+        slot = max(now, self.next_slot)
+        self.next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def platform_limits() -> Dict[str, Dict]:
+    """Concurrency and requests-per-minute budget per platform."""
+    return {
+        "github": {
+            "concurrency": settings.PROFILE_REFRESH_GITHUB_CONCURRENCY,
+            "per_minute": settings.PROFILE_REFRESH_GITHUB_PER_MINUTE,
+        },
+        "leetcode": {
+            "concurrency": settings.PROFILE_REFRESH_LEETCODE_CONCURRENCY,
+            "per_minute": settings.PROFILE_REFRESH_LEETCODE_PER_MINUTE,
+        },
+    }
+
+
+def new_stats() -> Dict:
+    return {
+        "profiles": 0,
+        "refreshed": 0,
+        "failed": 0,
+        "skipped": 0,
+        "platforms": {platform: {"refreshed": 0, "failed": 0} for platform in USERNAME_PATTERNS},
+        "started_at": time.monotonic(),
+    }
+
+
+def summarize(stats: Dict) -> Dict:
+    """Counts plus throughput and failure rates."""
+    elapsed = time.monotonic() - stats["started_at"]
+    attempted = stats["refreshed"] + stats["failed"]
+    return {
+        "profiles": stats["profiles"],
+        "refreshed": stats["refreshed"],
+        "failed": stats["failed"],
+        "skipped": stats["skipped"],
+        "elapsed_seconds": round(elapsed, 1),
+        "profiles_per_minute": round(stats["profiles"] / elapsed * 60, 1) if elapsed > 0 else 0.0,
+        "failure_rate": round(stats["failed"] / attempted, 3) if attempted else 0.0,
+        "platforms": {
+            platform: {
+                **counts,
+                "failure_rate": round(counts["failed"] / (counts["refreshed"] + counts["failed"]), 3)
+                if counts["refreshed"] + counts["failed"] else 0.0
+            }
+            for platform, counts in stats["platforms"].items()
+        },
+    }
+
+
+def fetch_stale_profiles(cutoff: str, page_size: int, client=None) -> List[Dict]:
+    """
+    Next page in staleness order: never-refreshed profiles first (oldest
+    analysis first), then those refreshed before `cutoff`, oldest first.
+    Every attempted profile is stamped when written, which moves it out
+    of both filters, so repeated calls walk the whole backlog.
+    """
+    client = client or supabase
+    page = (
+        client.table("student_profiles")
+        .select(PROFILE_COLUMNS)
+        .is_("platforms_refreshed_at", "null")
+        .order("last_analyzed_at")
+        .order("user_id")
+        .limit(page_size)
+        .execute()
+    ).data or []
+    if len(page) == page_size:
+        return page
+
+    stale = (
+        client.table("student_profiles")
+        .select(PROFILE_COLUMNS)
+        .lt("platforms_refreshed_at", cutoff)
+        .order("platforms_refreshed_at")
+        .order("user_id")
+        .limit(page_size - len(page))
+        .execute()
+    ).data or []
+    return page + stale
+
+
+class ProfileRefresher:
+    """One refresh pass: per-platform semaphores and rate budgets shared by every profile."""
+
+    def __init__(self, client=None, orchestrator: Optional[PlatformOrchestrator] = None):
+        self.client = client or supabase
+        self.orchestrator = orchestrator or PlatformOrchestrator()
+        limits = platform_limits()
+        self.semaphores = {p: asyncio.Semaphore(max(1, l["concurrency"])) for p, l in limits.items()}
+        self.budgets = {p: RateBudget(l["per_minute"]) for p, l in limits.items()}
+        self.stats = new_stats()
+
+    async def scrape(self, student_id: str, platform: str, username: str) -> Dict:
+        """Fresh data for one account; {"status": "failed", "error": ...} on failure."""
+        async with self.semaphores[platform]:
+            await self.budgets[platform].acquire()
+            try:
+                results = await self.orchestrator.scrape_all_platforms(
+                    student_id=student_id,
+                    usernames={platform: username},
+                    force_refresh=True
+                )
+            except Exception as e:
+                return {"status": "failed", "error": str(e)}
+        data = results.get(platform)
+        return data if data else {"status": "failed", "error": "No data returned"}
+
+    async def refresh_profile(self, profile: Dict) -> Dict:
+        """Re-scrape one profile and return the row to upsert."""
+        usernames, errors = {}, []
+        for platform, (url_key, _) in USERNAME_PATTERNS.items():
+            if profile.get(url_key):
+                username = parse_username(platform, profile[url_key])
+                if username:
+                    usernames[platform] = username
+                else:
+                    errors.append({"platform": platform, "error": f"Could not read a username from {profile[url_key]}"})
+
+        results = await asyncio.gather(*(
+            self.scrape(profile["user_id"], platform, username) for platform, username in usernames.items()
+        ))
+
+        updated = dict(profile)
+        refreshed = 0
+        for platform, data in zip(usernames, results):
+            if data.get("status") == "failed":
+                errors.append({"platform": platform, "error": data.get("error") or "Scrape failed"})
+                self.stats["platforms"][platform]["failed"] += 1
+            else:
+                updated[f"{platform}_data"] = data
+                self.stats["platforms"][platform]["refreshed"] += 1
+                refreshed += 1
+
+        self.stats["profiles"] += 1
+        if not usernames and not errors:
+            self.stats["skipped"] += 1
+        elif refreshed:
+            self.stats["refreshed"] += 1
+        else:
+            self.stats["failed"] += 1
+
+        # Stamped even on failure so the profile goes to the back of the line
+        return {
+            "user_id": profile["user_id"],
+            "github_data": updated.get("github_data") or {},
+            "leetcode_data": updated.get("leetcode_data") or {},
+            "platform_features": build_features(updated),
+            "platform_refresh_errors": errors or None,
+            "platforms_refreshed_at": _now(),
+            "updated_at": _now(),
+        }
+
+    def write(self, rows: List[Dict]):
+        """Batched upserts; every row carries the same columns, as bulk upserts require."""
+        batch_size = settings.PROFILE_REFRESH_WRITE_BATCH
+        for start in range(0, len(rows), batch_size):
+            self.client.table("student_profiles").upsert(rows[start:start + batch_size], on_conflict="user_id").execute()
+
+    async def run(self, max_age_hours: Optional[float] = None, limit: Optional[int] = None) -> Dict:
+        """Refresh every profile older than max_age_hours (or at most `limit` of them)."""
+        max_age_hours = settings.PROFILE_REFRESH_MAX_AGE_HOURS if max_age_hours is None else max_age_hours
+        cutoff = (datetime.utcnow() - timedelta(hours=max_age_hours)).isoformat()
+
+        while limit is None or self.stats["profiles"] < limit:
+            page_size = settings.PROFILE_REFRESH_PAGE_SIZE
+            if limit is not None:
+                page_size = min(page_size, limit - self.stats["profiles"])
+
+            page = await asyncio.to_thread(fetch_stale_profiles, cutoff, page_size, self.client)
+            if not page:
+                break
+
+            rows = await asyncio.gather(*(self.refresh_profile(profile) for profile in page))
+            await asyncio.to_thread(self.write, list(rows))
+
+            # Scraped data now lives in the database; don't keep it in the orchestrator's memory cache
+            self.orchestrator.cache.clear()
+
+            logger.info("Profile refresh progress", extra={"props": summarize(self.stats)})
+
+        summary = summarize(self.stats)
+        logger.info(
+            f"Profile refresh finished: {summary['profiles']} profiles, "
+            f"{summary['profiles_per_minute']} profiles/min, failure rate {summary['failure_rate']:.1%}",
+            extra={"props": summary}
+        )
+        return summary
+
+
+async def refresh_profiles(max_age_hours: Optional[float] = None, limit: Optional[int] = None, client=None) -> Dict:
+    """Run one refresh pass and return its summary."""
+    return await ProfileRefresher(client).run(max_age_hours, limit)
+
+
+async def run_profile_refresh_loop(max_age_hours: Optional[float] = None):
+    """Refresh stale profiles every PROFILE_REFRESH_INTERVAL_SECONDS."""
+    while True:
+        try:
+            await refresh_profiles(max_age_hours)
+        except Exception as e:
+            logger.error(f"Profile refresh pass failed: {str(e)}")
+        await asyncio.sleep(settings.PROFILE_REFRESH_INTERVAL_SECONDS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-scrape platform data for stale student profiles.")
+    parser.add_argument("--limit", type=int, default=None, help="Refresh at most this many profiles")
+    parser.add_argument("--max-age-hours", type=float, default=None,
+                        help=f"Refresh profiles older than this (default {settings.PROFILE_REFRESH_MAX_AGE_HOURS})")
+    parser.add_argument("--loop", action="store_true", help="Keep refreshing every PROFILE_REFRESH_INTERVAL_SECONDS")
+    args = parser.parse_args()
+
+    if not logger.handlers:
+        logger.addHandler(logging.StreamHandler())
+    logger.setLevel(logging.INFO)
+
+    if not supabase:
+        raise SystemExit("Database not connected")
+
+    if args.loop:
+        asyncio.run(run_profile_refresh_loop(args.max_age_hours))
+    else:
+        summary = asyncio.run(refresh_profiles(args.max_age_hours, args.limit))
+        print(summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+AI Client - Shared async access to Gemini.
+
+The SDK's generate_content is synchronous; called inside an async
+handler it blocks the whole uvicorn worker for the length of the call.
+Every Gemini call site goes through ai_client instead, which runs the
+SDK call on a dedicated thread pool of AI_CLIENT_MAX_WORKERS threads:
+the event loop stays free, and a burst of slow AI calls queues in its
+own pool rather than exhausting the default executor that other
+asyncio.to_thread work (database calls, materialization) relies on.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Dict, Optional
+import google.generativeai as genai
+from config.settings import settings
+
+logger = logging.getLogger("sudhee-ai-intelligence")
+
+DEFAULT_MODEL = "gemini-pro"
+
+
+class AIClient:
+    """
+    Gemini models plus the bounded pool their calls run on.
+
+    Models are created once per (api key, model name). genai.configure
+    is process-global, so the key is re-applied only when it changes.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or settings.AI_CLIENT_MAX_WORKERS
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._models: Dict[tuple, genai.GenerativeModel] = {}
+        self._configured_key: Optional[str] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="gemini")
+        return self._executor
+
+    def model(self, model_name: str = DEFAULT_MODEL, api_key: Optional[str] = None) -> genai.GenerativeModel:
+        api_key = api_key or settings.GEMINI_API_KEY
+        if not api_key:
+            raise Exception("Gemini API key not configured")
+
+        if api_key != self._configured_key:
+            genai.configure(api_key=api_key)
+            self._configured_key = api_key
+
+        key = (api_key, model_name)
+        if key not in self._models:
+            self._models[key] = genai.GenerativeModel(model_name)
+        return self._models[key]
+
+    async def generate_content(self, prompt: str, model_name: str = DEFAULT_MODEL, api_key: Optional[str] = None):
+        """Run model.generate_content(prompt) on the AI pool and return the SDK response."""
+        model = self.model(model_name, api_key)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, model.generate_content, prompt)
+
+    async def generate_text(self, prompt: str, model_name: str = DEFAULT_MODEL, api_key: Optional[str] = None) -> str:
+        """Response text, stripped."""
+        response = await self.generate_content(prompt, model_name, api_key)
+        return response.text.strip()
+
+    async def stream_text(
+        self,
+        prompt: str,
+        model_name: str = DEFAULT_MODEL,
+        api_key: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Yield response text chunks as Gemini streams them. The blocking
+        stream is iterated on the AI pool; chunks are handed to the loop.
+        Closing the generator early stops reading at the next chunk.
+        """
+        model = self.model(model_name, api_key)
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+        end = object()
+
+        def put(item):
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+
+        def produce():
+            try:
+                for chunk in model.generate_content(prompt, stream=True):
+                    if stop.is_set():
+                        break
+                    put(chunk.text)
+            except Exception as e:
+                put(e)
+            finally:
+                put(end)
+
+        loop.run_in_executor(self.executor, produce)
+        try:
+            while True:
+                item = await queue.get()
+                if item is end:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+ai_client = AIClient()
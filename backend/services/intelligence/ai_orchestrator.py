@@ -3,7 +3,7 @@ import json
 import re
 from typing import Dict, Any, Optional, Type
 from pydantic import BaseModel, ValidationError
-import google.generativeai as genai
+from services.intelligence.ai_client import ai_client
 import time
 
 logger = logging.getLogger("sudhee-ai-intelligence")
@@ -116,8 +116,6 @@ class AIOrchestrator:
     
     def __init__(self, api_key: str):
         self.api_key = api_key
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-pro')
     
     async def generate_with_validation(
         self,
@@ -152,8 +150,8 @@ class AIOrchestrator:
             try:
                 start_time = time.time()
                 
-                # Call Gemini
-                response = self.model.generate_content(prompt)
+                # Shared AI pool keeps the event loop free and concurrent callers overlapping
+                response = await ai_client.generate_content(prompt, api_key=self.api_key)
                 raw_text = response.text
                 
                 latency_ms = int((time.time() - start_time) * 1000)
@@ -1,4 +1,3 @@
-import json
 import logging
 import google.generativeai as genai
 from typing import Optional
@@ -6,15 +5,21 @@ from models.schemas import CandidateScore
 from services.intelligence.feature_flags import feature_flags
 from services.intelligence.ai_orchestrator import AIOrchestrator
 from services.intelligence.cost_protector import cost_protector
+from services.intelligence.profile_digest import digest_text
 
 logger = logging.getLogger("sudhee-ai-intelligence")
 
+class AIScoringUnavailable(Exception):
+    """Raised instead of returning a fallback score when the caller asks for strict scoring."""
+
 async def score_candidate_with_gemini(
     profile_data: dict,
     job_data: dict,
     api_key: str,
     legacy_score: Optional[float] = 0,
-    user_id: str = "unknown"
+    user_id: str = "unknown",
+    fingerprint: Optional[str] = None,
+    strict: bool = False
 ) -> CandidateScore:
     """
     Scores a candidate against a job description using Gemini.
@@ -25,20 +30,26 @@ async def score_candidate_with_gemini(
     - Retry logic
     - Cost protection
     - Token tracking
+    
+    Only real Gemini scores are cached, keyed on job, candidate and the
+    caller's input `fingerprint` (if any). With strict=True, a disabled,
+    denied or failed call raises AIScoringUnavailable instead of
+    returning the legacy-score fallback.
     """
     if not feature_flags.ENABLE_AI_SCORING:
-        return _get_fallback_score(legacy_score, "AI scoring disabled")
+        return _fallback_or_raise(legacy_score, "AI scoring disabled", strict)
     
     # Check cost protection
     can_call, denial_reason = cost_protector.can_make_ai_call(user_id, "score_candidate")
     if not can_call:
         logger.warning(f"AI call denied: {denial_reason}")
-        return _get_fallback_score(legacy_score, denial_reason)
+        return _fallback_or_raise(legacy_score, denial_reason, strict)
     
     # Check cache
     cache_key = cost_protector.generate_cache_key("score_candidate", {
         "job_id": job_data.get("id"),
-        "candidate_id": profile_data.get("id")
+        "candidate_id": profile_data.get("id"),
+        "fingerprint": fingerprint
     })
     
     cached_response = cost_protector.get_cached_response(cache_key)
@@ -51,10 +62,10 @@ async def score_candidate_with_gemini(
     You are a Senior Technical Recruiter. Grade the candidate fit for this job.
     
     Job Description:
-    {json.dumps(job_data)}
+    {digest_text(job_data)}
     
     Candidate Profile:
-    {json.dumps(profile_data)}
+    {digest_text(profile_data)}
     
     Return STRICT JSON with these fields:
     - skill_match_score (0-100)
@@ -83,22 +94,29 @@ async def score_candidate_with_gemini(
         max_retries=1
     )
     
+    fallback_used = not (success and validated_data) or metadata.get("fallback_used")
+    
     # Track usage
     cost_protector.track_ai_usage(
         user_id=user_id,
         endpoint="score_candidate",
         tokens_used=metadata.get("tokens_used", 0),
         latency_ms=metadata.get("latency_ms", 0),
-        status="success" if success else "fallback"
+        status="fallback" if fallback_used else "success"
     )
     
-    if success and validated_data:
-        # Cache successful response
+    if not fallback_used:
+        # Cache successful response (never a fallback)
         cost_protector.cache_response(cache_key, validated_data.dict())
         return validated_data
     else:
         logger.warning("AI scoring failed, using fallback")
-        return _get_fallback_score(legacy_score, "AI failed after retries")
+        return _fallback_or_raise(legacy_score, "AI failed after retries", strict)
+
+def _fallback_or_raise(legacy_score: Optional[float], reason: str, strict: bool) -> CandidateScore:
+    if strict:
+        raise AIScoringUnavailable(reason)
+    return _get_fallback_score(legacy_score, reason)
 
 def _get_fallback_score(legacy_score: Optional[float], reason: str) -> CandidateScore:
     return CandidateScore(
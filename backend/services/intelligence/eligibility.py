@@ -0,0 +1,191 @@
+"""
+Eligibility - Persisted "Can I apply?" results.
+
+One eligibility_checks row per (student, job) holds the last result and
+the fingerprint (see matching/fingerprint) of the profile and job data
+it was computed from. A check whose fingerprint still matches is served
+from the row without calling Gemini; any change to the profile fields or
+the job's skills / experience yields a new fingerprint, so the stale row
+is simply recomputed and overwritten.
+
+Clear-cut cases never reach Gemini at all: local_eligibility scores the
+pair from the feature store (skill coverage plus platform scores) and
+decides APPLY or NOT_READY itself when the local fit is far from the
+decision boundaries. Only the borderline band is sent to the model.
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+from utils.supabase import supabase
+from services.matching.batch_scoring import build_feature_columns, score_batch
+from services.matching.feature_store import get_features
+from services.matching.job_index import index_entry
+from services.matching.skill_taxonomy import coverage, match_skills
+
+logger = logging.getLogger("sudhee-ai-intelligence")
+
+DECISION_MESSAGES = {
+    "APPLY": "You're a great fit! Apply now.",
+    "IMPROVE": "Close to ready. Improve key skills and apply.",
+    "NOT_READY": "Build foundational skills first before applying.",
+}
+
+# Local fit weights: required skill coverage, preferred coverage, platform score
+REQUIRED_FIT_WEIGHT = 70
+PREFERRED_FIT_WEIGHT = 10
+PLATFORM_FIT_WEIGHT = 20
+
+# APPLY locally: every required skill and a fit of at least 80 (the AI's APPLY bar)
+APPLY_MIN_FIT = 80
+# NOT_READY locally: at most this share of required skills (fit stays under 50)
+NOT_READY_MAX_COVERAGE = 0.25
+
+PLATFORM_LABELS = {
+    "leetcode": ("LeetCode", "Problem-solving score"),
+    "github": ("GitHub", "Project and activity score"),
+    "linkedin": ("LinkedIn", "Professional profile score"),
+}
+
+
+def local_eligibility(profile: dict, job: dict) -> Optional[Dict]:
+    """
+    Deterministic eligibility for clear-cut cases, shaped like an
+    EligibilityResponse. Returns None for the borderline band (and for
+    jobs listing no required skills), which Gemini decides.
+
+    APPLY: every required skill held and local fit >= APPLY_MIN_FIT.
+    NOT_READY: required skill coverage <= NOT_READY_MAX_COVERAGE.
+    """
+    required_skills = job.get("required_skills") or []
+    if not required_skills:
+        return None
+
+    features = get_features(profile)
+    entry = index_entry(job)
+    student_bits = entry["vocabulary"].bitset(features["skills"])
+    required_coverage = coverage(entry["required_mask"], student_bits)
+    preferred_coverage = coverage(entry["preferred_mask"], student_bits) if entry["preferred_mask"] else 1.0
+
+    scores = score_batch(
+        build_feature_columns([features], required_skills),
+        job.get("role_type", "SDE"),
+        required_skills
+    )
+    platform_scores = {platform: int(scores[platform][0]) for platform in PLATFORM_LABELS}
+    fit = int(round(
+        required_coverage * REQUIRED_FIT_WEIGHT
+        + preferred_coverage * PREFERRED_FIT_WEIGHT
+        + int(scores["overall"][0]) / 100 * PLATFORM_FIT_WEIGHT
+    ))
+
+    if required_coverage == 1.0 and fit >= APPLY_MIN_FIT:
+        decision = "APPLY"
+    elif required_coverage <= NOT_READY_MAX_COVERAGE:
+        decision = "NOT_READY"
+    else:
+        return None
+
+    matched, missing = match_skills(required_skills, features["skills"], entry["vocabulary"])
+    _, missing_preferred = match_skills(job.get("preferred_skills") or [], features["skills"], entry["vocabulary"])
+    return _build_result(decision, fit, job, matched, missing, missing_preferred, platform_scores)
+
+
+def _build_result(
+    decision: str,
+    fit: int,
+    job: dict,
+    matched: List[str],
+    missing: List[str],
+    missing_preferred: List[str],
+    platform_scores: Dict[str, int]
+) -> Dict:
+    """Strengths, gaps, advice and action items from the local scores."""
+    title = job.get("title") or "this role"
+    required_count = len(matched) + len(missing)
+
+    strengths = []
+    if matched:
+        strengths.append({
+            "category": "Skills",
+            "detail": f"Has {len(matched)} of {required_count} required skills: {', '.join(matched)}",
+            "impact": "High" if not missing else "Medium"
+        })
+    for platform, (label, description) in PLATFORM_LABELS.items():
+        if platform_scores[platform] >= 60:
+            strengths.append({
+                "category": label,
+                "detail": f"{description} {platform_scores[platform]}/100",
+                "impact": "High" if platform_scores[platform] >= 80 else "Medium"
+            })
+
+    skill_gaps = [
+        {"skill": skill, "importance": "Required", "current_level": "None", "required_level": "Working knowledge"}
+        for skill in missing
+    ] + [
+        {"skill": skill, "importance": "Preferred", "current_level": "None", "required_level": "Familiarity"}
+        for skill in missing_preferred
+    ]
+
+    if decision == "APPLY":
+        recommendation = (
+            f"You have every required skill for {title}. "
+            "Apply now and highlight projects that use the required stack."
+        )
+        action_items = [{
+            "priority": "High",
+            "action": f"Apply to {title}",
+            "reason": "You meet all required skills",
+            "estimated_time": "Today"
+        }]
+        action_items += [
+            {"priority": "Low", "action": f"Learn {skill}", "reason": "Preferred skill for this role", "estimated_time": "1-2 weeks"}
+            for skill in missing_preferred[:3]
+        ]
+    else:
+        recommendation = (
+            f"You currently have {len(matched)} of {required_count} required skills for {title}. "
+            "Build the missing fundamentals with hands-on projects before applying."
+        )
+        action_items = [
+            {"priority": "High", "action": f"Learn {skill}", "reason": f"Required for {title}", "estimated_time": "2-4 weeks"}
+            for skill in missing[:5]
+        ]
+
+    return {
+        "fit_percentage": fit,
+        "decision": decision,
+        "decision_message": DECISION_MESSAGES[decision],
+        "strengths": strengths,
+        "skill_gaps": skill_gaps,
+        "ai_recommendation": recommendation,
+        "action_items": action_items,
+        "source": "rules"
+    }
+
+
+def get_cached_eligibility(student_id: str, job_id: str, fingerprint: str, client=None) -> Optional[Dict]:
+    """Stored result for the pair, or None if missing or computed from other data."""
+    client = client or supabase
+    response = (
+        client.table("eligibility_checks")
+        .select("result, fingerprint")
+        .eq("student_id", student_id)
+        .eq("job_id", job_id)
+        .execute()
+    )
+    if not response.data or response.data[0]["fingerprint"] != fingerprint:
+        return None
+    return response.data[0]["result"]
+
+
+def store_eligibility(student_id: str, job_id: str, fingerprint: str, result: Dict, client=None):
+    """Persist a result, replacing any earlier one for the pair."""
+    client = client or supabase
+    client.table("eligibility_checks").upsert({
+        "student_id": student_id,
+        "job_id": job_id,
+        "fingerprint": fingerprint,
+        "result": result,
+        "updated_at": datetime.utcnow().isoformat()
+    }, on_conflict="student_id,job_id").execute()
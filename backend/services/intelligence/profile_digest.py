@@ -0,0 +1,267 @@
+"""
+Profile Digest - Compact, deterministic profile summaries for AI prompts.
+
+Prompts used to embed the raw leetcode_data / github_data / ai_analysis
+JSON: up to 20 full repository records, scraper metadata and
+indentation, most of it irrelevant to the question asked. A digest keeps
+only what the model needs:
+
+- key platform metrics (solved counts, contest rating, stars, activity)
+- the most relevant repositories, ranked by overlap with the job's
+  skills, then stars
+- skills normalized through the skill taxonomy, plus the job's matched
+  and missing required skills when a job is given
+
+The same profile and job always produce the same digest, and the digest
+is shrunk step by step (shorter descriptions, fewer repos, fewer skills)
+until its serialized form fits the token budget.
+
+Platform data comes in two layouts: the scrapers' standard response
+(profile_data / activity_metrics) and the flat layout the platform
+scorers read (problems_solved, statistics, repositories). Both are read.
+"""
+
+import json
+from typing import Dict, List, Optional
+from services.matching.skill_taxonomy import SkillVocabulary, display_names, match_skills
+
+# Token budget for a digest embedded in a prompt (~4 characters per token)
+DEFAULT_TOKEN_BUDGET = 400
+CHARS_PER_TOKEN = 4
+
+MAX_REPOS = 5
+MAX_LANGUAGES = 8
+MAX_REPO_TOPICS = 4
+REPO_DESCRIPTION_CHARS = 120
+SUMMARY_CHARS = 300
+MAX_STRENGTHS = 3
+MAX_EXPERIENCE = 3
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def digest_text(digest: Dict) -> str:
+    """Serialized form embedded in prompts: compact JSON, no whitespace."""
+    return json.dumps(digest, separators=(",", ":"), ensure_ascii=False)
+
+
+def _first(*values):
+    for value in values:
+        if value is not None:
+            return value
+    return None
+
+
+def _truncate(text: Optional[str], limit: int) -> Optional[str]:
+    if not text:
+        return None
+    text = " ".join(str(text).split())
+    return text if len(text) <= limit else text[:limit - 1].rstrip() + "…"
+
+
+def _compact(record: Dict) -> Dict:
+    """Drop empty values (None, "", [], {}); zeros and False are kept."""
+    return {key: value for key, value in record.items() if value is not None and value != "" and value != [] and value != {}}
+
+
+def leetcode_metrics(data: Dict) -> Dict:
+    if not data:
+        return {}
+    profile = data.get("profile_data") or {}
+    activity = data.get("activity_metrics") or {}
+    problems = data.get("problems_solved") or {}
+
+    return _compact({
+        "solved": _first(problems.get("total"), profile.get("total_solved"), data.get("total_solved")),
+        "easy": _first(problems.get("easy"), activity.get("easy_solved"), data.get("easy_solved")),
+        "medium": _first(problems.get("medium"), activity.get("medium_solved"), data.get("medium_solved")),
+        "hard": _first(problems.get("hard"), activity.get("hard_solved"), data.get("hard_solved")),
+        "contest_rating": _first(profile.get("contest_rating"), data.get("contest_rating")) or None,
+        "ranking": _first(profile.get("ranking"), data.get("ranking")) or None,
+    })
+
+
+def github_repositories(data: Dict) -> List[Dict]:
+    """Repositories in one shape: name, language(s), topics, stars, description."""
+    if not data:
+        return []
+    activity = data.get("activity_metrics") or {}
+    repos = _first(activity.get("top_repositories"), data.get("repositories")) or []
+
+    normalized = []
+    for repo in repos:
+        languages = [lang.get("name") for lang in repo.get("languages", []) if lang.get("name")]
+        if repo.get("language") and repo["language"] not in languages:
+            languages.insert(0, repo["language"])
+        normalized.append({
+            "name": repo.get("name") or "",
+            "languages": languages,
+            "topics": list(repo.get("topics") or [])[:MAX_REPO_TOPICS],
+            "stars": repo.get("stars") or repo.get("stargazers_count") or 0,
+            "description": repo.get("description"),
+        })
+    return normalized
+
+
+def rank_repositories(repos: List[Dict], job_skills: Optional[List[str]] = None) -> List[Dict]:
+    """Most relevant first: job skills covered by languages + topics, then stars, then name."""
+    vocabulary = SkillVocabulary(job_skills)
+    job_bits = vocabulary.bitset(job_skills)
+
+    def relevance(repo: Dict) -> int:
+        return (vocabulary.bitset(repo["languages"] + repo["topics"]) & job_bits).bit_count()
+
+    return sorted(repos, key=lambda repo: (-relevance(repo), -repo["stars"], repo["name"]))
+
+
+def github_metrics(data: Dict) -> Dict:
+    if not data:
+        return {}
+    profile = data.get("profile_data") or {}
+    activity = data.get("activity_metrics") or {}
+    stats = data.get("statistics") or {}
+
+    # languages_used comes from a set (no stable order); top_languages is ranked by use
+    if activity.get("languages_used"):
+        languages = sorted(activity["languages_used"])
+    else:
+        languages = list(stats.get("top_languages") or [])
+
+    return _compact({
+        "repos": _first(profile.get("repos_count"), data.get("public_repos")),
+        "followers": _first(profile.get("followers"), data.get("followers")),
+        "stars": _first(activity.get("total_stars"), stats.get("total_stars")),
+        "forks": activity.get("total_forks"),
+        "active_repos_30d": _first(activity.get("recent_activity_30d"), stats.get("active_repos")),
+        "commits_30d": (stats.get("recent_activity") or {}).get("commits_last_30_days"),
+        "languages": languages[:MAX_LANGUAGES],
+        "has_tests": activity.get("has_tests"),
+        "has_ci": activity.get("has_ci_cd"),
+    })
+
+
+def linkedin_summary(data: Dict) -> Dict:
+    if not data:
+        return {}
+    experience = []
+    for entry in (data.get("experience") or [])[:MAX_EXPERIENCE]:
+        if isinstance(entry, dict):
+            entry = " at ".join(part for part in (entry.get("title"), entry.get("company")) if part)
+        if entry:
+            experience.append(_truncate(entry, 80))
+
+    return _compact({
+        "headline": _truncate(data.get("headline"), 100),
+        "experience": experience,
+        "certifications": len(data.get("certifications") or []) or None,
+        "education": bool(data.get("education")) or None,
+    })
+
+
+def assessment_summary(analysis: Dict) -> Dict:
+    if not analysis:
+        return {}
+    return _compact({
+        "skill_level": analysis.get("skill_level"),
+        "coding_proficiency": analysis.get("coding_proficiency"),
+        "summary": _truncate(analysis.get("overall_assessment"), SUMMARY_CHARS),
+        "strengths": [_truncate(s, 100) for s in (analysis.get("strengths") or [])[:MAX_STRENGTHS] if s],
+    })
+
+
+def _repo_entry(repo: Dict, description_chars: int) -> Dict:
+    return _compact({
+        "name": repo["name"],
+        "languages": repo["languages"][:3],
+        "topics": repo["topics"],
+        "stars": repo["stars"],
+        "description": _truncate(repo["description"], description_chars) if description_chars else None,
+    })
+
+
+def build_profile_digest(profile: Dict, job: Optional[Dict] = None, token_budget: int = DEFAULT_TOKEN_BUDGET) -> Dict:
+    """
+    Digest of a student_profiles row (or any dict with leetcode_data /
+    github_data / linkedin_data / ai_analysis / extracted_skills) for a
+    prompt, optionally focused on a job.
+    """
+    linkedin_data = profile.get("linkedin_data") or {}
+    leetcode_skills = ((profile.get("leetcode_data") or {}).get("activity_metrics") or {}).get("skills") or []
+    skills = display_names(
+        list(profile.get("extracted_skills") or []) + list(linkedin_data.get("skills") or []) + list(leetcode_skills)
+    )
+
+    job_skills = []
+    skill_match = {}
+    if job:
+        job_skills = list(job.get("required_skills") or []) + list(job.get("preferred_skills") or [])
+        vocabulary = SkillVocabulary(job_skills)
+        job_bits = vocabulary.bitset(job_skills)
+        matched, missing = match_skills(job.get("required_skills") or [], skills, vocabulary)
+        skill_match = _compact({"matched": matched, "missing": missing})
+        # Job-relevant skills first when the list has to be cut
+        skills.sort(key=lambda skill: 0 if vocabulary.bitset([skill]) & job_bits else 1)
+
+    repos = rank_repositories(github_repositories(profile.get("github_data") or {}), job_skills)
+    github = github_metrics(profile.get("github_data") or {})
+    assessment = assessment_summary(profile.get("ai_analysis") or {})
+
+    # Shrink steps, tried in order until the digest fits the budget
+    limits = {"repos": MAX_REPOS, "description": REPO_DESCRIPTION_CHARS, "skills": len(skills), "strengths": True, "summary": True}
+    steps = [
+        {"description": 60},
+        {"repos": 3},
+        {"description": 0},
+        {"strengths": False},
+        {"repos": 1},
+        {"skills": 20},
+        {"summary": False},
+        {"repos": 0},
+        {"skills": 10},
+    ]
+
+    def render() -> Dict:
+        digest = {"skills": skills[:limits["skills"]]}
+        if skill_match:
+            digest["required_skills"] = skill_match
+        if assessment:
+            digest["assessment"] = _compact({
+                **assessment,
+                "summary": assessment.get("summary") if limits["summary"] else None,
+                "strengths": assessment.get("strengths") if limits["strengths"] else None,
+            })
+        digest["leetcode"] = leetcode_metrics(profile.get("leetcode_data") or {})
+        if github:
+            digest["github"] = _compact({
+                **github,
+                "top_repos": [_repo_entry(repo, limits["description"]) for repo in repos[:limits["repos"]]],
+            })
+        digest["linkedin"] = linkedin_summary(linkedin_data)
+        return _compact(digest)
+
+    digest = render()
+    for step in steps:
+        if estimate_tokens(digest_text(digest)) <= token_budget:
+            break
+        limits.update(step)
+        digest = render()
+    return digest
+
+
+def profile_digest_text(profile: Dict, job: Optional[Dict] = None, token_budget: int = DEFAULT_TOKEN_BUDGET) -> str:
+    """Serialized digest, ready to embed in a prompt."""
+    return digest_text(build_profile_digest(profile, job, token_budget))
+
+
+def job_digest(job: Dict, description_chars: int = 600) -> Dict:
+    """The job fields prompts use, with the description trimmed."""
+    return _compact({
+        "title": job.get("title"),
+        "role_type": job.get("role_type"),
+        "required_skills": job.get("required_skills") or [],
+        "preferred_skills": job.get("preferred_skills") or [],
+        "experience_required": job.get("experience_required"),
+        "description": _truncate(job.get("description"), description_chars),
+    })
@@ -1,10 +1,10 @@
-import json
 import logging
 import google.generativeai as genai
 from models.schemas import RejectionFeedback
 from services.intelligence.feature_flags import feature_flags
 from services.intelligence.ai_orchestrator import AIOrchestrator
 from services.intelligence.cost_protector import cost_protector
+from services.intelligence.profile_digest import digest_text
 
 logger = logging.getLogger("sudhee-ai-intelligence")
 
@@ -32,10 +32,10 @@ async def generate_ai_rejection(
     You are a career coach giving empathetic but professional feedback to a rejected candidate.
     
     Job Description:
-    {json.dumps(job_data)}
+    {digest_text(job_data)}
     
     Candidate Profile:
-    {json.dumps(student_profile)}
+    {digest_text(student_profile)}
     
     Return STRICT JSON with these fields:
     - reason (human readable explanation)
@@ -2,75 +2,105 @@
 Roadmap Engine - Generates personalized learning roadmaps for skill gaps.
 
 Uses Gemini AI to create structured learning paths with resources and timelines.
+
+The Gemini output depends only on the skill-gap signature: the sorted
+canonical missing skills, role type, the student's skill level and the
+job's experience band. Students sharing a gap share one roadmap
+template, cached in process and in the roadmap_templates table. Each
+request only layers the personal part (fit percentages, dates, student
+and job) over a copy of the template.
 """
 
+import asyncio
+import copy
+import json
 import logging
-from typing import List, Dict
+import re
+import time
+from collections import OrderedDict
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
-import google.generativeai as genai
+from utils.supabase import supabase
+from utils.json_stream import JsonSectionStream
+from config.settings import settings
+from services.intelligence.ai_client import ai_client
+from services.matching.fingerprint import content_hash
+from services.matching.job_index import match_percentage
+from services.matching.skill_taxonomy import SkillVocabulary, canonical_keys, display_names
 
 logger = logging.getLogger("sudhee-ai-intelligence")
 
-async def generate_learning_roadmap(
-    student_profile: dict,
-    job_requirements: dict,
-    missing_skills: List[str],
-    gemini_api_key: str
-) -> dict:
+# Bump when the template prompt or layout changes so every template is regenerated
+ROADMAP_TEMPLATE_VERSION = 1
+
+# Templates kept in process (most recently used)
+TEMPLATE_MEMORY_SIZE = 256
+
+SKILL_LEVELS = ("Beginner", "Intermediate", "Advanced", "Expert")
+
+EXPERIENCE_BAND_LABELS = {
+    "entry": "Entry-level (0-1 years)",
+    "junior": "Junior (2-4 years)",
+    "senior": "Senior (5+ years)",
+}
+
+# Array sections streamed one entry at a time
+STREAMED_LIST_SECTIONS = ("learning_phases", "skill_deep_dives")
+
+# signature -> (template, cached at); never mutated - personalize_roadmap works on a copy
+_templates: "OrderedDict[str, Tuple[Dict, float]]" = OrderedDict()
+# signature -> template being generated (a task, or the future of a streaming request)
+_pending: Dict[str, asyncio.Future] = {}
+
+
+def experience_band(experience_required: Optional[str]) -> str:
+    """Coarse band of a free-text requirement such as "0-2 years" or "5+ years"."""
+    text = (experience_required or "").lower()
+    years = re.search(r"\d+", text)
+    if years:
+        first = int(years.group())
+        return "entry" if first <= 1 else "junior" if first <= 4 else "senior"
+    if any(word in text for word in ("senior", "lead", "principal", "staff")):
+        return "senior"
+    return "entry"
+
+
+def roadmap_context(student_profile: dict, job_requirements: dict, missing_skills: List[str]) -> Dict:
     """
-    Generate a personalized learning roadmap to bridge skill gaps.
-    
-    Args:
-        student_profile: Student's complete profile data
-        job_requirements: Target job requirements
-        missing_skills: List of skills the student needs to acquire
-        gemini_api_key: Gemini API key
-    
-    Returns:
-        Structured roadmap with phases, resources, and timeline
+    The normalized inputs a roadmap template depends on. Missing skills
+    use canonical names, sorted by canonical key.
     """
-    
-    if not gemini_api_key:
-        raise Exception("Gemini API key required for roadmap generation")
-    
-    try:
-        genai.configure(api_key=gemini_api_key)
-        model = genai.GenerativeModel('gemini-pro')
-        
-        # Extract student context
-        current_skills = student_profile.get("extracted_skills", [])
-        ai_analysis = student_profile.get("ai_analysis", {})
-        skill_level = ai_analysis.get("skill_level", "Beginner")
-        coding_proficiency = ai_analysis.get("coding_proficiency", "Beginner")
-        
-        # Platform data for context
-        leetcode_data = student_profile.get("leetcode_data", {})
-        github_data = student_profile.get("github_data", {})
-        
-        leetcode_total = leetcode_data.get("problems_solved", {}).get("total", 0)
-        github_repos = github_data.get("public_repos", 0)
-        
-        import json
-        
-        prompt = f"""
-You are a technical career coach creating a personalized learning roadmap.
+    skill_level = str((student_profile.get("ai_analysis") or {}).get("skill_level") or "").title()
+    return {
+        "missing_skills": display_names(missing_skills),
+        "role_type": job_requirements.get("role_type") or "SDE",
+        "skill_level": skill_level if skill_level in SKILL_LEVELS else "Beginner",
+        "experience_band": experience_band(job_requirements.get("experience_required")),
+    }
+
+
+def roadmap_signature(context: Dict) -> str:
+    """Template cache key; skills enter as canonical keys, so spelling never splits the cache."""
+    return content_hash({
+        "version": ROADMAP_TEMPLATE_VERSION,
+        **context,
+        "missing_skills": canonical_keys(context["missing_skills"])
+    })
+
+
+def build_template_prompt(context: Dict) -> str:
+    return f"""
+You are a technical career coach creating a learning roadmap.
 
 **Student Context:**
-- Current Skill Level: {skill_level}
-- Coding Proficiency: {coding_proficiency}
-- Current Skills: {json.dumps(current_skills)}
-- LeetCode Problems: {leetcode_total}
-- GitHub Repos: {github_repos}
-
-**Target Job:**
-- Title: {job_requirements.get('title', 'Software Engineer')}
-- Required Skills: {json.dumps(job_requirements.get('required_skills', []))}
-- Preferred Skills: {json.dumps(job_requirements.get('preferred_skills', []))}
-- Experience Level: {job_requirements.get('experience_required', 'Entry-level')}
-- Role Type: {job_requirements.get('role_type', 'SDE')}
+- Current Skill Level: {context['skill_level']}
+
+**Target Role:**
+- Role Type: {context['role_type']}
+- Experience Level: {EXPERIENCE_BAND_LABELS[context['experience_band']]}
 
 **Skills to Acquire:**
-{json.dumps(missing_skills)}
+{json.dumps(context['missing_skills'])}
 
 **Task:** Create a comprehensive, actionable learning roadmap.
 
@@ -204,26 +234,250 @@ CRITICAL RULES:
 7. Pure JSON only, no markdown formatting
 """
 
-        response = model.generate_content(prompt)
-        ai_text = response.text.strip()
-        
-        # Clean response
-        import re
-        ai_text = re.sub(r'^```json\s*', '', ai_text)
-        ai_text = re.sub(r'\s*```$', '', ai_text)
+
+def _recall(signature: str) -> Optional[Dict]:
+    cached = _templates.get(signature)
+    if cached is None or time.monotonic() - cached[1] > settings.ROADMAP_TEMPLATE_TTL_DAYS * 86400:
+        return None
+    _templates.move_to_end(signature)
+    return cached[0]
+
+
+def _remember(signature: str, template: Dict):
+    _templates[signature] = (template, time.monotonic())
+    _templates.move_to_end(signature)
+    while len(_templates) > TEMPLATE_MEMORY_SIZE:
+        _templates.popitem(last=False)
+
+
+def _load_template(signature: str) -> Optional[Dict]:
+    """Stored template for a signature, if present and younger than the TTL."""
+    if not supabase:
+        return None
+    fresh_after = (datetime.utcnow() - timedelta(days=settings.ROADMAP_TEMPLATE_TTL_DAYS)).isoformat()
+    response = (
+        supabase.table("roadmap_templates")
+        .select("template")
+        .eq("signature", signature)
+        .gte("created_at", fresh_after)
+        .execute()
+    )
+    return response.data[0]["template"] if response.data else None
+
+
+def _store_template(signature: str, context: Dict, template: Dict):
+    if not supabase:
+        return
+    supabase.table("roadmap_templates").upsert({
+        "signature": signature,
+        **context,
+        "template": template,
+        "created_at": datetime.utcnow().isoformat()
+    }, on_conflict="signature").execute()
+
+
+async def _generate_template(context: Dict, signature: str, gemini_api_key: str) -> Dict:
+    ai_text = await ai_client.generate_text(build_template_prompt(context), api_key=gemini_api_key)
+    
+    # Clean response
+    ai_text = re.sub(r'^```json\s*', '', ai_text)
+    ai_text = re.sub(r'\s*```$', '', ai_text)
+    
+    template = json.loads(ai_text)
+    try:
+        _store_template(signature, context, template)
+    except Exception as e:
+        logger.warning(f"Failed to store roadmap template {signature}: {str(e)}")
+    
+    logger.info(f"Generated roadmap template {signature}: {len(context['missing_skills'])} skills")
+    return template
+
+
+async def get_roadmap_template(context: Dict, gemini_api_key: str) -> Dict:
+    """
+    Template for a roadmap context: from memory, then the database, then
+    Gemini. Concurrent misses for one signature share a single Gemini call.
+    """
+    signature = roadmap_signature(context)
+    
+    template = _recall(signature)
+    if template is not None:
+        return template
+    
+    template = _load_template(signature)
+    if template is None:
+        if not gemini_api_key:
+            raise Exception("Gemini API key required for roadmap generation")
+        task = _pending.get(signature)
+        if task is None:
+            task = asyncio.ensure_future(_generate_template(context, signature, gemini_api_key))
+            _pending[signature] = task
+            task.add_done_callback(lambda done: _pending.get(signature) is done and _pending.pop(signature))
+        template = await asyncio.shield(task)
+    
+    _remember(signature, template)
+    return template
+
+
+def personal_fit(student_profile: dict, job_requirements: dict) -> Tuple[int, int]:
+    """(current, target) job match percentage; target assumes every required skill is learned."""
+    vocabulary = SkillVocabulary()
+    required_mask = sum(bit for _, bit in vocabulary.unique(job_requirements.get("required_skills")))
+    preferred_mask = sum(bit for _, bit in vocabulary.unique(job_requirements.get("preferred_skills")))
+    student_bits = vocabulary.bitset(student_profile.get("extracted_skills"))
+    current_fit = match_percentage(required_mask, preferred_mask, student_bits)
+    target_fit = match_percentage(required_mask, preferred_mask, student_bits | required_mask)
+    return current_fit, max(target_fit, current_fit)
+
+
+def _personal_section(key: str, value, fit: Tuple[int, int]):
+    """A template section with the student's fit applied (a copy when changed)."""
+    if key == "current_fit_analysis" and isinstance(value, dict):
+        return {**value, "current_match_percentage": fit[0]}
+    if key == "target_outcome" and isinstance(value, dict):
+        return {**value, "target_match_percentage": fit[1]}
+    return value
+
+
+def personalize_roadmap(template: Dict, student_profile: dict, job_requirements: dict, signature: str = None) -> Dict:
+    """
+    Copy of a template with the personal layer applied: current and
+    target fit for this student and job, dates, student and job title.
+    """
+    fit = personal_fit(student_profile, job_requirements)
+    roadmap = {key: _personal_section(key, copy.deepcopy(value), fit) for key, value in template.items()}
+    
+    # Add metadata
+    roadmap["generated_at"] = datetime.utcnow().isoformat()
+    roadmap["student_id"] = student_profile.get("user_id")
+    roadmap["job_title"] = job_requirements.get("title")
+    roadmap["template_signature"] = signature
+    
+    # Calculate end date
+    total_weeks = roadmap["current_fit_analysis"]["estimated_learning_time_weeks"]
+    end_date = datetime.utcnow() + timedelta(weeks=total_weeks)
+    roadmap["estimated_completion_date"] = end_date.isoformat()
+    
+    return roadmap
+
+
+def _section_event(key: str, index: Optional[int], value) -> Dict:
+    event = {"event": "section", "section": key, "data": value}
+    if index is not None:
+        event["index"] = index
+    return event
+
+
+async def iter_roadmap_events(
+    student_profile: dict,
+    job_requirements: dict,
+    missing_skills: List[str],
+    gemini_api_key: str
+):
+    """
+    Streaming variant of generate_learning_roadmap. Yields:
+    
+    - start: local current / target fit and the skills to learn, before any AI work
+    - section: one per top-level roadmap section as soon as it parses;
+      learning_phases and skill_deep_dives arrive one entry at a time
+      (with `index`)
+    - final: the complete personalized roadmap
+    
+    A cached template is replayed as the same events; otherwise Gemini's
+    streamed output is parsed incrementally and stored as the template
+    once complete. While streaming, the signature is registered in
+    _pending, so concurrent requests for the same gap wait for this
+    template instead of calling Gemini again.
+    """
+    context = roadmap_context(student_profile, job_requirements, missing_skills)
+    signature = roadmap_signature(context)
+    fit = personal_fit(student_profile, job_requirements)
+    
+    template = _recall(signature)
+    if template is None:
+        template = _load_template(signature)
+    
+    yield {
+        "event": "start",
+        "current_fit": fit[0],
+        "target_fit": fit[1],
+        "missing_skills": context["missing_skills"],
+        "cached": template is not None
+    }
+    
+    if template is None and signature in _pending:
+        template = await asyncio.shield(_pending[signature])
+    
+    if template is not None:
+        for key, value in template.items():
+            if key in STREAMED_LIST_SECTIONS:
+                for index, item in enumerate(value or []):
+                    yield _section_event(key, index, item)
+            else:
+                yield _section_event(key, None, _personal_section(key, value, fit))
+    else:
+        if not gemini_api_key:
+            raise Exception("Gemini API key required for roadmap generation")
         
-        roadmap = json.loads(ai_text)
+        pending = asyncio.get_running_loop().create_future()
+        pending.add_done_callback(lambda f: f.cancelled() or f.exception())  # no "never retrieved" warning
+        _pending[signature] = pending
         
-        # Add metadata
-        roadmap["generated_at"] = datetime.utcnow().isoformat()
-        roadmap["student_id"] = student_profile.get("user_id")
-        roadmap["job_title"] = job_requirements.get("title")
+        try:
+            template = {key: [] for key in STREAMED_LIST_SECTIONS}
+            parser = JsonSectionStream(STREAMED_LIST_SECTIONS)
+            async for chunk in ai_client.stream_text(build_template_prompt(context), api_key=gemini_api_key):
+                for key, index, value in parser.feed(chunk):
+                    if index is None:
+                        template[key] = value
+                        yield _section_event(key, None, _personal_section(key, value, fit))
+                    else:
+                        template[key].append(value)
+                        yield _section_event(key, index, value)
+            
+            if not parser.done:
+                raise Exception("Roadmap response ended before the JSON object was complete")
+            
+            try:
+                _store_template(signature, context, template)
+            except Exception as e:
+                logger.warning(f"Failed to store roadmap template {signature}: {str(e)}")
+            logger.info(f"Streamed roadmap template {signature}: {len(context['missing_skills'])} skills")
+            pending.set_result(template)
+        finally:
+            if _pending.get(signature) is pending:
+                del _pending[signature]
+            if not pending.done():
+                pending.set_exception(Exception("Roadmap stream ended before the template was complete"))
+    
+    _remember(signature, template)
+    yield {"event": "final", "roadmap": personalize_roadmap(template, student_profile, job_requirements, signature)}
+
+
+async def generate_learning_roadmap(
+    student_profile: dict,
+    job_requirements: dict,
+    missing_skills: List[str],
+    gemini_api_key: str
+) -> dict:
+    """
+    Generate a personalized learning roadmap to bridge skill gaps.
+    
+    Args:
+        student_profile: Student's complete profile data
+        job_requirements: Target job requirements
+        missing_skills: List of skills the student needs to acquire
+        gemini_api_key: Gemini API key (only needed when the template is not cached)
+    
+    Returns:
+        Structured roadmap with phases, resources, and timeline
+    """
+    try:
+        context = roadmap_context(student_profile, job_requirements, missing_skills)
+        template = await get_roadmap_template(context, gemini_api_key)
+        roadmap = personalize_roadmap(template, student_profile, job_requirements, roadmap_signature(context))
         
-        # Calculate end date
         total_weeks = roadmap["current_fit_analysis"]["estimated_learning_time_weeks"]
-        end_date = datetime.utcnow() + timedelta(weeks=total_weeks)
-        roadmap["estimated_completion_date"] = end_date.isoformat()
-        
         logger.info(f"Generated roadmap: {total_weeks} weeks, {len(missing_skills)} skills")
         
         return roadmap
@@ -0,0 +1,225 @@
+"""
+Batch Scoring Engine - Vectorized platform scoring for many candidates.
+
+Mirrors calculate_leetcode_score, calculate_github_score,
+calculate_linkedin_score and calculate_overall_score from the ranking
+engine, but over columnar NumPy arrays. Every formula performs the same
+float64 operations in the same order as the scalar version, so results
+are identical.
+"""
+
+import logging
+from operator import itemgetter
+from typing import Dict, List
+import numpy as np
+from services.matching.skill_taxonomy import canonical_keys
+
+logger = logging.getLogger("sudhee-ai-intelligence")
+
+# Numeric feature columns (job-independent)
+NUMERIC_FEATURES = (
+    "leetcode_present",
+    "lc_total",
+    "lc_medium",
+    "lc_hard",
+    "lc_contest_rating",
+    "github_present",
+    "gh_public_repos",
+    "gh_total_stars",
+    "gh_commits_30d",
+    "gh_active_repos",
+    "gh_top_language_count",
+    "linkedin_present",
+    "li_skill_count",
+    "li_experience_count",
+    "li_certification_count",
+    "li_has_headline",
+    "li_has_education",
+)
+
+
+def extract_platform_features(profile: dict) -> Dict:
+    """
+    Reduce a student profile's raw platform JSON to the numeric features
+    and canonical skill keys the platform scorers read.
+    """
+    leetcode_data = profile.get("leetcode_data") or {}
+    github_data = profile.get("github_data") or {}
+    linkedin_data = profile.get("linkedin_data") or {}
+
+    problems = leetcode_data.get("problems_solved") or {}
+    stats = github_data.get("statistics", {}) if github_data else {}
+    recent_activity = stats.get("recent_activity", {})
+
+    # Tech stack: languages and topics of the first 20 repos
+    tech_stack = []
+    for repo in github_data.get("repositories", [])[:20]:
+        tech_stack.extend(lang.get("name", "") for lang in repo.get("languages", []))
+        tech_stack.extend(repo.get("topics", []))
+
+    linkedin_skills = canonical_keys(linkedin_data.get("skills", []))
+
+    return {
+        "leetcode_present": 1 if leetcode_data and leetcode_data.get("problems_solved") else 0,
+        "lc_total": problems.get("total", 0),
+        "lc_medium": problems.get("medium", 0),
+        "lc_hard": problems.get("hard", 0),
+        "lc_contest_rating": leetcode_data.get("contest_rating", 0) or 0,
+        "github_present": 1 if github_data else 0,
+        "gh_public_repos": github_data.get("public_repos", 0),
+        "gh_total_stars": stats.get("total_stars", 0),
+        "gh_commits_30d": recent_activity.get("commits_last_30_days", 0),
+        "gh_active_repos": stats.get("active_repos", 0),
+        "gh_top_language_count": len(stats.get("top_languages", [])),
+        "gh_tech_stack": canonical_keys(tech_stack),
+        "linkedin_present": 1 if linkedin_data else 0,
+        "li_skills": linkedin_skills,
+        "li_skill_count": len(linkedin_skills),
+        "li_experience_count": len(linkedin_data.get("experience", [])),
+        "li_certification_count": len(linkedin_data.get("certifications", [])),
+        "li_has_headline": 1 if linkedin_data.get("headline") else 0,
+        "li_has_education": 1 if linkedin_data.get("education") else 0,
+    }
+
+
+def _match_counts(token_lists: List[List[str]], required: set) -> np.ndarray:
+    """Per-candidate count of tokens found in `required`, without a Python set op per row."""
+    lengths = np.fromiter((len(tokens) for tokens in token_lists), dtype=np.int64, count=len(token_lists))
+    if not required or lengths.sum() == 0:
+        return np.zeros(len(token_lists), dtype=np.int64)
+
+    flat = np.fromiter((t for tokens in token_lists for t in tokens), dtype=object, count=int(lengths.sum()))
+    owners = np.repeat(np.arange(len(token_lists)), lengths)
+    hits = np.isin(flat, np.array(sorted(required), dtype=object))
+    return np.bincount(owners[hits], minlength=len(token_lists))
+
+
+def build_feature_columns(records: List[Dict], required_skills: List[str] = None) -> Dict[str, np.ndarray]:
+    """
+    Turn feature records into columnar arrays, adding the job-dependent
+    skill match counts for `required_skills`.
+    """
+    getter = itemgetter(*NUMERIC_FEATURES)
+    matrix = np.array([getter(record) for record in records], dtype=np.float64).reshape(len(records), len(NUMERIC_FEATURES))
+    columns = {name: matrix[:, i] for i, name in enumerate(NUMERIC_FEATURES)}
+
+    required = set(canonical_keys(required_skills))
+    columns["required_count"] = np.full(len(records), len(required), dtype=np.float64)
+    columns["gh_skill_matches"] = _match_counts([r["gh_tech_stack"] for r in records], required).astype(np.float64)
+    columns["li_skill_matches"] = _match_counts([r["li_skills"] for r in records], required).astype(np.float64)
+
+    return columns
+
+
+def _safe_ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator > 0)
+
+
+def batch_leetcode_scores(c: Dict[str, np.ndarray]) -> np.ndarray:
+    """Vectorized calculate_leetcode_score."""
+    total = c["lc_total"]
+    has_total = total > 0
+
+    score = np.minimum(50, (total / 500) * 50)
+    score = score + np.where(has_total, _safe_ratio(c["lc_medium"], total) * 12, 0)
+    score = score + np.where(has_total, _safe_ratio(c["lc_hard"], total) * 8, 0)
+
+    rating = c["lc_contest_rating"]
+    score = score + np.where(rating != 0, np.minimum(15, (rating / 2000) * 15), 0)
+
+    score = score + np.where(total >= 200, 5, 0)
+    score = score + np.where(total >= 300, 5, 0)
+    score = score + np.where(total >= 400, 5, 0)
+
+    scores = np.minimum(100, score).astype(np.int64)
+    return np.where(c["leetcode_present"] > 0, scores, 20)
+
+
+def batch_github_scores(c: Dict[str, np.ndarray], has_requirements: bool) -> np.ndarray:
+    """Vectorized calculate_github_score."""
+    repos = c["gh_public_repos"]
+
+    score = np.minimum(15, (repos / 20) * 15)
+    avg_stars = _safe_ratio(c["gh_total_stars"], repos)
+    score = score + np.where(repos > 0, np.minimum(15, (avg_stars / 10) * 15), 0)
+    score = score + np.minimum(15, (c["gh_commits_30d"] / 50) * 15)
+    score = score + np.minimum(10, (c["gh_active_repos"] / 10) * 10)
+
+    if has_requirements:
+        score = score + _safe_ratio(c["gh_skill_matches"], c["required_count"]) * 30
+    else:
+        score = score + 15
+
+    score = score + np.minimum(15, (c["gh_top_language_count"] / 5) * 15)
+
+    scores = np.minimum(100, score).astype(np.int64)
+    return np.where(c["github_present"] > 0, scores, 20)
+
+
+def batch_linkedin_scores(c: Dict[str, np.ndarray], has_requirements: bool) -> np.ndarray:
+    """Vectorized calculate_linkedin_score."""
+    if has_requirements:
+        score = (_safe_ratio(c["li_skill_matches"], c["required_count"])) * 40
+    else:
+        score = np.full(len(c["li_skill_count"]), 20.0)
+
+    score = score + np.minimum(30, c["li_experience_count"] * 10)
+    score = score + np.minimum(20, c["li_certification_count"] * 5)
+    score = score + np.where(c["li_has_headline"] > 0, 3, 0)
+    score = score + np.where(c["li_has_education"] > 0, 3, 0)
+    score = score + np.where(c["li_skill_count"] > 5, 4, 0)
+
+    scores = np.minimum(100, score).astype(np.int64)
+    return np.where(c["linkedin_present"] > 0, scores, 30)
+
+
+def batch_overall_scores(
+    leetcode: np.ndarray,
+    github: np.ndarray,
+    linkedin: np.ndarray,
+    weights: Dict[str, float]
+) -> np.ndarray:
+    """Vectorized calculate_overall_score for explicit weights."""
+    overall = (
+        leetcode * weights["leetcode"] +
+        github * weights["github"] +
+        linkedin * weights["linkedin"]
+    )
+    return np.round(overall).astype(np.int64)
+
+
+def score_batch(
+    columns: Dict[str, np.ndarray],
+    job_type: str = "SDE",
+    required_skills: List[str] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Compute all three platform scores plus the JOB_TYPE_WEIGHTS blend.
+
+    Returns:
+        Dict of int64 arrays: leetcode, github, linkedin, overall
+    """
+    from services.matching.ranking_engine import JOB_TYPE_WEIGHTS
+
+    # Blank-only lists (e.g. [""]) count as no requirements, as in the scalar scorers
+    has_requirements = bool(canonical_keys(required_skills))
+    weights = JOB_TYPE_WEIGHTS.get(job_type, JOB_TYPE_WEIGHTS["SDE"])
+
+    leetcode = batch_leetcode_scores(columns)
+    github = batch_github_scores(columns, has_requirements)
+    linkedin = batch_linkedin_scores(columns, has_requirements)
+
+    return {
+        "leetcode": leetcode,
+        "github": github,
+        "linkedin": linkedin,
+        "overall": batch_overall_scores(leetcode, github, linkedin, weights),
+    }
+
+
+def score_profiles_batch(profiles: List[dict], job: dict) -> Dict[str, np.ndarray]:
+    """Convenience wrapper: raw profiles in, score arrays out."""
+    required_skills = job.get("required_skills", [])
+    records = [extract_platform_features(profile) for profile in profiles]
+    columns = build_feature_columns(records, required_skills)
+    return score_batch(columns, job.get("role_type", "SDE"), required_skills)
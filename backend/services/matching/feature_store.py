@@ -0,0 +1,61 @@
+"""
+Feature Store - Precomputed per-student platform features.
+
+Whenever a profile's platform data is (re)extracted, a compact feature
+record is built from it and stored on student_profiles.platform_features:
+the numeric platform features the scorers read plus canonical skill
+keys (see skill_taxonomy). Ranking and job matching read this record
+instead of walking the raw leetcode_data / github_data / linkedin_data
+JSON on every request.
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict
+from utils.supabase import supabase
+from services.matching.batch_scoring import extract_platform_features
+from services.matching.skill_taxonomy import canonical_keys
+
+logger = logging.getLogger("sudhee-ai-intelligence")
+
+# Bump when the record layout or extraction rules change; older records are rebuilt on read
+FEATURE_VERSION = 2
+
+
+def build_features(profile: dict) -> Dict:
+    """
+    Build the feature record for a student_profiles row (or the update
+    about to be written to it).
+    """
+    return {
+        "version": FEATURE_VERSION,
+        **extract_platform_features(profile),
+        "skills": canonical_keys(profile.get("extracted_skills")),
+        "built_at": datetime.utcnow().isoformat()
+    }
+
+
+def get_features(profile: dict) -> Dict:
+    """
+    Feature record for a profile: the stored one when current, otherwise
+    built on the fly (rows written before the store existed).
+    """
+    stored = profile.get("platform_features")
+    if stored and stored.get("version") == FEATURE_VERSION:
+        return stored
+    return build_features(profile)
+
+
+def refresh_features(student_id: str, client=None) -> Dict:
+    """Rebuild and persist the feature record for one student."""
+    client = client or supabase
+    response = client.table("student_profiles").select("*").eq("user_id", student_id).execute()
+
+    if not response.data:
+        raise Exception("Student profile not found")
+
+    features = build_features(response.data[0])
+    client.table("student_profiles").update({"platform_features": features}).eq("user_id", student_id).execute()
+
+    logger.info(f"Refreshed platform features for student {student_id}")
+    return features
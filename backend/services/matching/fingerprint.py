@@ -0,0 +1,81 @@
+"""
+Fingerprints - Content hashes of the profile and job data a score depends on.
+
+A stored result is still valid as long as the fingerprint it was computed
+from matches the fingerprint of the current data.
+"""
+
+import hashlib
+import json
+from typing import Iterable
+
+# Bump when scoring formulas change so every stored result is recomputed
+SCORING_VERSION = 2
+
+# Profile fields the ranking path reads
+RANKING_PROFILE_FIELDS = (
+    "leetcode_data",
+    "github_data",
+    "linkedin_data",
+    "ai_analysis",
+    "extracted_skills",
+)
+
+# Job fields the ranking path reads ("job version")
+RANKING_JOB_FIELDS = (
+    "title",
+    "description",
+    "required_skills",
+    "preferred_skills",
+    "experience_required",
+    "role_type",
+)
+
+# Bump when the eligibility prompt or decision rules change
+ELIGIBILITY_VERSION = 2
+
+# Profile fields the eligibility check reads
+ELIGIBILITY_PROFILE_FIELDS = (
+    "extracted_skills",
+    "ai_analysis",
+    "leetcode_data",
+    "github_data",
+    "linkedin_data",
+)
+
+# Job fields the eligibility check reads
+ELIGIBILITY_JOB_FIELDS = (
+    "title",
+    "required_skills",
+    "preferred_skills",
+    "experience_required",
+)
+
+
+def content_hash(data) -> str:
+    """Deterministic hash of any JSON-serializable value."""
+    payload = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.md5(payload.encode()).hexdigest()
+
+
+def fields_fingerprint(record: dict, fields: Iterable[str]) -> str:
+    """Hash only the given fields of a record."""
+    return content_hash({field: record.get(field) for field in fields})
+
+
+def ranking_fingerprint(profile: dict, job: dict) -> str:
+    """Fingerprint of everything a candidate's ranking score is derived from."""
+    return content_hash({
+        "version": SCORING_VERSION,
+        "profile": fields_fingerprint(profile, RANKING_PROFILE_FIELDS),
+        "job": fields_fingerprint(job, RANKING_JOB_FIELDS),
+    })
+
+
+def eligibility_fingerprint(profile: dict, job: dict) -> str:
+    """Fingerprint of everything an eligibility check is derived from."""
+    return content_hash({
+        "version": ELIGIBILITY_VERSION,
+        "profile": fields_fingerprint(profile, ELIGIBILITY_PROFILE_FIELDS),
+        "job": fields_fingerprint(job, ELIGIBILITY_JOB_FIELDS),
+    })
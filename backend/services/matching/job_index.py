@@ -0,0 +1,307 @@
+"""
+Job Skill Index - In-process inverted index from skill id to job ids.
+
+Student job browsing only needs to score jobs that share at least one
+skill with the student. The index keeps a compact copy of every active
+job plus a skill -> job ids posting list, so a request touches only the
+postings for the student's skills and a heap picks the top matches.
+
+Freshness: jobs are created and closed both through this API and
+directly from the frontend, so the index pulls deltas by `updated_at`
+(every JOB_INDEX_SYNC_SECONDS) and rebuilds fully every
+JOB_INDEX_REBUILD_SECONDS to drop deleted rows. create_job also adds
+new postings immediately. Jobs that a sync or rebuild finds new or
+edited are queued in `changed` for job_matches to materialize; the
+first rebuild in a process queues jobs updated after the newest
+job_matches row, so postings inserted while no process was syncing are
+still materialized. Every load is paged by JOB_PAGE_SIZE rows (hosted
+PostgREST caps a response at 1000).
+
+Threads: the index is refreshed and read from worker threads
+(asyncio.to_thread) as well as the event loop. One refresh runs at a
+time, its database read happens outside the index lock, and every
+in-memory update or query holds the lock only briefly.
+"""
+
+import heapq
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+from utils.supabase import supabase
+from config.settings import settings
+from services.matching.skill_taxonomy import SkillVocabulary
+
+logger = logging.getLogger("sudhee-ai-intelligence")
+
+# Only what matching and the job list response read
+JOB_INDEX_COLUMNS = (
+    "id, title, company_name, location, job_type, required_skills, "
+    "preferred_skills, status, created_at, updated_at"
+)
+
+# Jobs read per round-trip (at most the PostgREST max-rows of 1000)
+JOB_PAGE_SIZE = 1000
+
+
+def match_percentage(required_mask: int, preferred_mask: int, student_bits: int) -> int:
+    """
+    Formula: 70 * required matched ratio + 30 * preferred matched ratio
+    (30 when the job lists no preferred skills).
+    """
+    required_count = required_mask.bit_count()
+    preferred_count = preferred_mask.bit_count()
+
+    required_match = ((required_mask & student_bits).bit_count() / required_count * 70) if required_count else 0
+    preferred_match = ((preferred_mask & student_bits).bit_count() / preferred_count * 30) if preferred_count else 30
+
+    return int(required_match + preferred_match)
+
+
+def match_job(job: Dict, student_bits: int) -> Dict:
+    """Match percentage and skill split of one indexed job for a student's skill bitset."""
+    return {
+        "job": job,
+        "match_percentage": match_percentage(job["required_mask"], job["preferred_mask"], student_bits),
+        "matched_skills": [skill for skill, bit in job["required_bits"] if bit & student_bits],
+        "missing_skills": [skill for skill, bit in job["required_bits"] if not bit & student_bits]
+    }
+
+
+def index_entry(job: Dict, vocabulary: Optional[SkillVocabulary] = None) -> Dict:
+    """
+    Compact indexed form of a jobs row (skill spellings plus bitsets in
+    `vocabulary`, a new one by default). The entry keeps its vocabulary:
+    take student bitsets from entry["vocabulary"].
+    """
+    vocabulary = vocabulary if vocabulary is not None else SkillVocabulary()
+    required = vocabulary.unique(job.get("required_skills"))
+    preferred = vocabulary.unique(job.get("preferred_skills"))
+    return {
+        "id": job["id"],
+        "title": job.get("title"),
+        "company_name": job.get("company_name"),
+        "location": job.get("location"),
+        "job_type": job.get("job_type"),
+        "created_at": job.get("created_at"),
+        "updated_at": job.get("updated_at"),
+        "required_skills": [skill for skill, _ in required],
+        "required_bits": required,
+        "required_mask": sum(bit for _, bit in required),
+        "preferred_mask": sum(bit for _, bit in preferred),
+        "vocabulary": vocabulary,
+    }
+
+
+def _bit_positions(bits: int):
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+def match_sort_key(match: Dict) -> Tuple[int, str, str]:
+    """Listing order (descending): match percentage, then newest, then id."""
+    job = match["job"]
+    return (match["match_percentage"], job.get("created_at") or "", job["id"])
+
+
+class JobSkillIndex:
+    """Active jobs plus skill id -> job ids postings (ids from the index's SkillVocabulary)."""
+
+    def __init__(self, client=None):
+        self.client = client
+        self.jobs: Dict[str, Dict] = {}
+        self.postings: Dict[int, Set[str]] = {}
+        self.vocabulary = SkillVocabulary()
+        self.changed: Dict[str, Dict] = {}
+        self.synced_through: Optional[str] = None
+        self.last_sync = 0.0
+        self.last_rebuild = 0.0
+        self._lock = threading.RLock()
+        self._refresh_lock = threading.Lock()
+
+    @property
+    def _client(self):
+        return self.client or supabase
+
+    # ── Maintenance ───────────────────────────────────────────
+    def add_job(self, job: Dict) -> Optional[Dict]:
+        """
+        Index (or re-index) a job and return its entry; non-active jobs
+        are removed instead (returns None).
+        """
+        with self._lock:
+            self.remove_job(job["id"])
+            if job.get("status", "active") != "active":
+                return None
+
+            entry = index_entry(job, self.vocabulary)
+            self.jobs[job["id"]] = entry
+
+            for position in _bit_positions(entry["required_mask"] | entry["preferred_mask"]):
+                self.postings.setdefault(position, set()).add(job["id"])
+            return entry
+
+    def remove_job(self, job_id: str):
+        with self._lock:
+            entry = self.jobs.pop(job_id, None)
+            if not entry:
+                return
+            for position in _bit_positions(entry["required_mask"] | entry["preferred_mask"]):
+                posting = self.postings.get(position)
+                if posting is not None:
+                    posting.discard(job_id)
+                    if not posting:
+                        del self.postings[position]
+
+    def _apply(
+        self,
+        rows: List[Dict],
+        previous: Optional[Dict[str, Dict]] = None,
+        newer_than: Optional[str] = None
+    ):
+        """
+        Index rows; with `previous` entries, queue new or edited jobs in
+        `changed`; with `newer_than`, queue jobs updated after it.
+        """
+        for row in rows:
+            prior = previous.get(row["id"]) if previous is not None else None
+            entry = self.add_job(row)
+            if previous is not None:
+                changed = prior is None or prior["updated_at"] != row.get("updated_at")
+            else:
+                changed = newer_than is not None and (row.get("updated_at") or "") > newer_than
+            if entry and changed:
+                self.changed[entry["id"]] = entry
+            updated_at = row.get("updated_at")
+            if updated_at and (self.synced_through is None or updated_at > self.synced_through):
+                self.synced_through = updated_at
+
+    def _materialized_through(self) -> str:
+        """computed_at of the newest job_matches row ("" when there is none)."""
+        response = (
+            self._client.table("job_matches")
+            .select("computed_at")
+            .order("computed_at", desc=True)
+            .limit(1)
+            .execute()
+        )
+        return response.data[0]["computed_at"] if response.data else ""
+
+    def _load_active_jobs(self) -> List[Dict]:
+        """Every active job, paged by id."""
+        rows, last_id = [], None
+        while True:
+            query = self._client.table("jobs").select(JOB_INDEX_COLUMNS).eq("status", "active")
+            if last_id is not None:
+                query = query.gt("id", last_id)
+            page = query.order("id").limit(JOB_PAGE_SIZE).execute().data or []
+            rows.extend(page)
+            if len(page) < JOB_PAGE_SIZE:
+                return rows
+            last_id = page[-1]["id"]
+
+    def _load_updated_jobs(self, since: Optional[str]) -> List[Dict]:
+        """Jobs updated at or after `since` (any status), paged by (updated_at, id)."""
+        rows, after = [], None
+        while True:
+            query = self._client.table("jobs").select(JOB_INDEX_COLUMNS)
+            if since:
+                # gte: rows sharing the boundary timestamp are re-applied, which is idempotent
+                query = query.gte("updated_at", since)
+            if after:
+                updated_at, job_id = after
+                query = query.or_(
+                    f'updated_at.gt."{updated_at}",and(updated_at.eq."{updated_at}",id.gt."{job_id}")'
+                )
+            page = query.order("updated_at").order("id").limit(JOB_PAGE_SIZE).execute().data or []
+            rows.extend(page)
+            if len(page) < JOB_PAGE_SIZE:
+                return rows
+            after = (page[-1]["updated_at"], page[-1]["id"])
+
+    def rebuild(self):
+        """Reload every active job."""
+        first_load = not self.last_rebuild
+        newer_than = self._materialized_through() if first_load else None
+        rows = self._load_active_jobs()
+        with self._lock:
+            # The first load has no previous entries; it queues jobs newer than the last materialization
+            previous = None if first_load else self.jobs
+            # A fresh vocabulary drops skills only closed jobs asked for
+            self.jobs, self.postings, self.synced_through = {}, {}, None
+            self.vocabulary = SkillVocabulary()
+            self._apply(rows, previous, newer_than)
+            self.last_rebuild = self.last_sync = time.monotonic()
+        logger.info(f"Job skill index rebuilt: {len(self.jobs)} jobs, {len(self.postings)} skills")
+
+    def sync(self):
+        """Apply jobs created, updated or closed since the last sync."""
+        rows = self._load_updated_jobs(self.synced_through)
+        with self._lock:
+            self._apply(rows, self.jobs)
+            self.last_sync = time.monotonic()
+
+    def refresh(self):
+        """Rebuild or sync the index if it is due (one refresh at a time)."""
+        with self._refresh_lock:
+            now = time.monotonic()
+            if not self.last_rebuild or now - self.last_rebuild >= settings.JOB_INDEX_REBUILD_SECONDS:
+                self.rebuild()
+            elif now - self.last_sync >= settings.JOB_INDEX_SYNC_SECONDS:
+                self.sync()
+
+    def take_changed(self) -> List[Dict]:
+        """Entries of jobs found new or edited since the last call."""
+        with self._lock:
+            changed, self.changed = list(self.changed.values()), {}
+        return changed
+
+    # ── Queries ───────────────────────────────────────────────
+    def candidate_ids(self, student_bits: int) -> Set[str]:
+        """Ids of jobs sharing at least one skill with the student (bits from self.vocabulary)."""
+        ids = set()
+        with self._lock:
+            for position in _bit_positions(student_bits):
+                ids |= self.postings.get(position, set())
+        return ids
+
+    def iter_matches(
+        self,
+        student_skills: List[str],
+        job_type: Optional[str] = None,
+        location: Optional[str] = None
+    ) -> List[Dict]:
+        """Match dicts for every candidate job passing the filters."""
+        with self._lock:
+            student_bits = self.vocabulary.bitset(student_skills)
+            jobs = [self.jobs[job_id] for job_id in self.candidate_ids(student_bits)]
+        return [
+            match_job(job, student_bits) for job in jobs
+            if (not job_type or job["job_type"] == job_type)
+            and (not location or job["location"] == location)
+        ]
+
+    def top_matches(
+        self,
+        student_skills: List[str],
+        limit: int,
+        job_type: Optional[str] = None,
+        location: Optional[str] = None,
+        after: Optional[Tuple] = None
+    ) -> List[Dict]:
+        """
+        Best `limit` matches, ordered by match percentage, then newest
+        first (ties broken by id for a stable order).
+
+        With `after` (a match_sort_key), only matches ordered after it
+        are considered - the next page of a cursor-paginated listing.
+        """
+        matches = self.iter_matches(student_skills, job_type, location)
+        if after is not None:
+            matches = (match for match in matches if match_sort_key(match) < after)
+        return heapq.nlargest(limit, matches, key=match_sort_key)
+
+
+job_index = JobSkillIndex()
@@ -0,0 +1,145 @@
+"""
+Job Matches - Materialized student x job match rows.
+
+Match percentages are computed when either side changes instead of on
+every listing request:
+- a job is created (create_job), or the job index sync finds it new or
+  edited (jobs posted from the frontend): it is matched against every
+  student's feature record in one pass;
+- a profile is re-extracted: that student is matched against every
+  active job in the job index.
+
+Like the index listing, only pairs sharing at least one skill are
+stored. /student/jobs reads one page of job_matches through the
+(student_id, match_percentage, job_created_at, job_id) index. Closed
+jobs are filtered at read time through the jobs embed, so closing a job
+needs no write here.
+
+Each pass upserts its rows and then deletes the rows it did not write
+(computed_at older than the pass), so listings never see a gap.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+from utils.supabase import supabase
+from config.settings import settings
+from services.matching.feature_store import get_features
+from services.matching.job_index import job_index, match_job
+
+logger = logging.getLogger("sudhee-ai-intelligence")
+
+# Student feature records read per round-trip when matching a job
+STUDENT_PAGE_SIZE = 1000
+
+# Rows per upsert request
+WRITE_CHUNK_SIZE = 500
+
+
+def _match_row(student_id: str, match: Dict, computed_at: str) -> Dict:
+    job = match["job"]
+    return {
+        "student_id": student_id,
+        "job_id": job["id"],
+        "match_percentage": match["match_percentage"],
+        "matched_skills": match["matched_skills"],
+        "missing_skills": match["missing_skills"],
+        "job_created_at": job["created_at"],
+        "computed_at": computed_at
+    }
+
+
+def _write_rows(client, rows: List[Dict]):
+    for start in range(0, len(rows), WRITE_CHUNK_SIZE):
+        client.table("job_matches").upsert(
+            rows[start:start + WRITE_CHUNK_SIZE],
+            on_conflict="student_id,job_id"
+        ).execute()
+
+
+def iter_student_skills(client=None) -> Iterable[Tuple[str, List[str]]]:
+    """(student_id, canonical skill keys) for every student, paged by user_id."""
+    client = client or supabase
+    last_id = None
+    while True:
+        query = client.table("student_profiles").select("user_id, platform_features, extracted_skills")
+        if last_id is not None:
+            query = query.gt("user_id", last_id)
+        page = query.order("user_id").limit(STUDENT_PAGE_SIZE).execute().data or []
+
+        for profile in page:
+            yield profile["user_id"], get_features(profile)["skills"]
+
+        if len(page) < STUDENT_PAGE_SIZE:
+            return
+        last_id = page[-1]["user_id"]
+
+
+def materialize_job_matches(job: Dict, client=None) -> int:
+    """
+    Match one job (a job index entry, see job_index.index_entry) against
+    every student and replace its job_matches rows. Returns rows written.
+    """
+    client = client or supabase
+    computed_at = datetime.utcnow().isoformat()
+    job_mask = job["required_mask"] | job["preferred_mask"]
+    vocabulary = job["vocabulary"]
+
+    rows = []
+    for student_id, skills in iter_student_skills(client):
+        student_bits = vocabulary.bitset(skills)
+        if student_bits & job_mask:
+            rows.append(_match_row(student_id, match_job(job, student_bits), computed_at))
+    _write_rows(client, rows)
+    client.table("job_matches").delete().eq("job_id", job["id"]).lt("computed_at", computed_at).execute()
+
+    logger.info(f"Materialized {len(rows)} matches for job {job['id']}")
+    return len(rows)
+
+
+def materialize_student_matches(student_id: str, skills: List[str], client=None) -> int:
+    """
+    Match one student (canonical skill keys from their feature record)
+    against every active job and replace their job_matches rows.
+    Returns rows written.
+    """
+    client = client or supabase
+    computed_at = datetime.utcnow().isoformat()
+
+    job_index.refresh()
+    rows = [
+        _match_row(student_id, match, computed_at)
+        for match in job_index.iter_matches(skills)
+    ]
+    _write_rows(client, rows)
+    client.table("job_matches").delete().eq("student_id", student_id).lt("computed_at", computed_at).execute()
+    client.table("student_profiles").update({"job_matches_at": computed_at}).eq("user_id", student_id).execute()
+
+    logger.info(f"Materialized {len(rows)} job matches for student {student_id}")
+    return len(rows)
+
+
+async def sync_job_matches():
+    """
+    Refresh the job index and materialize every job it found new or
+    edited. The refresh and matching a job against every student run in
+    a thread. Each worker process syncs its own index, so a job may be
+    materialized more than once - the passes are idempotent.
+    """
+    await asyncio.to_thread(job_index.refresh)
+    for job in job_index.take_changed():
+        try:
+            await asyncio.to_thread(materialize_job_matches, job)
+        except Exception as e:
+            logger.error(f"Failed to materialize matches for job {job['id']}: {str(e)}")
+
+
+async def run_job_match_sync():
+    """Startup task: sync_job_matches every JOB_INDEX_SYNC_SECONDS."""
+    while True:
+        await asyncio.sleep(settings.JOB_INDEX_SYNC_SECONDS)
+        try:
+            await sync_job_matches()
+        except Exception as e:
+            logger.error(f"Job match sync failed: {str(e)}")
@@ -4,9 +4,18 @@ Ranking Engine - Core algorithmic scoring and candidate ranking.
 Combines platform-specific scores with Gemini AI analysis to rank candidates.
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Optional, Tuple
+from typing import AsyncIterator, List, Dict, Optional, Tuple
+import numpy as np
 from utils.supabase import supabase
+from config.settings import settings
+from services.matching.ranking_loader import RankingDataLoader
+from services.matching.fingerprint import ranking_fingerprint
+from services.matching.feature_store import get_features
+from services.matching.skill_taxonomy import SkillVocabulary, canonical_keys, match_skills
+from services.matching.batch_scoring import batch_overall_scores, build_feature_columns, score_batch
+from services.intelligence.profile_digest import build_profile_digest, job_digest
 
 logger = logging.getLogger("sudhee-ai-intelligence")
 
@@ -105,21 +114,16 @@ def calculate_github_score(github_data: dict, job_required_skills: List[str] = N
     
     # Tech stack match against job requirements (max 30)
     if job_required_skills:
-        repo_languages = set()
-        repo_topics = set()
+        vocabulary = SkillVocabulary(job_required_skills)
+        required_bits = vocabulary.bitset(job_required_skills)
+        tech_stack = 0
         
         for repo in github_data.get("repositories", [])[:20]:
-            for lang in repo.get("languages", []):
-                repo_languages.add(lang.get("name", "").lower())
-            for topic in repo.get("topics", []):
-                repo_topics.add(topic.lower())
+            tech_stack |= vocabulary.bitset(lang.get("name", "") for lang in repo.get("languages", []))
+            tech_stack |= vocabulary.bitset(repo.get("topics", []))
         
-        tech_stack = repo_languages.union(repo_topics)
-        required_skills_lower = set(skill.lower() for skill in job_required_skills)
-        
-        matches = tech_stack.intersection(required_skills_lower)
-        if required_skills_lower:
-            match_ratio = len(matches) / len(required_skills_lower)
+        if required_bits:
+            match_ratio = (tech_stack & required_bits).bit_count() / required_bits.bit_count()
             score += match_ratio * 30
         else:
             score += 15  # Neutral if no requirements
@@ -149,12 +153,12 @@ def calculate_linkedin_score(linkedin_data: dict, job_requirements: dict = None)
     score = 0
     
     # Skills match (max 40)
-    linkedin_skills = set(skill.lower() for skill in linkedin_data.get("skills", []))
     if job_requirements and job_requirements.get("required_skills"):
-        required = set(skill.lower() for skill in job_requirements["required_skills"])
+        vocabulary = SkillVocabulary(job_requirements["required_skills"])
+        required = vocabulary.bitset(job_requirements["required_skills"])
+        linkedin_skills = vocabulary.bitset(linkedin_data.get("skills", []))
         if required:
-            matches = linkedin_skills.intersection(required)
-            score += (len(matches) / len(required)) * 40
+            score += ((linkedin_skills & required).bit_count() / required.bit_count()) * 40
         else:
             score += 20
     else:
@@ -173,7 +177,7 @@ def calculate_linkedin_score(linkedin_data: dict, job_requirements: dict = None)
         score += 3
     if linkedin_data.get("education"):
         score += 3
-    if len(linkedin_skills) > 5:
+    if len(canonical_keys(linkedin_data.get("skills", []))) > 5:
         score += 4
     
     return int(min(100, score))
@@ -197,193 +201,557 @@ def calculate_overall_score(
     
     return int(round(overall))
 
-async def rank_candidates(
+def _gemini_insights(ai_result) -> Dict:
+    """Map a CandidateScore onto the insight block stored in match_analysis."""
+    gemini_score = ai_result.overall_reasoning_score
+    return {
+        "recommendation": "STRONG_FIT" if gemini_score >= 80 else "MODERATE_FIT" if gemini_score >= 60 else "WEAK_FIT",
+        "explanation": ai_result.explanation,
+        "skill_match": ai_result.skill_match_score,
+        "project_score": ai_result.project_score,
+        "hiring_confidence": "High" if gemini_score >= 80 else "Medium" if gemini_score >= 60 else "Low"
+    }
+
+def _build_gemini_payloads(profile: dict, job: dict, student_id: str) -> Tuple[dict, dict]:
+    """Prepare the profile/job payloads (compact digests) sent to score_candidate_with_gemini."""
+    profile_data = {"id": student_id, **build_profile_digest(profile, job)}
+    job_data = {"id": job.get("id"), **job_digest(job)}
+    return profile_data, job_data
+
+def score_candidates_algorithmic(pairs: List[Tuple[dict, dict]], job: dict) -> List[Dict]:
+    """
+    Score many applicants with the platform scorers only.
+    
+    Reads each profile's feature-store record and scores the whole batch
+    with the vectorized scorers.
+    
+    Args:
+        pairs: (application, student_profile) tuples
+        job: Job being ranked
+    
+    Returns:
+        Ranking entries (everything except the Gemini blend), in input order
+    """
+    if not pairs:
+        return []
+    
+    job_type = job.get("role_type", "SDE")
+    required_skills = job.get("required_skills") or []
+    
+    features = [get_features(profile) for _, profile in pairs]
+    vocabulary = SkillVocabulary(required_skills)
+    scores = score_batch(build_feature_columns(features, required_skills), job_type, required_skills)
+    
+    entries = []
+    for i, (app, profile) in enumerate(pairs):
+        matched_skills, missing_skills = match_skills(required_skills, features[i]["skills"], vocabulary)
+        entries.append({
+            "application_id": app["id"],
+            "student_id": app["student_id"],
+            "algorithmic_score": int(scores["overall"][i]),
+            "platform_scores": {
+                "leetcode": int(scores["leetcode"][i]),
+                "github": int(scores["github"][i]),
+                "linkedin": int(scores["linkedin"][i])
+            },
+            "matched_skills": matched_skills,
+            "missing_skills": missing_skills,
+            "profile": profile
+        })
+    
+    return entries
+
+def score_candidate_algorithmic(app: dict, profile: dict, job: dict) -> Dict:
+    """Score one applicant with the platform scorers only."""
+    return score_candidates_algorithmic([(app, profile)], job)[0]
+
+def entry_from_stored(app: dict, profile: dict) -> Tuple[Dict, Optional[Dict]]:
+    """
+    Rebuild a ranking entry (and Gemini result, if any) from the
+    match_analysis stored on an application, without rescoring.
+    """
+    stored = app["match_analysis"]
+    entry = {
+        "application_id": app["id"],
+        "student_id": app["student_id"],
+        "algorithmic_score": stored["algorithmic_score"],
+        "platform_scores": stored["platform_scores"],
+        "matched_skills": stored.get("matched_skills", []),
+        "missing_skills": stored.get("missing_skills", []),
+        "profile": profile,
+        "fingerprint": stored["fingerprint"],
+        "reused": True
+    }
+    
+    ai_result = None
+    if stored.get("scoring_mode") == "blended":
+        ai_result = {
+            "gemini_score": stored["gemini_score"],
+            "gemini_insights": stored.get("gemini_insights", {})
+        }
+    
+    return entry, ai_result
+
+async def iter_gemini_scores(
+    entries: List[Dict],
+    job: dict,
+    gemini_api_key: str,
+    concurrency: int = None,
+    timeout: float = None
+) -> AsyncIterator[Tuple[int, Optional[Dict]]]:
+    """
+    Run the Gemini stage for many candidates with bounded concurrency.
+    
+    At most `concurrency` calls are in flight at once and each call is
+    capped at `timeout` seconds. Yields (index, result) pairs as calls
+    complete, where index points into `entries`; a failed or timed-out
+    call (including one that only produced a fallback score) yields None
+    for that candidate without holding up the rest.
+    """
+    from services.intelligence.ai_scoring import AIScoringUnavailable, score_candidate_with_gemini
+    
+    concurrency = max(1, concurrency or settings.RANKING_AI_CONCURRENCY)
+    timeout = timeout or settings.RANKING_AI_TIMEOUT_SECONDS
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def _score_one(index: int, entry: Dict) -> Tuple[int, Optional[Dict]]:
+        student_id = entry["student_id"]
+        profile_data, job_data = _build_gemini_payloads(entry["profile"], job, student_id)
+        
+        async with semaphore:
+            try:
+                ai_result = await asyncio.wait_for(
+                    score_candidate_with_gemini(
+                        profile_data=profile_data,
+                        job_data=job_data,
+                        api_key=gemini_api_key,
+                        legacy_score=entry["algorithmic_score"],
+                        user_id=student_id,
+                        fingerprint=entry.get("fingerprint"),
+                        strict=True
+                    ),
+                    timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                logger.error(f"Gemini analysis timed out for student {student_id} after {timeout}s")
+                return index, None
+            except AIScoringUnavailable as e:
+                logger.warning(f"Gemini analysis unavailable for student {student_id}: {str(e)}")
+                return index, None
+            except Exception as e:
+                logger.error(f"Gemini analysis failed for student {student_id}: {str(e)}")
+                return index, None
+        
+        return index, {
+            "gemini_score": ai_result.overall_reasoning_score,
+            "gemini_insights": _gemini_insights(ai_result)
+        }
+    
+    tasks = [asyncio.ensure_future(_score_one(i, entry)) for i, entry in enumerate(entries)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Consumer went away (e.g. client disconnected) - stop outstanding calls
+        for task in tasks:
+            task.cancel()
+
+async def score_candidates_with_gemini(
+    entries: List[Dict],
+    job: dict,
+    gemini_api_key: str,
+    concurrency: int = None,
+    timeout: float = None
+) -> List[Optional[Dict]]:
+    """
+    Bounded-concurrency Gemini stage with ordered result assembly.
+    
+    Returns:
+        List of {"gemini_score", "gemini_insights"} dicts (or None),
+        in the same order as `entries`
+    """
+    results = [None] * len(entries)
+    async for index, ai_result in iter_gemini_scores(entries, job, gemini_api_key, concurrency, timeout):
+        results[index] = ai_result
+    return results
+
+def select_shortlist(
+    entries: List[Dict],
+    shortlist_size: Optional[int] = None,
+    min_score: Optional[int] = None
+) -> List[int]:
+    """
+    Pick which candidates go on to the Gemini stage.
+    
+    Candidates are ordered by algorithmic score; those below `min_score`
+    are dropped and the rest are capped at the top `shortlist_size`.
+    With neither limit set, everyone is shortlisted.
+    
+    Returns:
+        Indexes into `entries`, best algorithmic score first
+    """
+    order = sorted(range(len(entries)), key=lambda i: entries[i]["algorithmic_score"], reverse=True)
+    
+    if min_score is not None:
+        order = [i for i in order if entries[i]["algorithmic_score"] >= min_score]
+    if shortlist_size is not None:
+        order = order[:max(0, shortlist_size)]
+    
+    return order
+
+def finalize_candidate(entry: Dict, ai_result: Optional[Dict], user_info: dict) -> Dict:
+    """
+    Blend algorithmic and Gemini scores (60/40) into a ranked-list entry.
+    
+    Falls back to the algorithmic score when the Gemini stage was skipped
+    or failed for this candidate; such entries are marked with
+    scoring_mode "algorithmic_only".
+    """
+    algorithmic_score = entry["algorithmic_score"]
+    scoring_mode = "blended" if ai_result else "algorithmic_only"
+    gemini_score = ai_result["gemini_score"] if ai_result else algorithmic_score
+    gemini_insights = ai_result["gemini_insights"] if ai_result else {}
+    
+    # Blend scores: 60% algorithmic + 40% Gemini
+    final_score = int(round(algorithmic_score * 0.6 + gemini_score * 0.4))
+    
+    profile = entry["profile"]
+    
+    # Prepare match analysis
+    match_analysis = {
+        "overall_score": final_score,
+        "algorithmic_score": algorithmic_score,
+        "gemini_score": gemini_score,
+        "platform_scores": entry["platform_scores"],
+        "matched_skills": entry["matched_skills"],
+        "missing_skills": entry["missing_skills"],
+        "gemini_insights": gemini_insights,
+        "scoring_mode": scoring_mode,
+        "fingerprint": entry.get("fingerprint"),
+        "analyzed_at": None  # Will be set by database
+    }
+    
+    return {
+        "application_id": entry["application_id"],
+        "student_id": entry["student_id"],
+        "student_name": user_info.get("full_name", "Unknown"),
+        "institution": user_info.get("institution", "N/A"),
+        "final_score": final_score,
+        "algorithmic_score": algorithmic_score,
+        "scoring_mode": scoring_mode,
+        "platform_scores": entry["platform_scores"],
+        "gemini_insights": gemini_insights,
+        "matched_skills": entry["matched_skills"],
+        "missing_skills": entry["missing_skills"],
+        "profile_links": {
+            "leetcode": profile.get("leetcode_url"),
+            "github": profile.get("github_url"),
+            "linkedin": profile.get("linkedin_url")
+        },
+        "match_analysis": match_analysis
+    }
+
+def _application_update(job_id: str, candidate: Dict, include_rank: bool = True) -> Dict:
+    """Row written back to applications for one ranked candidate."""
+    row = {
+        "id": candidate["application_id"],
+        "job_id": job_id,
+        "student_id": candidate["student_id"],
+        "match_analysis": candidate["match_analysis"],
+        "match_score": candidate["final_score"],
+        "matched_skills": candidate["matched_skills"],
+        "missing_skills": candidate["missing_skills"]
+    }
+    if include_rank:
+        row["rank"] = candidate["rank"]
+    return row
+
+def _public(candidate: Dict) -> Dict:
+    """Ranked-list entry as returned to API callers (without match_analysis)."""
+    return {key: value for key, value in candidate.items() if key != "match_analysis"}
+
+def _sort_and_rank(candidates: List[Dict]) -> List[Dict]:
+    """Sort by final_score descending and assign rank numbers."""
+    candidates.sort(key=lambda x: x["final_score"], reverse=True)
+    for i, candidate in enumerate(candidates, 1):
+        candidate["rank"] = i
+    return candidates
+
+def reweight_rankings(
+    applications: List[Dict],
+    platform_weights: Dict[str, float],
+    algorithmic_weight: float = 0.6
+) -> List[Dict]:
+    """
+    Re-rank already-analyzed applicants under different weights.
+    
+    Recomputes the algorithmic score from the stored platform_scores and
+    re-blends it with the stored gemini_score, all in memory - no Gemini
+    calls and no per-candidate queries. Candidates that were never sent
+    to Gemini follow their new algorithmic score, as in finalize_candidate.
+    Applications without a stored analysis are left out.
+    
+    Args:
+        applications: Rows carrying id, student_id, match_analysis and rank
+        platform_weights: leetcode/github/linkedin weights (summing to 1)
+        algorithmic_weight: Share of the algorithmic score in the blend
+    
+    Returns:
+        Entries sorted by the new final_score, with rank and previous_rank
+    """
+    analyzed = [app for app in applications if (app.get("match_analysis") or {}).get("platform_scores")]
+    if not analyzed:
+        return []
+    
+    analyses = [app["match_analysis"] for app in analyzed]
+    leetcode = np.array([a["platform_scores"]["leetcode"] for a in analyses], dtype=np.float64)
+    github = np.array([a["platform_scores"]["github"] for a in analyses], dtype=np.float64)
+    linkedin = np.array([a["platform_scores"]["linkedin"] for a in analyses], dtype=np.float64)
+    blended = np.array([a.get("scoring_mode", "blended") == "blended" for a in analyses])
+    stored_gemini = np.array([a.get("gemini_score") or 0 for a in analyses], dtype=np.float64)
+    
+    algorithmic = batch_overall_scores(leetcode, github, linkedin, platform_weights)
+    gemini = np.where(blended, stored_gemini, algorithmic)
+    final = np.round(algorithmic * algorithmic_weight + gemini * (1 - algorithmic_weight)).astype(np.int64)
+    
+    ranked = []
+    for rank, i in enumerate(np.argsort(-final, kind="stable"), 1):
+        ranked.append({
+            "application_id": analyzed[i]["id"],
+            "student_id": analyzed[i]["student_id"],
+            "final_score": int(final[i]),
+            "algorithmic_score": int(algorithmic[i]),
+            "gemini_score": int(gemini[i]),
+            "scoring_mode": analyses[i].get("scoring_mode", "blended"),
+            "platform_scores": analyses[i]["platform_scores"],
+            "rank": rank,
+            "previous_rank": analyzed[i].get("rank")
+        })
+    
+    return ranked
+
+async def iter_rank_events(
     job_id: str,
     use_gemini: bool = True,
-    gemini_api_key: str = None
-) -> List[Dict]:
+    gemini_api_key: str = None,
+    loader: Optional[RankingDataLoader] = None,
+    ai_concurrency: int = None,
+    ai_timeout: float = None,
+    shortlist_size: Optional[int] = None,
+    shortlist_min_score: Optional[int] = None,
+    force_rescore: bool = False,
+    checkpoint_every: Optional[int] = None
+) -> AsyncIterator[Dict]:
     """
-    Main ranking orchestrator.
+    Ranking pipeline as a stream of events.
     
     Steps:
-    1. Fetch all applications for job
-    2. For each candidate:
-       a. Get StudentProfile
-       b. Calculate platform scores
-       c. Get Gemini match analysis (if enabled)
-       d. Blend: 60% algorithmic + 40% Gemini
-       e. Update application with match_analysis
-    3. Sort by final_score descending
-    4. Assign rank numbers
-    5. Return ranked list
+    1. Batch-load job, applications, student profiles and user info
+    2. Calculate platform scores (one batch over feature-store records)
+       for every candidate whose ranking fingerprint changed; reuse
+       stored scores for the rest
+    3. Emit a "provisional" event with the algorithmic (or stored) order
+    4. Shortlist by algorithmic score (top-K and/or minimum score)
+    5. Get Gemini match analysis (if enabled) for the shortlist only,
+       with bounded concurrency; emit a "candidate" event per result
+    6. Blend: 60% algorithmic + 40% Gemini; candidates outside the
+       shortlist keep their algorithmic-only score
+    7. Sort by final_score descending and assign rank numbers
+    8. Bulk upsert match_analysis and ranks for rows that changed
+    9. Emit a "final" event with the settled order
     
-    Returns:
-        List of ranked candidates with scores and analysis
+    Repeat calls on an unchanged job re-sort from stored scores and make
+    no Gemini calls; pass force_rescore=True to recompute everything.
+    
+    With `checkpoint_every`, Gemini results are also upserted in batches
+    of that size as they arrive (emitting a "checkpoint" event), so an
+    interrupted run picks them up through the fingerprint path instead
+    of calling Gemini again.
     """
-    if not supabase:
+    if not supabase and loader is None:
         raise Exception("Database not connected")
     
+    loader = loader or RankingDataLoader()
+    
     try:
         # Fetch job
-        job_response = supabase.table("jobs").select("*").eq("id", job_id).execute()
-        if not job_response.data:
+        job = loader.load_job(job_id)
+        if not job:
             raise Exception("Job not found")
         
-        job = job_response.data[0]
-        job_type = job.get("role_type", "SDE")
-        required_skills = job.get("required_skills", [])
-        
         # Fetch all applications
-        apps_response = supabase.table("applications").select("*").eq("job_id", job_id).execute()
+        applications = loader.load_applications(job_id)
         
-        if not apps_response.data:
-            return []
+        if not applications:
+            yield {"event": "final", "job_id": job_id, "total_candidates": 0, "ranked_candidates": []}
+            return
         
-        ranked_candidates = []
+        student_ids = [app["student_id"] for app in applications]
+        profiles = loader.load_student_profiles(student_ids)
+        users = loader.load_users(student_ids)
         
-        for app in apps_response.data:
-            student_id = app["student_id"]
-            
-            # Fetch student profile
-            profile_response = supabase.table("student_profiles").select("*").eq("user_id", student_id).execute()
-            
-            if not profile_response.data:
-                logger.warning(f"No profile found for student {student_id}, skipping")
+        # Algorithmic stage (skipped for unchanged fingerprints)
+        entries = []
+        ai_results = []
+        rescore = []
+        for app in applications:
+            profile = profiles.get(app["student_id"])
+            if not profile:
+                logger.warning(f"No profile found for student {app['student_id']}, skipping")
                 continue
             
-            profile = profile_response.data[0]
-            
-            # Calculate platform scores
-            leetcode_score = calculate_leetcode_score(profile.get("leetcode_data", {}))
-            github_score = calculate_github_score(profile.get("github_data", {}), required_skills)
-            linkedin_score = calculate_linkedin_score(profile.get("linkedin_data", {}), {"required_skills": required_skills})
+            fingerprint = ranking_fingerprint(profile, job)
+            stored = app.get("match_analysis") or {}
             
-            # Calculate overall algorithmic score
-            algorithmic_score = calculate_overall_score(
-                leetcode_score,
-                github_score,
-                linkedin_score,
-                job_type
-            )
+            if not force_rescore and stored.get("fingerprint") == fingerprint:
+                entry, ai_result = entry_from_stored(app, profile)
+            else:
+                entry = {"fingerprint": fingerprint}
+                ai_result = None
+                rescore.append((len(entries), app, profile))
             
-            # Get Gemini analysis
-            gemini_score = algorithmic_score  # Default to algorithmic if Gemini disabled
-            gemini_insights = {}
-            
-            if use_gemini and gemini_api_key:
-                try:
-                    from services.intelligence.ai_scoring import score_candidate_with_gemini
-                    import json
-                    
-                    # Prepare data for Gemini
-                    profile_data = {
-                        "leetcode": profile.get("leetcode_data", {}),
-                        "github": profile.get("github_data", {}),
-                        "linkedin": profile.get("linkedin_data", {}),
-                        "ai_analysis": profile.get("ai_analysis", {}),
-                        "skills": profile.get("extracted_skills", [])
-                    }
-                    
-                    job_data = {
-                        "title": job.get("title"),
-                        "description": job.get("description"),
-                        "required_skills": required_skills,
-                        "preferred_skills": job.get("preferred_skills", []),
-                        "experience_required": job.get("experience_required"),
-                        "role_type": job_type
-                    }
-                    
-                    ai_result = await score_candidate_with_gemini(
-                        profile_data=profile_data,
-                        job_data=job_data,
-                        api_key=gemini_api_key,
-                        legacy_score=algorithmic_score,
-                        user_id=student_id
-                    )
-                    
-                    gemini_score = ai_result.overall_reasoning_score
-                    gemini_insights = {
-                        "recommendation": "STRONG_FIT" if gemini_score >= 80 else "MODERATE_FIT" if gemini_score >= 60 else "WEAK_FIT",
-                        "explanation": ai_result.explanation,
-                        "skill_match": ai_result.skill_match_score,
-                        "project_score": ai_result.project_score,
-                        "hiring_confidence": "High" if gemini_score >= 80 else "Medium" if gemini_score >= 60 else "Low"
+            entries.append(entry)
+            ai_results.append(ai_result)
+        
+        # Score every changed candidate in one vectorized batch
+        scored_entries = score_candidates_algorithmic([(app, profile) for _, app, profile in rescore], job)
+        for (i, _, _), entry in zip(rescore, scored_entries):
+            entry["fingerprint"] = entries[i]["fingerprint"]
+            entries[i] = entry
+        
+        reused_count = sum(1 for entry in entries if entry.get("reused"))
+        
+        def _finalize(i: int) -> Dict:
+            return finalize_candidate(entries[i], ai_results[i], users.get(entries[i]["student_id"], {}))
+        
+        candidates = [_finalize(i) for i in range(len(entries))]
+        
+        shortlist = []
+        if use_gemini and gemini_api_key:
+            shortlist = [
+                i for i in select_shortlist(entries, shortlist_size, shortlist_min_score)
+                if ai_results[i] is None
+            ]
+        
+        provisional = _sort_and_rank([dict(c) for c in candidates])
+        yield {
+            "event": "provisional",
+            "job_id": job_id,
+            "total_candidates": len(provisional),
+            "ai_pending": len(shortlist),
+            "ranked_candidates": [_public(c) for c in provisional]
+        }
+        
+        # Gemini stage (shortlist only, skipping stored Gemini results)
+        if shortlist:
+            scored = 0
+            failed = 0
+            unsaved = []
+            async for k, ai_result in iter_gemini_scores(
+                [entries[i] for i in shortlist],
+                job,
+                gemini_api_key,
+                concurrency=ai_concurrency,
+                timeout=ai_timeout
+            ):
+                i = shortlist[k]
+                scored += 1
+                if ai_result:
+                    ai_results[i] = ai_result
+                    entries[i]["reused"] = False
+                    candidates[i] = _finalize(i)
+                    unsaved.append(i)
+                else:
+                    failed += 1
+                
+                yield {
+                    "event": "candidate",
+                    "scored": scored,
+                    "failed": failed,
+                    "ai_pending": len(shortlist) - scored,
+                    "candidate": _public(candidates[i])
+                }
+                
+                if checkpoint_every and (len(unsaved) >= checkpoint_every or scored == len(shortlist)):
+                    loader.save_results([
+                        _application_update(job_id, candidates[j], include_rank=False) for j in unsaved
+                    ])
+                    yield {
+                        "event": "checkpoint",
+                        "saved": len(unsaved),
+                        "scored": scored,
+                        "failed": failed,
+                        "ai_pending": len(shortlist) - scored
                     }
-                    
-                except Exception as e:
-                    logger.error(f"Gemini analysis failed for student {student_id}: {str(e)}")
-                    gemini_score = algorithmic_score
-            
-            # Blend scores: 60% algorithmic + 40% Gemini
-            final_score = int(round(algorithmic_score * 0.6 + gemini_score * 0.4))
+                    unsaved = []
             
-            # Extract matched/missing skills
-            student_skills_set = set(profile.get("extracted_skills", []))
-            required_skills_set = set(required_skills)
-            matched_skills = list(student_skills_set.intersection(required_skills_set))
-            missing_skills = list(required_skills_set - student_skills_set)
-            
-            # Prepare match analysis
-            match_analysis = {
-                "overall_score": final_score,
-                "algorithmic_score": algorithmic_score,
-                "gemini_score": gemini_score,
-                "platform_scores": {
-                    "leetcode": leetcode_score,
-                    "github": github_score,
-                    "linkedin": linkedin_score
-                },
-                "matched_skills": matched_skills,
-                "missing_skills": missing_skills,
-                "gemini_insights": gemini_insights,
-                "analyzed_at": None  # Will be set by database
-            }
-            
-            # Update application with match analysis
-            supabase.table("applications").update({
-                "match_analysis": match_analysis,
-                "match_score": final_score,
-                "matched_skills": matched_skills,
-                "missing_skills": missing_skills
-            }).eq("id", app["id"]).execute()
-            
-            # Fetch student info for response
-            user_response = supabase.table("profiles").select("full_name, institution").eq("user_id", student_id).execute()
-            user_info = user_response.data[0] if user_response.data else {}
-            
-            ranked_candidates.append({
-                "application_id": app["id"],
-                "student_id": student_id,
-                "student_name": user_info.get("full_name", "Unknown"),
-                "institution": user_info.get("institution", "N/A"),
-                "final_score": final_score,
-                "platform_scores": match_analysis["platform_scores"],
-                "gemini_insights": gemini_insights,
-                "matched_skills": matched_skills,
-                "missing_skills": missing_skills,
-                "profile_links": {
-                    "leetcode": profile.get("leetcode_url"),
-                    "github": profile.get("github_url"),
-                    "linkedin": profile.get("linkedin_url")
-                }
-            })
+            logger.info(f"Gemini stage: {len(shortlist)} of {len(entries)} candidates sent for job {job_id}")
         
-        # Sort by final_score descending
-        ranked_candidates.sort(key=lambda x: x["final_score"], reverse=True)
+        unchanged = {entry["application_id"] for entry in entries if entry.get("reused")}
+        stored_ranks = {app["id"]: app.get("rank") for app in applications}
         
-        # Assign ranks
-        for i, candidate in enumerate(ranked_candidates, 1):
-            candidate["rank"] = i
-            
-            # Update rank in database
-            supabase.table("applications").update({
-                "rank": i
-            }).eq("id", candidate["application_id"]).execute()
+        ranked_candidates = _sort_and_rank(candidates)
         
-        logger.info(f"Ranked {len(ranked_candidates)} candidates for job {job_id}")
+        # Persist match analysis and ranks in bulk (changed rows only)
+        loader.save_results([
+            _application_update(job_id, c) for c in ranked_candidates
+            if c["application_id"] not in unchanged
+            or stored_ranks.get(c["application_id"]) != c["rank"]
+        ])
         
-        return ranked_candidates
+        logger.info(f"Ranked {len(ranked_candidates)} candidates for job {job_id}", extra={
+            "props": {
+                "job_id": job_id,
+                "reused_scores": reused_count,
+                "db_round_trips": loader.round_trips
+            }
+        })
+        
+        yield {
+            "event": "final",
+            "job_id": job_id,
+            "total_candidates": len(ranked_candidates),
+            "ranked_candidates": [_public(c) for c in ranked_candidates]
+        }
     
     except Exception as e:
         logger.error(f"Ranking failed for job {job_id}: {str(e)}")
         raise
+
+async def rank_candidates(
+    job_id: str,
+    use_gemini: bool = True,
+    gemini_api_key: str = None,
+    loader: Optional[RankingDataLoader] = None,
+    ai_concurrency: int = None,
+    ai_timeout: float = None,
+    shortlist_size: Optional[int] = None,
+    shortlist_min_score: Optional[int] = None,
+    force_rescore: bool = False,
+    checkpoint_every: Optional[int] = None
+) -> List[Dict]:
+    """
+    Main ranking orchestrator.
+    
+    Runs the full pipeline (see iter_rank_events) and returns only the
+    settled order.
+    
+    Returns:
+        List of ranked candidates with scores and analysis
+    """
+    ranked_candidates = []
+    async for event in iter_rank_events(
+        job_id,
+        use_gemini=use_gemini,
+        gemini_api_key=gemini_api_key,
+        loader=loader,
+        ai_concurrency=ai_concurrency,
+        ai_timeout=ai_timeout,
+        shortlist_size=shortlist_size,
+        shortlist_min_score=shortlist_min_score,
+        force_rescore=force_rescore,
+        checkpoint_every=checkpoint_every
+    ):
+        if event["event"] == "final":
+            ranked_candidates = event["ranked_candidates"]
+    return ranked_candidates
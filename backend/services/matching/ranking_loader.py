@@ -0,0 +1,102 @@
+"""
+Ranking Data Loader - Batched Supabase access for candidate ranking.
+
+Pulls every row a ranking run needs in a constant number of chunked
+`in_()` queries and writes results back in bulk upserts, so round-trips
+no longer scale with the number of applicants.
+"""
+
+import logging
+from typing import Dict, List, Iterable, Optional
+from utils.supabase import supabase
+
+logger = logging.getLogger("sudhee-ai-intelligence")
+
+# Max ids per in_() filter / rows per upsert (keeps PostgREST URLs and payloads bounded)
+CHUNK_SIZE = 200
+
+# Applications read per round-trip (at most the PostgREST max-rows of 1000)
+APPLICATION_PAGE_SIZE = 1000
+
+# Column projections - only what the ranking path reads
+APPLICATION_COLUMNS = "id, job_id, student_id, match_analysis, match_score, rank"
+STUDENT_PROFILE_COLUMNS = (
+    "user_id, leetcode_data, github_data, linkedin_data, ai_analysis, "
+    "extracted_skills, platform_features, leetcode_url, github_url, linkedin_url"
+)
+USER_COLUMNS = "user_id, full_name, institution"
+
+
+def _chunks(items: List, size: int = CHUNK_SIZE) -> Iterable[List]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class RankingDataLoader:
+    """
+    Loads and persists everything a ranking run touches.
+
+    Round-trips per run:
+    - 1 job select
+    - ceil(N / APPLICATION_PAGE_SIZE) applications selects
+    - ceil(N / CHUNK_SIZE) student_profiles selects
+    - ceil(N / CHUNK_SIZE) profiles selects
+    - ceil(N / CHUNK_SIZE) applications upserts
+    """
+
+    def __init__(self, client=None, chunk_size: int = CHUNK_SIZE, page_size: int = APPLICATION_PAGE_SIZE):
+        self.client = client or supabase
+        self.chunk_size = chunk_size
+        self.page_size = page_size
+        self.round_trips = 0
+
+    def _execute(self, query):
+        self.round_trips += 1
+        return query.execute()
+
+    def load_job(self, job_id: str) -> Optional[Dict]:
+        """Fetch the job being ranked."""
+        response = self._execute(self.client.table("jobs").select("*").eq("id", job_id))
+        return response.data[0] if response.data else None
+
+    def load_applications(self, job_id: str) -> List[Dict]:
+        """Fetch all applications for a job, paged by id."""
+        applications, last_id = [], None
+        while True:
+            query = self.client.table("applications").select(APPLICATION_COLUMNS).eq("job_id", job_id)
+            if last_id is not None:
+                query = query.gt("id", last_id)
+            page = self._execute(query.order("id").limit(self.page_size)).data or []
+            applications.extend(page)
+            if len(page) < self.page_size:
+                return applications
+            last_id = page[-1]["id"]
+
+    def _load_by_user_ids(self, table: str, columns: str, user_ids: List[str]) -> Dict[str, Dict]:
+        rows = {}
+        unique_ids = list(dict.fromkeys(user_ids))
+        for chunk in _chunks(unique_ids, self.chunk_size):
+            response = self._execute(
+                self.client.table(table).select(columns).in_("user_id", chunk)
+            )
+            for row in response.data or []:
+                rows[row["user_id"]] = row
+        return rows
+
+    def load_student_profiles(self, student_ids: List[str]) -> Dict[str, Dict]:
+        """Fetch student_profiles rows keyed by user_id."""
+        return self._load_by_user_ids("student_profiles", STUDENT_PROFILE_COLUMNS, student_ids)
+
+    def load_users(self, student_ids: List[str]) -> Dict[str, Dict]:
+        """Fetch profiles rows (name, institution) keyed by user_id."""
+        return self._load_by_user_ids("profiles", USER_COLUMNS, student_ids)
+
+    def save_results(self, rows: List[Dict]):
+        """
+        Bulk upsert ranking results into applications.
+
+        Each row must carry id, job_id and student_id so the upsert can
+        satisfy NOT NULL constraints before resolving the id conflict.
+        """
+        for chunk in _chunks(rows, self.chunk_size):
+            self._execute(self.client.table("applications").upsert(chunk, on_conflict="id"))
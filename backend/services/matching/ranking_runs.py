@@ -0,0 +1,249 @@
+"""
+Ranking Runs - Background candidate ranking with progress and resume.
+
+A ranking run is a row in `ranking_runs` that tracks one execution of
+the ranking pipeline for a job. The run is processed by an asyncio task
+outside the request handler, reports progress (scored / total / failed)
+and checkpoints Gemini results into applications as it goes. The owning
+worker renews its lease on a timer while the run is in progress; every
+worker periodically sweeps for queued runs and runs whose lease expired
+(their worker died or was redeployed) and takes them over. The
+fingerprint path then reuses every checkpointed score instead of
+calling Gemini again. Every write is conditional on still owning the
+run, so a worker whose run was taken over stops instead of racing the
+new owner.
+"""
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from utils.supabase import supabase
+from config.settings import settings
+
+logger = logging.getLogger("sudhee-ai-intelligence")
+
+# Identifies this process when claiming runs
+WORKER_ID = f"worker-{uuid.uuid4().hex[:8]}"
+
+# Strong references to in-flight tasks (asyncio only keeps weak ones)
+_running_tasks: Dict[str, asyncio.Task] = {}
+
+
+class LeaseLost(Exception):
+    """The run was re-claimed by another worker after this one's lease expired."""
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat()
+
+
+def _lease_cutoff() -> str:
+    return (datetime.utcnow() - timedelta(seconds=settings.RANKING_RUN_LEASE_SECONDS)).isoformat()
+
+
+def create_ranking_run(job_id: str, recruiter_id: str, options: Optional[Dict] = None, client=None) -> Dict:
+    """Insert a queued ranking run."""
+    client = client or supabase
+    response = client.table("ranking_runs").insert({
+        "job_id": job_id,
+        "recruiter_id": recruiter_id,
+        "status": "queued",
+        "options": options or {},
+        "total": 0,
+        "scored": 0,
+        "failed": 0,
+        "created_at": _now(),
+        "updated_at": _now()
+    }).execute()
+
+    if not response.data:
+        raise Exception("Failed to create ranking run")
+
+    return response.data[0]
+
+
+def get_ranking_run(run_id: str, client=None) -> Optional[Dict]:
+    client = client or supabase
+    response = client.table("ranking_runs").select("*").eq("id", run_id).execute()
+    return response.data[0] if response.data else None
+
+
+def _update_run(client, run_id: str, fields: Dict):
+    """Write fields to a run this worker owns; raises LeaseLost if it no longer does."""
+    fields["updated_at"] = _now()
+    fields["heartbeat_at"] = fields["updated_at"]
+    response = client.table("ranking_runs").update(fields).eq("id", run_id).eq("worker_id", WORKER_ID).execute()
+    if not response.data:
+        raise LeaseLost(run_id)
+
+
+async def _heartbeat(client, run_id: str, progress: Dict, lease_lost: asyncio.Event, owner: asyncio.Task):
+    """
+    Renew this worker's lease (and report progress so far) until
+    cancelled. If the run was re-claimed, set `lease_lost` and cancel
+    the processing task.
+    """
+    while True:
+        await asyncio.sleep(settings.RANKING_RUN_HEARTBEAT_SECONDS)
+        try:
+            _update_run(client, run_id, dict(progress))
+        except LeaseLost:
+            lease_lost.set()
+            owner.cancel()
+            return
+        except Exception as e:
+            logger.warning(f"Heartbeat failed for ranking run {run_id}: {str(e)}")
+
+
+def claim_ranking_run(run: Dict, client=None) -> bool:
+    """
+    Take ownership of a run for this worker.
+
+    A queued run can be claimed by anyone; a running run only once its
+    lease (heartbeat) has expired. The status/heartbeat filter makes the
+    claim a single conditional update, so two workers cannot both win.
+    """
+    client = client or supabase
+    query = client.table("ranking_runs").update({
+        "status": "running",
+        "worker_id": WORKER_ID,
+        "heartbeat_at": _now(),
+        "updated_at": _now()
+    }).eq("id", run["id"])
+
+    if run.get("status") == "queued":
+        query = query.eq("status", "queued")
+    else:
+        query = query.eq("status", "running").lt("heartbeat_at", _lease_cutoff())
+
+    response = query.execute()
+    return bool(response.data)
+
+
+async def process_ranking_run(run: Dict, client=None):
+    """
+    Execute a claimed run to completion, recording progress at every
+    checkpoint and heartbeat and the final outcome on the run row.
+    """
+    from services.matching.ranking_engine import iter_rank_events
+    from services.matching.ranking_loader import RankingDataLoader
+
+    client = client or supabase
+    run_id = run["id"]
+    options = run.get("options") or {}
+
+    logger.info(f"Processing ranking run {run_id} for job {run['job_id']}", extra={
+        "props": {"run_id": run_id, "job_id": run["job_id"], "worker_id": WORKER_ID}
+    })
+
+    progress = {}
+    lease_lost = asyncio.Event()
+    heartbeat = asyncio.create_task(
+        _heartbeat(client, run_id, progress, lease_lost, asyncio.current_task())
+    )
+    # On resume, keep the original total; candidates checkpointed before the
+    # takeover are reused and no longer show up in ai_pending
+    total = run.get("total") or 0
+    done = 0
+
+    try:
+        async for event in iter_rank_events(
+            job_id=run["job_id"],
+            use_gemini=True,
+            gemini_api_key=settings.GEMINI_API_KEY,
+            loader=RankingDataLoader(client),
+            shortlist_size=options.get("shortlist_size"),
+            shortlist_min_score=options.get("min_score"),
+            force_rescore=options.get("force", False),
+            checkpoint_every=settings.RANKING_CHECKPOINT_EVERY
+        ):
+            if event["event"] == "provisional":
+                total = max(total, event["ai_pending"])
+                done = total - event["ai_pending"]
+                _update_run(client, run_id, {
+                    "total": total,
+                    "scored": done,
+                    "failed": 0,
+                    "candidates": event["total_candidates"]
+                })
+            elif event["event"] == "candidate":
+                progress.update(scored=done + event["scored"] - event["failed"], failed=event["failed"])
+            elif event["event"] == "checkpoint":
+                _update_run(client, run_id, {
+                    "scored": done + event["scored"] - event["failed"],
+                    "failed": event["failed"]
+                })
+            elif event["event"] == "final":
+                ranked = event["ranked_candidates"]
+                _update_run(client, run_id, {
+                    "status": "completed",
+                    "candidates": event["total_candidates"],
+                    "result": {
+                        "total_candidates": event["total_candidates"],
+                        "ai_scored_candidates": sum(1 for c in ranked if c["scoring_mode"] == "blended")
+                    },
+                    "completed_at": _now()
+                })
+
+        logger.info(f"Ranking run {run_id} completed")
+
+    except LeaseLost:
+        logger.warning(f"Ranking run {run_id} was re-claimed by another worker; dropping it")
+    except asyncio.CancelledError:
+        if lease_lost.is_set():
+            logger.warning(f"Ranking run {run_id} was re-claimed by another worker; dropping it")
+            return
+        # Shutdown: leave the run as running so its lease expires and it resumes
+        logger.warning(f"Ranking run {run_id} interrupted; will resume from last checkpoint")
+        raise
+    except Exception as e:
+        logger.error(f"Ranking run {run_id} failed: {str(e)}")
+        try:
+            _update_run(client, run_id, {"status": "failed", "error": str(e)})
+        except LeaseLost:
+            logger.warning(f"Ranking run {run_id} was re-claimed by another worker; not marking it failed")
+    finally:
+        heartbeat.cancel()
+        _running_tasks.pop(run_id, None)
+
+
+def schedule_ranking_run(run: Dict, client=None) -> bool:
+    """Claim a run and start processing it in the background."""
+    if run["id"] in _running_tasks or not claim_ranking_run(run, client):
+        return False
+
+    _running_tasks[run["id"]] = asyncio.create_task(process_ranking_run(run, client))
+    return True
+
+
+def resume_ranking_runs(client=None) -> List[str]:
+    """
+    Pick up runs left behind by another worker: queued runs and
+    running runs whose lease has expired. Called on startup and then
+    periodically by run_ranking_run_sweep.
+    """
+    client = client or supabase
+    if not client:
+        return []
+
+    queued = client.table("ranking_runs").select("*").eq("status", "queued").execute().data or []
+    stale = client.table("ranking_runs").select("*").eq("status", "running").lt("heartbeat_at", _lease_cutoff()).execute().data or []
+
+    resumed = [run["id"] for run in queued + stale if schedule_ranking_run(run, client)]
+
+    if resumed:
+        logger.info(f"Resumed {len(resumed)} ranking runs", extra={"props": {"run_ids": resumed}})
+
+    return resumed
+
+
+async def run_ranking_run_sweep():
+    """Startup task: resume_ranking_runs every RANKING_RUN_SWEEP_SECONDS."""
+    while True:
+        await asyncio.sleep(settings.RANKING_RUN_SWEEP_SECONDS)
+        try:
+            resume_ranking_runs()
+        except Exception as e:
+            logger.error(f"Ranking run sweep failed: {str(e)}")
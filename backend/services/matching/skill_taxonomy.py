@@ -0,0 +1,268 @@
+"""
+Skill Taxonomy - Canonical skills, alias resolution and bitset matching.
+
+Every skill string (job requirement, extracted skill, LinkedIn skill,
+GitHub language or topic) resolves to a canonical skill, so "JS",
+"javascript" and "JavaScript" are the same skill. Canonical skills
+have fixed small integer ids; skills outside the taxonomy get ids from
+a SkillVocabulary built from the job side of a comparison, so the
+process-wide tables never grow with student data. A set of skills is an
+int bitset, and match / missing / coverage are a few integer operations.
+
+Ids must never be persisted - store canonical keys (see canonical_key)
+and rebuild bitsets on load. Bitsets are plain ints: `a & b` intersects,
+`(a & b).bit_count()` counts; only compare bitsets from one vocabulary.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Canonical name -> aliases (matched after normalization)
+CANONICAL_SKILLS = {
+    # Languages
+    "Python": ["py", "python3", "python 3"],
+    "JavaScript": ["js", "ecmascript", "es6", "vanilla js"],
+    "TypeScript": ["ts"],
+    "Java": ["java 8", "java 11", "java 17"],
+    "C++": ["cpp", "c plus plus"],
+    "C#": ["csharp", "c sharp"],
+    "C": [],
+    "Go": ["golang"],
+    "Rust": [],
+    "Kotlin": [],
+    "Swift": [],
+    "Ruby": [],
+    "PHP": [],
+    "R": [],
+    "Scala": [],
+    "Dart": [],
+    "Shell": ["bash", "shell scripting", "shell script"],
+    "SQL": ["structured query language"],
+    "HTML": ["html5"],
+    "CSS": ["css3"],
+    # Frontend
+    "React": ["reactjs", "react.js", "react js"],
+    "Next.js": ["nextjs", "next js"],
+    "Vue.js": ["vue", "vuejs", "vue js"],
+    "Angular": ["angularjs", "angular.js"],
+    "Redux": [],
+    "Tailwind CSS": ["tailwind", "tailwindcss"],
+    "React Native": ["react-native"],
+    "Flutter": [],
+    # Backend
+    "Node.js": ["node", "nodejs", "node js"],
+    "Express.js": ["express", "expressjs"],
+    "Django": [],
+    "Flask": [],
+    "FastAPI": ["fast api"],
+    "Spring Boot": ["spring", "springboot"],
+    "REST APIs": ["rest", "rest api", "restful", "restful apis", "restful api"],
+    "GraphQL": [],
+    "Microservices": ["microservice"],
+    # Data stores
+    "PostgreSQL": ["postgres", "psql"],
+    "MySQL": [],
+    "MongoDB": ["mongo"],
+    "Redis": [],
+    "SQLite": [],
+    "Firebase": [],
+    "Supabase": [],
+    "Elasticsearch": ["elastic search"],
+    "NoSQL": [],
+    # Cloud / DevOps
+    "AWS": ["amazon web services"],
+    "GCP": ["google cloud", "google cloud platform"],
+    "Azure": ["microsoft azure"],
+    "Docker": [],
+    "Kubernetes": ["k8s"],
+    "Terraform": [],
+    "CI/CD": ["ci cd", "cicd", "continuous integration"],
+    "Git": [],
+    "GitHub Actions": [],
+    "Linux": [],
+    "Kafka": ["apache kafka"],
+    # Data / ML
+    "Machine Learning": ["ml"],
+    "Deep Learning": ["dl"],
+    "Artificial Intelligence": ["ai"],
+    "Natural Language Processing": ["nlp"],
+    "Computer Vision": ["opencv"],
+    "Data Science": [],
+    "Data Analysis": ["data analytics"],
+    "TensorFlow": [],
+    "PyTorch": ["torch"],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "Pandas": [],
+    "NumPy": [],
+    "LLMs": ["llm", "large language models"],
+    # Fundamentals
+    "Data Structures": ["dsa", "data structures and algorithms"],
+    "Algorithms": [],
+    "System Design": [],
+    "Object-Oriented Programming": ["oop", "oops"],
+}
+
+
+# Memoized spellings (normalize results, spelling -> canonical id)
+MAX_MEMO_ENTRIES = 65536
+
+
+@lru_cache(maxsize=MAX_MEMO_ENTRIES)
+def normalize(skill: str) -> str:
+    """Case/spacing-insensitive form: lowercase, `-`/`_`/whitespace runs to one space."""
+    return re.sub(r"[\s_\-]+", " ", skill.strip().lower())
+
+
+class SkillTaxonomy:
+    """
+    Alias table plus fixed ids for the canonical skills. The table never
+    grows: skills outside the taxonomy get ids from a SkillVocabulary.
+    """
+
+    def __init__(self, canonical_skills: Dict[str, List[str]] = None):
+        self._aliases: Dict[str, str] = {}
+        self._spelling_ids: Dict[str, int] = {}
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+
+        for name, aliases in (canonical_skills or CANONICAL_SKILLS).items():
+            key = normalize(name)
+            for alias in [name] + aliases:
+                self._aliases[normalize(alias)] = key
+            self._ids[key] = len(self._names)
+            self._names.append(name)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def canonical_key(self, skill: str) -> str:
+        """Stable, persistable key of the canonical skill (unknown skills key to themselves)."""
+        key = normalize(skill)
+        return self._aliases.get(key, key)
+
+    def skill_id(self, skill: str) -> Optional[int]:
+        """Id of a canonical skill (any alias or spelling), None for other skills."""
+        skill_id = self._spelling_ids.get(skill)
+        if skill_id is None:
+            skill_id = self._ids.get(self.canonical_key(skill))
+            if skill_id is not None and len(self._spelling_ids) < MAX_MEMO_ENTRIES:
+                self._spelling_ids[skill] = skill_id
+        return skill_id
+
+    def name(self, key: str) -> Optional[str]:
+        """Canonical display name of a canonical key (None for other skills)."""
+        skill_id = self._ids.get(key)
+        return None if skill_id is None else self._names[skill_id]
+
+    def display_names(self, skills: Iterable[str]) -> List[str]:
+        """
+        One name per distinct canonical skill, sorted by key: the canonical
+        name where known, otherwise the first spelling in `skills`.
+        """
+        names: Dict[str, str] = {}
+        for skill in skills or []:
+            if skill and skill.strip():
+                key = self.canonical_key(skill)
+                names.setdefault(key, self.name(key) or skill.strip())
+        return [names[key] for key in sorted(names)]
+
+
+class SkillVocabulary:
+    """
+    Bit positions for one set of comparisons - a job's requirements, or
+    every job in the job index. Canonical skills use the taxonomy's fixed
+    ids; other skills added with add() / unique() get ids after those,
+    local to this vocabulary. Build the vocabulary from the job side,
+    then take student bitsets from the same vocabulary: a student skill
+    outside it cannot match anything and gets no bit.
+    """
+
+    def __init__(self, skills: Iterable[str] = None, skill_taxonomy: SkillTaxonomy = None):
+        self.taxonomy = skill_taxonomy or taxonomy
+        self._extra_ids: Dict[str, int] = {}
+        self.add(skills)
+
+    def __len__(self) -> int:
+        return len(self.taxonomy) + len(self._extra_ids)
+
+    def _id(self, skill: str, add: bool) -> Optional[int]:
+        skill_id = self.taxonomy.skill_id(skill)
+        if skill_id is None:
+            key = self.taxonomy.canonical_key(skill)
+            skill_id = self._extra_ids.get(key)
+            if skill_id is None and add:
+                skill_id = self._extra_ids[key] = len(self)
+        return skill_id
+
+    def add(self, skills: Iterable[str]):
+        for skill in skills or []:
+            if skill and skill.strip():
+                self._id(skill, add=True)
+
+    def bitset(self, skills: Iterable[str]) -> int:
+        """Skill set as an int with one bit per skill in this vocabulary (others are left out)."""
+        bits = 0
+        for skill in skills or []:
+            if skill and skill.strip():
+                skill_id = self._id(skill, add=False)
+                if skill_id is not None:
+                    bits |= 1 << skill_id
+        return bits
+
+    def unique(self, skills: Iterable[str]) -> List[Tuple[str, int]]:
+        """
+        (spelling, bit) per distinct canonical skill, keeping the first
+        spelling and input order; adds the skills to the vocabulary.
+        """
+        seen = 0
+        out = []
+        for skill in skills or []:
+            if not skill or not skill.strip():
+                continue
+            bit = 1 << self._id(skill, add=True)
+            if not seen & bit:
+                seen |= bit
+                out.append((skill, bit))
+        return out
+
+
+taxonomy = SkillTaxonomy()
+
+
+def canonical_key(skill: str) -> str:
+    return taxonomy.canonical_key(skill)
+
+
+def canonical_keys(skills: Iterable[str]) -> List[str]:
+    """Sorted, de-duplicated canonical keys."""
+    return sorted(set(canonical_key(skill) for skill in skills or [] if skill and skill.strip()))
+
+
+def display_names(skills: Iterable[str]) -> List[str]:
+    return taxonomy.display_names(skills)
+
+
+def match_skills(
+    required: Iterable[str],
+    student_skills: Iterable[str],
+    vocabulary: SkillVocabulary = None
+) -> Tuple[List[str], List[str]]:
+    """
+    Split required skills into (matched, missing) against a student's
+    skills; one entry per canonical skill, in the job's spelling. Pass the
+    job's vocabulary to reuse it across many students.
+    """
+    vocabulary = vocabulary or SkillVocabulary()
+    required_bits = vocabulary.unique(required)
+    student_bits = vocabulary.bitset(student_skills)
+    matched, missing = [], []
+    for skill, bit in required_bits:
+        (matched if bit & student_bits else missing).append(skill)
+    return matched, missing
+
+
+def coverage(required_bits: int, student_bits: int) -> float:
+    """Fraction of required skills the student has (0.0 when nothing is required)."""
+    total = required_bits.bit_count()
+    return (required_bits & student_bits).bit_count() / total if total else 0.0
@@ -0,0 +1,87 @@
+"""
+The shared AI client must keep the event loop free: while slow Gemini
+calls are in flight, other requests on the same worker are served
+promptly. Gemini is replaced by a model whose generate_content blocks,
+like the real SDK does.
+"""
+
+import asyncio
+import os
+import threading
+import time
+
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+
+import httpx
+
+from main import app
+from services.intelligence.ai_client import AIClient
+
+SLOW_CALL_SECONDS = 1.0
+AI_CALLS = 20
+
+
+class SlowModel:
+    def generate_content(self, prompt):
+        time.sleep(SLOW_CALL_SECONDS)
+        return type("Response", (), {"text": f" {prompt} "})()
+
+
+def test_health_checks_stay_fast_during_slow_ai_calls(monkeypatch):
+    client = AIClient(max_workers=AI_CALLS)
+    monkeypatch.setattr(client, "model", lambda *args, **kwargs: SlowModel())
+
+    async def scenario():
+        ai_calls = [asyncio.create_task(client.generate_text(f"prompt {i}")) for i in range(AI_CALLS)]
+        await asyncio.sleep(0.05)  # let every call reach the pool
+
+        latencies = []
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            for _ in range(10):
+                start = time.perf_counter()
+                response = await http.get("/health")
+                latencies.append(time.perf_counter() - start)
+                assert response.status_code == 200
+
+            in_flight = sum(not call.done() for call in ai_calls)
+
+        results = await asyncio.gather(*ai_calls)
+        return latencies, in_flight, results
+
+    start = time.perf_counter()
+    latencies, in_flight, results = asyncio.run(scenario())
+    elapsed = time.perf_counter() - start
+
+    assert in_flight == AI_CALLS
+    assert max(latencies) < 0.25
+    # All 20 calls overlapped on the pool instead of running back to back
+    assert elapsed < SLOW_CALL_SECONDS * 3
+    assert results == [f"prompt {i}" for i in range(AI_CALLS)]
+    client.shutdown()
+
+
+def test_pool_bounds_concurrent_ai_calls(monkeypatch):
+    client = AIClient(max_workers=4)
+    lock = threading.Lock()
+    active, peak = 0, 0
+
+    class CountingModel:
+        def generate_content(self, prompt):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return type("Response", (), {"text": prompt})()
+
+    monkeypatch.setattr(client, "model", lambda *args, **kwargs: CountingModel())
+
+    async def scenario():
+        return await asyncio.gather(*(client.generate_text(str(i)) for i in range(12)))
+
+    assert asyncio.run(scenario()) == [str(i) for i in range(12)]
+    assert peak <= 4
+    client.shutdown()
@@ -0,0 +1,97 @@
+"""
+Incremental JSON section parser.
+
+Feeds a JSON object arriving in arbitrary text chunks (e.g. a streamed
+LLM response) and yields each top-level member as soon as its value is
+complete. Members named in `split_keys` whose value is an array yield
+one event per element instead, so long lists surface item by item.
+
+Text before the root object (a ```json fence) and after it is ignored.
+"""
+
+import json
+from typing import Any, Iterable, List, Optional, Tuple
+
+# (member key, element index or None for a whole member, parsed value)
+SectionEvent = Tuple[str, Optional[int], Any]
+
+
+class JsonSectionStream:
+    def __init__(self, split_keys: Iterable[str] = ()):
+        self.split_keys = set(split_keys)
+        self.buf = ""
+        self.pos = 0
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.done = False
+
+        # Current top-level member
+        self.key: Optional[str] = None
+        self.key_start: Optional[int] = None
+        self.value_start: Optional[int] = None
+
+        # Current element of a split array member
+        self.splitting = False
+        self.member_split = False
+        self.item_start: Optional[int] = None
+        self.item_index = 0
+
+    def feed(self, text: str) -> List[SectionEvent]:
+        """Consume a chunk; returns the members / elements it completed."""
+        self.buf += text
+        buf = self.buf
+        events: List[SectionEvent] = []
+
+        while self.pos < len(buf) and not self.done:
+            ch = buf[self.pos]
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif ch == "\\":
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+                    if self.key_start is not None:
+                        self.key = json.loads(buf[self.key_start:self.pos + 1])
+                        self.key_start = None
+            elif ch == '"':
+                self.in_string = True
+                if self.depth == 1 and self.value_start is None:
+                    self.key_start = self.pos
+            elif ch == ":" and self.depth == 1 and self.value_start is None:
+                self.value_start = self.pos + 1
+            elif ch in "{[":
+                self.depth += 1
+                if (self.depth == 2 and ch == "[" and self.key in self.split_keys
+                        and not buf[self.value_start:self.pos].strip()):
+                    self.splitting = self.member_split = True
+                    self.item_start, self.item_index = self.pos + 1, 0
+            elif ch in "}]":
+                if self.splitting and self.depth == 2:
+                    self._end_item(events)
+                    self.splitting = False
+                self.depth -= 1
+                if self.depth == 0:
+                    self._end_member(events)
+                    self.done = True
+            elif ch == ",":
+                if self.splitting and self.depth == 2:
+                    self._end_item(events)
+                    self.item_start = self.pos + 1
+                elif self.depth == 1:
+                    self._end_member(events)
+            self.pos += 1
+
+        return events
+
+    def _end_item(self, events: List[SectionEvent]):
+        text = self.buf[self.item_start:self.pos].strip()
+        if text:
+            events.append((self.key, self.item_index, json.loads(text)))
+            self.item_index += 1
+
+    def _end_member(self, events: List[SectionEvent]):
+        if self.value_start is not None and not self.member_split:
+            events.append((self.key, None, json.loads(self.buf[self.value_start:self.pos])))
+        self.key, self.value_start, self.member_split = None, None, False
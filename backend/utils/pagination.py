@@ -0,0 +1,39 @@
+"""
+Cursor pagination helpers.
+
+A cursor is the sort key of the last row of a page, encoded as opaque
+URL-safe base64 JSON. The next page holds the rows that sort strictly
+after it, so pages stay stable while rows are added or removed.
+"""
+
+import base64
+import json
+from typing import List, Optional
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+
+def clamp_limit(limit: Optional[int]) -> int:
+    """Page size within [1, MAX_PAGE_SIZE]."""
+    return max(1, min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE))
+
+
+def encode_cursor(key: List) -> str:
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str], size: int) -> Optional[List]:
+    """
+    Decode a cursor produced by encode_cursor for a sort key of `size`
+    values. Returns None for no cursor; raises ValueError if malformed.
+    """
+    if not cursor:
+        return None
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(key, list) or len(key) != size:
+        raise ValueError("Invalid cursor")
+    return key
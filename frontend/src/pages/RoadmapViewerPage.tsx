@@ -6,10 +6,63 @@ import { Button } from '@/components/ui/button';
 import { Progress } from '@/components/ui/progress';
 import { Tabs, TabsContent, TabsList, TabsTrigger } from '@/components/ui/tabs';
 import { Loader2, BookOpen, Code, Trophy, Calendar, Target, Lightbulb, AlertTriangle } from 'lucide-react';
-import { generateRoadmap, SkillGapRoadmap } from '@/services/api';
+import { generateRoadmapStream, RoadmapStreamEvent, SkillGapRoadmap } from '@/services/api';
 import { useToast } from '@/hooks/use-toast';
 import { useAuth } from '@/contexts/AuthContext';
 
+/**
+ * Fold one stream event into the partial roadmap shown while generating.
+ * Mirrors how the backend derives skill_gaps and expected_outcome, so the
+ * page fills in section by section; the final event replaces it wholesale.
+ */
+function applyRoadmapEvent(prev: SkillGapRoadmap | null, event: RoadmapStreamEvent): SkillGapRoadmap | null {
+    if (event.event === 'final') {
+        const { event: _, ...result } = event;
+        return result;
+    }
+
+    if (event.event === 'start') {
+        return {
+            current_fit: event.current_fit,
+            target_fit: event.target_fit,
+            skill_gaps: [],
+            roadmap: { learning_phases: [], skill_deep_dives: [] } as any,
+            expected_outcome: {} as SkillGapRoadmap['expected_outcome'],
+        };
+    }
+
+    if (!prev) return prev;
+
+    const roadmap = { ...prev.roadmap };
+    if (event.index !== undefined) {
+        roadmap[event.section] = [...(roadmap[event.section] || []), event.data] as any;
+    } else {
+        roadmap[event.section] = event.data;
+    }
+
+    const skill_gaps = (roadmap.skill_deep_dives || []).map((dive: any) => ({
+        skill: dive.skill,
+        importance: dive.importance,
+        current_level: dive.current_level,
+        target_level: dive.target_level,
+        estimated_hours: (dive.learning_path || []).reduce(
+            (total: number, step: any) => total + (step.estimated_hours || 0), 0
+        ),
+    }));
+
+    const current = roadmap.current_fit_analysis?.current_match_percentage ?? prev.current_fit;
+    const target = roadmap.target_outcome?.target_match_percentage ?? prev.target_fit;
+    const expected_outcome = {
+        duration_weeks: roadmap.current_fit_analysis?.estimated_learning_time_weeks,
+        improvement_percentage: target - current,
+        expected_role_readiness: roadmap.target_outcome?.expected_role_readiness,
+        projects_count: roadmap.hands_on_projects?.length,
+        hours_per_week: roadmap.weekly_schedule?.hours_per_week,
+    };
+
+    return { current_fit: current, target_fit: target, skill_gaps, roadmap, expected_outcome };
+}
+
 export default function RoadmapViewerPage() {
     const { jobId } = useParams<{ jobId: string }>();
     const navigate = useNavigate();
@@ -24,14 +77,23 @@ export default function RoadmapViewerPage() {
         if (!jobId) return;
 
         setLoading(true);
+        setRoadmap(null);
         try {
-            const result = await generateRoadmap(studentId, jobId);
-            setRoadmap(result);
+            let partial: SkillGapRoadmap | null = null;
+            let durationWeeks = 0;
+            await generateRoadmapStream(studentId, jobId, (event) => {
+                partial = applyRoadmapEvent(partial, event);
+                setRoadmap(partial);
+                if (event.event === 'final') {
+                    durationWeeks = event.expected_outcome.duration_weeks;
+                }
+            });
             toast({
                 title: 'Roadmap Generated',
-                description: `Your ${result.expected_outcome.duration_weeks}-week learning plan is ready!`,
+                description: `Your ${durationWeeks}-week learning plan is ready!`,
             });
         } catch (error: any) {
+            setRoadmap(null);
             toast({
                 title: 'Generation Failed',
                 description: error.message,
@@ -82,7 +144,15 @@ export default function RoadmapViewerPage() {
                     {/* Progress Summary */}
                     <Card className="border-primary">
                         <CardHeader>
-                            <CardTitle>Your Journey</CardTitle>
+                            <CardTitle className="flex items-center gap-2">
+                                Your Journey
+                                {loading && (
+                                    <span className="flex items-center text-sm font-normal text-muted-foreground">
+                                        <Loader2 className="mr-2 h-4 w-4 animate-spin" />
+                                        Generating roadmap...
+                                    </span>
+                                )}
+                            </CardTitle>
                             <CardDescription>From {roadmap.current_fit}% to {roadmap.target_fit}% fit</CardDescription>
                         </CardHeader>
                         <CardContent>
@@ -104,26 +174,26 @@ export default function RoadmapViewerPage() {
 
                                 <div className="grid grid-cols-2 md:grid-cols-4 gap-4 pt-4 border-t">
                                     <div className="text-center">
-                                        <div className="text-2xl font-bold text-primary">{roadmap.expected_outcome.duration_weeks}</div>
+                                        <div className="text-2xl font-bold text-primary">{roadmap.expected_outcome.duration_weeks ?? '–'}</div>
                                         <div className="text-xs text-muted-foreground">Weeks</div>
                                     </div>
                                     <div className="text-center">
-                                        <div className="text-2xl font-bold text-primary">{roadmap.expected_outcome.improvement_percentage}</div>
+                                        <div className="text-2xl font-bold text-primary">{roadmap.expected_outcome.improvement_percentage ?? '–'}</div>
                                         <div className="text-xs text-muted-foreground">% Improvement</div>
                                     </div>
                                     <div className="text-center">
-                                        <div className="text-2xl font-bold text-primary">{roadmap.expected_outcome.projects_count}</div>
+                                        <div className="text-2xl font-bold text-primary">{roadmap.expected_outcome.projects_count ?? '–'}</div>
                                         <div className="text-xs text-muted-foreground">Projects</div>
                                     </div>
                                     <div className="text-center">
-                                        <div className="text-2xl font-bold text-primary">{roadmap.expected_outcome.hours_per_week}</div>
+                                        <div className="text-2xl font-bold text-primary">{roadmap.expected_outcome.hours_per_week ?? '–'}</div>
                                         <div className="text-xs text-muted-foreground">Hrs/Week</div>
                                     </div>
                                 </div>
 
                                 <div className="pt-4">
                                     <Badge variant="outline" className="text-sm">
-                                        Expected Outcome: {roadmap.expected_outcome.expected_role_readiness}
+                                        Expected Outcome: {roadmap.expected_outcome.expected_role_readiness ?? '–'}
                                     </Badge>
                                 </div>
                             </div>
@@ -14,6 +14,8 @@ import LoadingSpinner from '@/components/LoadingSpinner';
 import { useFeatureFlags } from '@/hooks/useFeatureFlags';
 import { intelligenceService } from '@/services/intelligenceService';
 import { useToast } from '@/hooks/use-toast';
+import { useAuth } from '@/contexts/AuthContext';
+import { rankCandidatesStream, RankedCandidate, RankingStreamEvent } from '@/services/recruiterApi';
 
 interface RankedApp {
   id: string;
@@ -32,90 +34,70 @@ const CandidateRankingPage: React.FC = () => {
   const navigate = useNavigate();
   const { toast } = useToast();
   const { flags } = useFeatureFlags();
+  const { user } = useAuth();
   
   const [isLoading, setIsLoading] = useState(true);
   const [rankedCandidates, setRankedCandidates] = useState<RankedApp[]>([]);
   const [minScoreFilter, setMinScoreFilter] = useState(0);
   const [job, setJob] = useState<any>(null);
-  const [isRanking, setIsRanking] = useState(false);
+  const [aiPending, setAiPending] = useState(0);
   const [rejectingId, setRejectingId] = useState<string | null>(null);
 
   useEffect(() => {
     const fetchData = async () => {
-      if (!jobId) return;
+      if (!jobId || !user) return;
 
       // Fetch job
       const { data: jobData } = await supabase.from('jobs').select('*').eq('id', jobId).maybeSingle();
       if (!jobData) { setIsLoading(false); return; }
       setJob(jobData);
 
-      // Fetch applications with student info
-      const { data: apps } = await supabase
-        .from('applications')
-        .select('*')
-        .eq('job_id', jobId)
-        .order('match_score', { ascending: false });
+      // Statuses are not part of the ranking payload, so read them alongside it
+      const { data: apps } = await supabase.from('applications').select('id, status').eq('job_id', jobId);
+      const statusMap = new Map((apps || []).map(a => [a.id, a.status]));
 
-      if (apps && apps.length > 0) {
-        const studentIds = [...new Set(apps.map(a => a.student_id))];
-        const { data: profiles } = await supabase.from('profiles').select('user_id, full_name').in('user_id', studentIds);
-        const profileMap = new Map((profiles || []).map(p => [p.user_id, p]));
+      const toRankedApp = (c: RankedCandidate): RankedApp => ({
+        id: c.application_id,
+        student_id: c.student_id,
+        student_name: c.student_name || 'Student',
+        match_score: Math.round(c.final_score || 0),
+        matched_skills: c.matched_skills || [],
+        missing_skills: c.missing_skills || [],
+        ai_summary: c.gemini_insights?.explanation || null,
+        status: statusMap.get(c.application_id) ?? null,
+        rank: c.rank,
+      });
 
-        // For apps without match scores, run AI matching
-        const needsScoring = apps.filter(a => a.match_score === null);
-        if (needsScoring.length > 0) {
-          setIsRanking(true);
-          for (const app of needsScoring) {
-            try {
-              const { data: sp } = await supabase.from('student_profiles').select('*').eq('user_id', app.student_id).maybeSingle();
-              if (sp) {
-                const { data: matchResult } = await supabase.functions.invoke('analyze-profile', {
-                  body: {
-                    profileData: { leetcode: sp.leetcode_data, github: sp.github_data, linkedin: sp.linkedin_data, skills: sp.extracted_skills },
-                    jobData: { title: jobData.title, required_skills: jobData.required_skills, preferred_skills: jobData.preferred_skills, role_type: jobData.role_type },
-                    analysisType: 'match',
-                  },
-                });
-                if (matchResult?.analysis) {
-                  const a = matchResult.analysis;
-                  await supabase.from('applications').update({
-                    match_score: a.overall_match_percentage || 0,
-                    matched_skills: a.matched_skills || [],
-                    missing_skills: a.missing_skills || [],
-                    ai_summary: a.explanation || null,
-                  }).eq('id', app.id);
-                  app.match_score = a.overall_match_percentage || 0;
-                  app.matched_skills = a.matched_skills || [];
-                  app.missing_skills = a.missing_skills || [];
-                  app.ai_summary = a.explanation || null;
-                }
-              }
-            } catch (err) {
-              console.warn('AI scoring failed for', app.id, err);
-            }
+      // The provisional order arrives first; AI-refined candidates replace their rows as they are scored
+      try {
+        await rankCandidatesStream(user.id, jobId, (event: RankingStreamEvent) => {
+          if (event.event === 'candidate') {
+            setAiPending(event.ai_pending);
+            setRankedCandidates(prev => prev
+              .map(c => (c.id === event.candidate.application_id ? { ...toRankedApp(event.candidate), status: c.status } : c))
+              .sort((a, b) => b.match_score - a.match_score)
+              .map((c, i) => ({ ...c, rank: i + 1 })));
+            return;
           }
-          setIsRanking(false);
-        }
-
-        // Sort by score descending and assign ranks
-        const sorted = apps.sort((a, b) => (b.match_score || 0) - (a.match_score || 0));
-        const ranked: RankedApp[] = sorted.map((app, i) => ({
-          id: app.id,
-          student_id: app.student_id,
-          student_name: profileMap.get(app.student_id)?.full_name || 'Student',
-          match_score: app.match_score || 0,
-          matched_skills: app.matched_skills || [],
-          missing_skills: app.missing_skills || [],
-          ai_summary: app.ai_summary,
-          status: app.status,
-          rank: i + 1,
-        }));
-        setRankedCandidates(ranked);
+          setAiPending(event.event === 'provisional' ? event.ai_pending : 0);
+          setRankedCandidates(prev => {
+            const current = new Map(prev.map(c => [c.id, c.status]));
+            return event.ranked_candidates.map(c => {
+              const app = toRankedApp(c);
+              return current.has(app.id) ? { ...app, status: current.get(app.id) ?? null } : app;
+            });
+          });
+          setIsLoading(false);
+        });
+      } catch (err: any) {
+        toast({ title: 'Ranking failed', description: err.message, variant: 'destructive' });
+      } finally {
+        setAiPending(0);
+        setIsLoading(false);
       }
-      setIsLoading(false);
     };
     fetchData();
-  }, [jobId]);
+  }, [jobId, user?.id]);
 
   if (!job && !isLoading) {
     return (
@@ -173,10 +155,16 @@ const CandidateRankingPage: React.FC = () => {
           </div>
         </div>
 
-        {isLoading || isRanking ? (
-          <LoadingSpinner text={isRanking ? "Running AI analysis on candidates..." : "Loading candidates..."} />
+        {isLoading ? (
+          <LoadingSpinner text="Loading candidates..." />
         ) : (
           <>
+            {aiPending > 0 && (
+              <div className="flex items-center gap-2 text-sm text-muted-foreground mb-4">
+                <Brain className="w-4 h-4 text-primary animate-pulse" />
+                Running AI analysis on {aiPending} remaining candidate{aiPending === 1 ? '' : 's'}...
+              </div>
+            )}
             {rankedCandidates.length > 0 && (
               <Card className="glass-card mb-8 border-2 border-primary/30">
                 <CardHeader><CardTitle className="flex items-center gap-2"><Award className="w-5 h-5 text-yellow-500" /> Top Candidate</CardTitle></CardHeader>
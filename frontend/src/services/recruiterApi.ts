@@ -43,6 +43,8 @@ export interface RankedCandidate {
     student_name: string;
     institution: string;
     final_score: number;
+    algorithmic_score?: number;
+    scoring_mode?: 'blended' | 'algorithmic_only';
     rank: number;
     platform_scores: {
         leetcode: number;
@@ -147,11 +149,21 @@ export async function getJobDetails(recruiterId: string, jobId: string): Promise
 }
 
 /**
- * Get applications for a job
+ * Get one page of applications for a job; pass the returned
+ * `next_cursor` back as `cursor` for the next page.
  */
-export async function getJobApplications(recruiterId: string, jobId: string): Promise<any> {
+export async function getJobApplications(
+    recruiterId: string,
+    jobId: string,
+    options: { sort?: 'created_at' | 'match_score' | 'rank'; limit?: number; cursor?: string } = {}
+): Promise<any> {
+    const params = new URLSearchParams({ recruiter_id: recruiterId });
+    if (options.sort) params.set('sort', options.sort);
+    if (options.limit) params.set('limit', String(options.limit));
+    if (options.cursor) params.set('cursor', options.cursor);
+
     const response = await fetch(
-        `${API_BASE}/recruiter/jobs/${jobId}/applications?recruiter_id=${recruiterId}`
+        `${API_BASE}/recruiter/jobs/${jobId}/applications?${params}`
     );
 
     if (!response.ok) {
@@ -189,6 +201,76 @@ export async function rankCandidates(
     return response.json();
 }
 
+export type RankingStreamEvent =
+    | {
+        event: 'provisional';
+        job_id: string;
+        job_title: string;
+        total_candidates: number;
+        ai_pending: number;
+        ranked_candidates: RankedCandidate[];
+    }
+    | {
+        event: 'candidate';
+        scored: number;
+        ai_pending: number;
+        candidate: RankedCandidate;
+    }
+    | {
+        event: 'final';
+        job_id: string;
+        job_title: string;
+        total_candidates: number;
+        ranked_candidates: RankedCandidate[];
+    };
+
+/**
+ * CORE: Rank candidates with AI, streaming results as they are scored.
+ * Calls onEvent for the provisional order, each refined candidate and the final order.
+ */
+export async function rankCandidatesStream(
+    recruiterId: string,
+    jobId: string,
+    onEvent: (event: RankingStreamEvent) => void
+): Promise<void> {
+    const response = await fetch(
+        `${API_BASE}/recruiter/jobs/${jobId}/rank/stream?recruiter_id=${recruiterId}`,
+        {
+            method: 'POST',
+        }
+    );
+
+    if (!response.ok || !response.body) {
+        const error = await response.json().catch(() => ({}));
+        throw new Error(error.detail || 'Failed to rank candidates');
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    const handleLine = (line: string) => {
+        if (!line.trim()) return;
+        const event = JSON.parse(line);
+        if (event.event === 'error') {
+            throw new Error(event.detail || 'Failed to rank candidates');
+        }
+        onEvent(event as RankingStreamEvent);
+    };
+
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+
+        buffer += decoder.decode(value, { stream: true });
+        const lines = buffer.split('\n');
+        buffer = lines.pop() ?? '';
+        lines.forEach(handleLine);
+    }
+
+    handleLine(buffer + decoder.decode());
+}
+
 /**
  * Get detailed candidate analysis
  */
@@ -110,7 +110,7 @@ export async function setupProfile(data: {
     github_url?: string;
     linkedin_url?: string;
     linkedin_manual_data?: any;
-}): Promise<{ status: string; message: string; estimated_time: string }> {
+}): Promise<{ status: string; job_id: string; message: string; estimated_time: string }> {
     const response = await fetch(`${API_BASE}/student/profile/setup`, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
@@ -125,6 +125,29 @@ export async function setupProfile(data: {
     return response.json();
 }
 
+export interface ProfileStatus {
+    status: 'queued' | 'in_progress' | 'completed' | 'failed';
+    progress: number;
+    current_step: string;
+    platforms: Record<string, { status: string; error?: string }>;
+    errors: Array<{ step: string; platform?: string; error: string }>;
+    completed_at?: string | null;
+}
+
+/**
+ * Get progress of the latest profile extraction
+ */
+export async function getProfileStatus(studentId: string): Promise<ProfileStatus> {
+    const response = await fetch(`${API_BASE}/student/profile/status?student_id=${studentId}`);
+
+    if (!response.ok) {
+        const error = await response.json();
+        throw new Error(error.detail || 'Failed to fetch profile status');
+    }
+
+    return response.json();
+}
+
 /**
  * Get student profile
  */
@@ -139,7 +162,7 @@ export async function getStudentProfile(studentId: string): Promise<StudentProfi
 }
 
 /**
- * Browse jobs with match percentages
+ * Browse jobs with match percentages (cursor-paginated, best match first)
  */
 export async function getStudentJobs(
     studentId: string,
@@ -147,13 +170,17 @@ export async function getStudentJobs(
         job_type?: string;
         location?: string;
         search?: string;
+        limit?: number;
+        cursor?: string;
     }
-): Promise<JobMatch[]> {
+): Promise<{ jobs: JobMatch[]; next_cursor: string | null }> {
     const params = new URLSearchParams({ student_id: studentId });
 
     if (filters?.job_type) params.append('job_type', filters.job_type);
     if (filters?.location) params.append('location', filters.location);
     if (filters?.search) params.append('search', filters.search);
+    if (filters?.limit) params.append('limit', String(filters.limit));
+    if (filters?.cursor) params.append('cursor', filters.cursor);
 
     const response = await fetch(`${API_BASE}/student/jobs?${params.toString()}`);
 
@@ -225,20 +252,92 @@ export async function generateRoadmap(
     return response.json();
 }
 
+export type RoadmapStreamEvent =
+    | {
+        event: 'start';
+        current_fit: number;
+        target_fit: number;
+        missing_skills: string[];
+        cached: boolean;
+    }
+    | {
+        event: 'section';
+        section: keyof SkillGapRoadmap['roadmap'];
+        index?: number;
+        data: any;
+    }
+    | ({ event: 'final' } & SkillGapRoadmap);
+
+/**
+ * Generate skill gap learning roadmap, streaming sections as they are generated.
+ * Calls onEvent for the local fit, each roadmap section (phases and skill
+ * deep dives one entry at a time) and the final roadmap.
+ */
+export async function generateRoadmapStream(
+    studentId: string,
+    jobId: string,
+    onEvent: (event: RoadmapStreamEvent) => void
+): Promise<void> {
+    const response = await fetch(`${API_BASE}/student/jobs/${jobId}/skill-gap/stream`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ student_id: studentId }),
+    });
+
+    if (!response.ok || !response.body) {
+        const error = await response.json().catch(() => ({}));
+        throw new Error(error.detail || 'Failed to generate roadmap');
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    const handleLine = (line: string) => {
+        if (!line.trim()) return;
+        const event = JSON.parse(line);
+        if (event.event === 'error') {
+            throw new Error(event.detail || 'Failed to generate roadmap');
+        }
+        onEvent(event as RoadmapStreamEvent);
+    };
+
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+
+        buffer += decoder.decode(value, { stream: true });
+        const lines = buffer.split('\n');
+        buffer = lines.pop() ?? '';
+        lines.forEach(handleLine);
+    }
+
+    handleLine(buffer + decoder.decode());
+}
+
 /**
- * Get student's applications
+ * Get student's applications (cursor-paginated, newest first)
  */
-export async function getStudentApplications(studentId: string): Promise<{
+export async function getStudentApplications(
+    studentId: string,
+    page?: { limit?: number; cursor?: string }
+): Promise<{
     applications: any[];
-    stats: {
+    stats?: {
         total: number;
         pending: number;
         under_review: number;
         shortlisted: number;
         rejected: number;
     };
+    next_cursor: string | null;
 }> {
-    const response = await fetch(`${API_BASE}/student/applications?student_id=${studentId}`);
+    const params = new URLSearchParams({ student_id: studentId });
+
+    if (page?.limit) params.append('limit', String(page.limit));
+    if (page?.cursor) params.append('cursor', page.cursor);
+
+    const response = await fetch(`${API_BASE}/student/applications?${params.toString()}`);
 
     if (!response.ok) {
         throw new Error('Failed to fetch applications');
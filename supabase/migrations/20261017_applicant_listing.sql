@@ -0,0 +1,21 @@
+-- Migration: Paginated recruiter applicant listing
+-- Date: 2026-10-17
+-- Additive only - keyset indexes for GET /recruiter/jobs/{job_id}/applications
+
+-- ════════════════════════════════════════════════════════════
+-- APPLICATIONS - Rank written back by candidate ranking
+-- ════════════════════════════════════════════════════════════
+ALTER TABLE applications
+ADD COLUMN IF NOT EXISTS rank INTEGER DEFAULT NULL;
+
+-- ════════════════════════════════════════════════════════════
+-- APPLICATIONS - One index per listing sort (NULLs last, ties by id)
+-- ════════════════════════════════════════════════════════════
+CREATE INDEX IF NOT EXISTS idx_applications_job_created_at
+ON applications (job_id, created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_applications_job_match_score
+ON applications (job_id, match_score DESC NULLS LAST, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_applications_job_rank
+ON applications (job_id, rank ASC NULLS LAST, id ASC);
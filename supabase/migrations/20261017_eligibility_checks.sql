@@ -0,0 +1,16 @@
+-- Migration: Cached eligibility checks
+-- Date: 2026-10-17
+-- Additive only - last eligibility result per student x job, reused while its fingerprint matches
+
+-- ════════════════════════════════════════════════════════════
+-- ELIGIBILITY CHECKS - One row per student x job
+-- ════════════════════════════════════════════════════════════
+CREATE TABLE IF NOT EXISTS eligibility_checks (
+    student_id UUID NOT NULL REFERENCES auth.users(id) ON DELETE CASCADE,
+    job_id UUID NOT NULL REFERENCES public.jobs(id) ON DELETE CASCADE,
+    fingerprint TEXT NOT NULL,        -- Hash of the profile + job fields the result was computed from
+    result JSONB NOT NULL,            -- EligibilityResponse payload
+    created_at TIMESTAMPTZ DEFAULT now(),
+    updated_at TIMESTAMPTZ DEFAULT now(),
+    PRIMARY KEY (student_id, job_id)
+);
@@ -0,0 +1,28 @@
+-- Migration: Materialized student job matches
+-- Date: 2026-10-17
+-- Additive only - match rows written on job creation / profile extraction, read by /student/jobs
+
+-- ════════════════════════════════════════════════════════════
+-- JOB MATCHES - One row per student x job sharing at least one skill
+-- ════════════════════════════════════════════════════════════
+CREATE TABLE IF NOT EXISTS job_matches (
+    student_id UUID NOT NULL REFERENCES auth.users(id) ON DELETE CASCADE,
+    job_id UUID NOT NULL REFERENCES public.jobs(id) ON DELETE CASCADE,
+    match_percentage INTEGER NOT NULL,
+    matched_skills TEXT[] DEFAULT '{}',
+    missing_skills TEXT[] DEFAULT '{}',
+    job_created_at TIMESTAMPTZ NOT NULL,  -- Copied from jobs for the listing sort
+    computed_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (student_id, job_id)
+);
+
+-- Listing order: best match, then newest job
+CREATE INDEX IF NOT EXISTS idx_job_matches_listing
+    ON job_matches(student_id, match_percentage DESC, job_created_at DESC, job_id DESC);
+CREATE INDEX IF NOT EXISTS idx_job_matches_job ON job_matches(job_id, computed_at);
+
+-- ════════════════════════════════════════════════════════════
+-- STUDENT PROFILES - When the student's matches were last materialized
+-- ════════════════════════════════════════════════════════════
+ALTER TABLE student_profiles
+ADD COLUMN IF NOT EXISTS job_matches_at TIMESTAMPTZ DEFAULT NULL;
@@ -0,0 +1,14 @@
+-- Migration: Bulk profile refresh
+-- Date: 2026-10-17
+-- Additive only - when each profile's platform data was last re-scraped, and what failed
+
+-- ════════════════════════════════════════════════════════════
+-- STUDENT PROFILES - Platform refresh bookkeeping
+-- ════════════════════════════════════════════════════════════
+ALTER TABLE student_profiles
+ADD COLUMN IF NOT EXISTS platforms_refreshed_at TIMESTAMPTZ DEFAULT NULL,  -- Last scrape attempt (setup or bulk refresh)
+ADD COLUMN IF NOT EXISTS platform_refresh_errors JSONB DEFAULT NULL;       -- [{platform, error}] from the last attempt
+
+-- Staleness order for the refresh worker
+CREATE INDEX IF NOT EXISTS idx_student_profiles_platforms_refreshed_at
+ON student_profiles (platforms_refreshed_at NULLS FIRST, user_id);
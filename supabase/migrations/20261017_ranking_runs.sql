@@ -0,0 +1,28 @@
+-- Migration: Background ranking runs
+-- Date: 2026-10-17
+-- Additive only - tracks background ranking executions for progress and resume
+
+-- ════════════════════════════════════════════════════════════
+-- RANKING RUNS - One row per background ranking of a job
+-- ════════════════════════════════════════════════════════════
+CREATE TABLE IF NOT EXISTS ranking_runs (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    job_id UUID NOT NULL REFERENCES public.jobs(id) ON DELETE CASCADE,
+    recruiter_id UUID REFERENCES auth.users(id),
+    status TEXT NOT NULL DEFAULT 'queued' CHECK (status IN ('queued', 'running', 'completed', 'failed')),
+    options JSONB DEFAULT '{}'::jsonb,
+    total INTEGER DEFAULT 0,          -- Gemini calls needed this run
+    scored INTEGER DEFAULT 0,         -- Gemini calls succeeded
+    failed INTEGER DEFAULT 0,         -- Gemini calls failed / timed out
+    candidates INTEGER,               -- Applicants ranked
+    result JSONB,
+    error TEXT,
+    worker_id TEXT,
+    heartbeat_at TIMESTAMPTZ,         -- Lease: stale runs are resumed by another worker
+    created_at TIMESTAMPTZ DEFAULT now(),
+    updated_at TIMESTAMPTZ DEFAULT now(),
+    completed_at TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS idx_ranking_runs_job ON ranking_runs(job_id);
+CREATE INDEX IF NOT EXISTS idx_ranking_runs_status ON ranking_runs(status, heartbeat_at);
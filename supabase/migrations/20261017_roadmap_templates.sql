@@ -0,0 +1,18 @@
+-- Migration: Shared roadmap templates
+-- Date: 2026-10-17
+-- Additive only - Gemini roadmap output cached per skill-gap signature, personalized per request
+
+-- ════════════════════════════════════════════════════════════
+-- ROADMAP TEMPLATES - One row per skill-gap signature
+-- ════════════════════════════════════════════════════════════
+CREATE TABLE IF NOT EXISTS roadmap_templates (
+    signature TEXT PRIMARY KEY,       -- Hash of the fields below plus the template version
+    missing_skills TEXT[] NOT NULL,   -- Canonical names, sorted by canonical key
+    role_type TEXT,
+    skill_level TEXT,
+    experience_band TEXT,             -- entry | junior | senior
+    template JSONB NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS idx_roadmap_templates_created ON roadmap_templates(created_at);
@@ -0,0 +1,9 @@
+-- Migration: Precomputed student platform features
+-- Date: 2026-10-17
+-- Additive only - feature record built on profile extraction, read by ranking and job matching
+
+-- ════════════════════════════════════════════════════════════
+-- STUDENT PROFILES - Versioned numeric features + normalized skill tokens
+-- ════════════════════════════════════════════════════════════
+ALTER TABLE student_profiles
+ADD COLUMN IF NOT EXISTS platform_features JSONB DEFAULT NULL;